@@ -0,0 +1,103 @@
+# benchmarks/bench_memory.py
+"""
+Memori per lagu di struktur data utama.
+
+    python -m benchmarks.bench_memory [--songs 100000]
+
+Diukur dengan tracemalloc, per tahap:
+- Song            : objek lagu + string judul/artis/id
+- katalog DLL     : SongController.songs (DoubleLinkedList + index id)
+- playlist DLL    : UserWindow.playlist (DLL kedua berisi lagu yang sama)
+- MLL             : index vibes (MultiLinkedList.rebuild)
+- named playlist  : satu Playlist berisi semua lagu
+
+Sebagai pembanding, objek Song juga diukur untuk versi lama
+(class biasa dengan __dict__, id uuid4, artis/genre/vibes string per lagu).
+"""
+import argparse
+import gc
+import tracemalloc
+import uuid
+
+from benchmarks.synthetic import generate_songs
+from structures.double_linked_list import DoubleLinkedList
+from structures.multi_linked_list import MultiLinkedList
+from structures.playlist import Playlist
+from structures.song import Song
+
+
+class LegacySong:
+    """Bentuk Song sebelum pakai __slots__ / kode vocabulary (hanya untuk pembanding)."""
+    def __init__(self, judul, artis, genre, vibes):
+        self.id = str(uuid.uuid4())
+        self.judul = judul
+        self.artis = artis
+        self.genre = genre
+        self.vibes = vibes
+        self.file_path = None
+        self.cover_path = None
+        self.duration = None
+
+
+def _copy_fields(song):
+    # salinan string baru per lagu, seperti baris yang dibaca dari store
+    return song.judul, "".join(song.artis), "".join(song.genre), "".join(song.vibes)
+
+
+def _measure(build):
+    """Return (hasil build, byte yang dialokasikan dan masih hidup)."""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    return result, tracemalloc.get_traced_memory()[0] - before
+
+
+def run(n):
+    tracemalloc.start()
+    rows = []
+
+    songs, size = _measure(lambda: generate_songs(n))
+    rows.append(("Song", size))
+
+    catalog = DoubleLinkedList(index_by_id=True)
+    _, size = _measure(lambda: [catalog.add_last(s) for s in songs] and None)
+    rows.append(("katalog DLL", size))
+
+    playlist = DoubleLinkedList(index_by_id=True)
+    _, size = _measure(lambda: [playlist.add_last(s) for s in songs] and None)
+    rows.append(("playlist DLL", size))
+
+    vibe_index = MultiLinkedList()
+    _, size = _measure(lambda: vibe_index.rebuild(songs))
+    rows.append(("MLL", size))
+
+    named = Playlist("Benchmark")
+    _, size = _measure(lambda: [named.add_song(s) for s in songs] and None)
+    rows.append(("named playlist", size))
+
+    # pembanding Song lama vs baru dari field yang sama (judul dipakai bersama)
+    current, current_size = _measure(lambda: [Song(*_copy_fields(s)) for s in songs])
+    legacy, legacy_size = _measure(lambda: [LegacySong(*_copy_fields(s)) for s in songs])
+    tracemalloc.stop()
+
+    total = sum(size for _, size in rows)
+    print(f"{n} lagu")
+    for name, size in rows:
+        print(f"  {name:<16}{size / n:>8.1f} B/lagu")
+    print(f"  {'total':<16}{total / n:>8.1f} B/lagu")
+    print("objek Song saja (tanpa judul)")
+    print(f"  {'sekarang':<16}{current_size / n:>8.1f} B/lagu")
+    print(f"  {'versi lama':<16}{legacy_size / n:>8.1f} B/lagu")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memori per lagu di struktur data GoSic")
+    parser.add_argument("--songs", type=int, default=100_000)
+    args = parser.parse_args()
+    run(args.songs)
+
+
+if __name__ == "__main__":
+    main()
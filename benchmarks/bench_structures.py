@@ -0,0 +1,573 @@
+# benchmarks/bench_structures.py
+"""
+Waktu operasi setiap struktur di structures/ pada ukuran katalog besar,
+dibandingkan dengan list / deque / dict bawaan Python.
+
+    python -m benchmarks.bench_structures [--sizes 1000,10000] [--repeat 3] [--out hasil.json]
+
+Setiap kasus punya setup (tidak diukur) dan run (diukur). run() return
+jumlah operasi yang dijalankan, hasilnya dilaporkan sebagai ns/operasi.
+Operasi O(n) per panggilan (delete_at, get_node, search, ...) hanya
+dijalankan beberapa kali supaya ukuran 1M tetap selesai dalam waktu wajar.
+Dari beberapa pengulangan diambil waktu terbaik.
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+from collections import defaultdict, deque
+
+from benchmarks.synthetic import generate_songs
+from structures.double_linked_list import DoubleLinkedList
+from structures.multi_linked_list import MultiLinkedList
+from structures.playlist import Playlist
+from structures.queue import Queue
+from structures.search_index import SearchIndex
+from structures.single_linked_list import SingleLinkedList
+from structures.stack import Stack
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+KEYWORD = "kara"
+
+CASES = []   # (op, struktur, setup, run)
+
+
+def case(op, structure):
+    def register(func):
+        CASES.append((op, structure, func))
+        return func
+    return register
+
+
+def _samples(n, budget=2_000_000, limit=1000):
+    """Jumlah panggilan untuk operasi O(n): makin besar n, makin sedikit."""
+    return max(3, min(limit, budget // max(n, 1)))
+
+
+def _dll(songs, index_by_id=True):
+    dll = DoubleLinkedList(index_by_id=index_by_id)
+    for s in songs:
+        dll.add_last(s)
+    return dll
+
+
+def _picks(songs, k, seed=1):
+    rng = random.Random(seed)
+    return [songs[rng.randrange(len(songs))] for _ in range(k)]
+
+
+def _indices(n, k, seed=2):
+    rng = random.Random(seed)
+    return [rng.randrange(n) for _ in range(k)]
+
+
+# ----------------------------
+# add_last
+# ----------------------------
+@case("add_last", "DoubleLinkedList")
+def _(songs):
+    dll = DoubleLinkedList(index_by_id=True)
+    def run():
+        for s in songs:
+            dll.add_last(s)
+        return len(songs)
+    return run
+
+
+@case("add_last", "SingleLinkedList")
+def _(songs):
+    sll = SingleLinkedList()
+    def run():
+        for s in songs:
+            sll.add_last(s)
+        return len(songs)
+    return run
+
+
+@case("add_last", "Stack.push")
+def _(songs):
+    stack = Stack()
+    def run():
+        for s in songs:
+            stack.push(s)
+        return len(songs)
+    return run
+
+
+@case("add_last", "Queue.enqueue")
+def _(songs):
+    queue = Queue()
+    def run():
+        for s in songs:
+            queue.enqueue(s)
+        return len(songs)
+    return run
+
+
+@case("add_last", "Playlist.add_song")
+def _(songs):
+    playlist = Playlist("bench")
+    def run():
+        for s in songs:
+            playlist.add_song(s)
+        return len(songs)
+    return run
+
+
+@case("add_last", "MultiLinkedList.add_song")
+def _(songs):
+    mll = MultiLinkedList()
+    def run():
+        for s in songs:
+            mll.add_song(s)
+        return len(songs)
+    return run
+
+
+@case("add_last", "list")
+def _(songs):
+    arr = []
+    def run():
+        for s in songs:
+            arr.append(s)
+        return len(songs)
+    return run
+
+
+@case("add_last", "deque")
+def _(songs):
+    dq = deque()
+    def run():
+        for s in songs:
+            dq.append(s)
+        return len(songs)
+    return run
+
+
+@case("add_last", "dict")
+def _(songs):
+    table = {}
+    def run():
+        for s in songs:
+            table[s.id] = s
+        return len(songs)
+    return run
+
+
+# ----------------------------
+# delete_at (posisi acak)
+# ----------------------------
+@case("delete_at", "DoubleLinkedList")
+def _(songs):
+    dll = _dll(songs)
+    indices = [i % (len(songs) - j) for j, i in enumerate(_indices(len(songs), _samples(len(songs))))]
+    def run():
+        for i in indices:
+            dll.delete_at(i)
+        return len(indices)
+    return run
+
+
+@case("delete_at", "list")
+def _(songs):
+    arr = list(songs)
+    indices = [i % (len(songs) - j) for j, i in enumerate(_indices(len(songs), _samples(len(songs))))]
+    def run():
+        for i in indices:
+            del arr[i]
+        return len(indices)
+    return run
+
+
+@case("delete_at", "deque")
+def _(songs):
+    dq = deque(songs)
+    indices = [i % (len(songs) - j) for j, i in enumerate(_indices(len(songs), _samples(len(songs))))]
+    def run():
+        for i in indices:
+            del dq[i]
+        return len(indices)
+    return run
+
+
+@case("delete_at", "Playlist.remove_song")
+def _(songs):
+    playlist = Playlist("bench")
+    playlist.add_songs(songs)
+    ids = list(dict.fromkeys(s.id for s in _picks(songs, _samples(len(songs), limit=10_000))))
+    def run():
+        for song_id in ids:
+            playlist.remove_song(song_id)
+        return len(ids)
+    return run
+
+
+@case("delete_at", "dict")
+def _(songs):
+    table = {s.id: s for s in songs}
+    ids = list(dict.fromkeys(s.id for s in _picks(songs, _samples(len(songs), limit=10_000))))
+    def run():
+        for song_id in ids:
+            del table[song_id]
+        return len(ids)
+    return run
+
+
+# ----------------------------
+# get_node (index acak)
+# ----------------------------
+@case("get_node", "DoubleLinkedList")
+def _(songs):
+    dll = _dll(songs)
+    indices = _indices(len(songs), _samples(len(songs)))
+    def run():
+        for i in indices:
+            dll.get_node(i)
+        return len(indices)
+    return run
+
+
+@case("get_node", "list")
+def _(songs):
+    arr = list(songs)
+    indices = _indices(len(songs), 10_000)
+    def run():
+        for i in indices:
+            arr[i]
+        return len(indices)
+    return run
+
+
+@case("get_node", "deque")
+def _(songs):
+    dq = deque(songs)
+    indices = _indices(len(songs), 10_000)
+    def run():
+        for i in indices:
+            dq[i]
+        return len(indices)
+    return run
+
+
+# ----------------------------
+# jump_to_song (lagu acak)
+# ----------------------------
+@case("jump_to_song", "DoubleLinkedList")
+def _(songs):
+    dll = _dll(songs)
+    targets = _picks(songs, 10_000)
+    def run():
+        for s in targets:
+            dll.jump_to_song(s)
+        return len(targets)
+    return run
+
+
+@case("jump_to_song", "DoubleLinkedList (tanpa index)")
+def _(songs):
+    dll = _dll(songs, index_by_id=False)
+    targets = _picks(songs, _samples(len(songs)))
+    def run():
+        for s in targets:
+            dll.jump_to_song(s)
+        return len(targets)
+    return run
+
+
+@case("jump_to_song", "list.index")
+def _(songs):
+    arr = list(songs)
+    targets = _picks(songs, _samples(len(songs), budget=500_000))
+    def run():
+        for s in targets:
+            arr.index(s)
+        return len(targets)
+    return run
+
+
+@case("jump_to_song", "dict")
+def _(songs):
+    table = {s.id: s for s in songs}
+    targets = _picks(songs, 10_000)
+    def run():
+        for s in targets:
+            table[s.id]
+        return len(targets)
+    return run
+
+
+# ----------------------------
+# search (keyword)
+# ----------------------------
+@case("search", "SingleLinkedList")
+def _(songs):
+    sll = SingleLinkedList()
+    for s in songs:
+        sll.add_last(s)
+    k = _samples(len(songs), budget=200_000, limit=20)
+    def run():
+        for _ in range(k):
+            sll.search(KEYWORD)
+        return k
+    return run
+
+
+@case("search", "SearchIndex")
+def _(songs):
+    index = SearchIndex()
+    index.add_many(songs)
+    k = _samples(len(songs), budget=200_000, limit=20)
+    def run():
+        for _ in range(k):
+            index.search(KEYWORD)
+        return k
+    return run
+
+
+@case("search", "list")
+def _(songs):
+    arr = list(songs)
+    k = _samples(len(songs), budget=200_000, limit=20)
+    def run():
+        for _ in range(k):
+            [s for s in arr if KEYWORD in s.judul.lower() or KEYWORD in s.artis.lower()
+             or KEYWORD in s.genre.lower() or KEYWORD in s.vibes.lower()]
+        return k
+    return run
+
+
+# ----------------------------
+# rebuild (index vibes / pencarian dari nol)
+# ----------------------------
+@case("rebuild", "MultiLinkedList")
+def _(songs):
+    mll = MultiLinkedList()
+    def run():
+        mll.rebuild(songs)
+        return 1
+    return run
+
+
+@case("rebuild", "SearchIndex")
+def _(songs):
+    index = SearchIndex()
+    def run():
+        index.clear()
+        index.add_many(songs)
+        return 1
+    return run
+
+
+@case("rebuild", "dict")
+def _(songs):
+    def run():
+        by_vibe = defaultdict(list)
+        for s in songs:
+            by_vibe[s.vibes.lower()].append(s)
+        return 1
+    return run
+
+
+# ----------------------------
+# dequeue (ambil dari depan)
+# ----------------------------
+@case("dequeue", "Queue")
+def _(songs):
+    queue = Queue()
+    queue.enqueue_many(songs)
+    def run():
+        for _ in range(len(songs)):
+            queue.dequeue()
+        return len(songs)
+    return run
+
+
+@case("dequeue", "Stack.pop")
+def _(songs):
+    stack = Stack()
+    for s in songs:
+        stack.push(s)
+    def run():
+        for _ in range(len(songs)):
+            stack.pop()
+        return len(songs)
+    return run
+
+
+@case("dequeue", "deque")
+def _(songs):
+    dq = deque(songs)
+    def run():
+        for _ in range(len(songs)):
+            dq.popleft()
+        return len(songs)
+    return run
+
+
+@case("dequeue", "list.pop(0)")
+def _(songs):
+    arr = list(songs)
+    k = _samples(len(songs), budget=50_000_000, limit=len(songs))
+    def run():
+        for _ in range(k):
+            arr.pop(0)
+        return k
+    return run
+
+
+# ----------------------------
+# display (seluruh isi ke list)
+# ----------------------------
+@case("display", "DoubleLinkedList")
+def _(songs):
+    dll = _dll(songs)
+    def run():
+        dll.to_list()
+        return 1
+    return run
+
+
+@case("display", "SingleLinkedList")
+def _(songs):
+    sll = SingleLinkedList()
+    for s in songs:
+        sll.add_last(s)
+    def run():
+        sll.to_list()
+        return 1
+    return run
+
+
+@case("display", "Stack")
+def _(songs):
+    stack = Stack()
+    for s in songs:
+        stack.push(s)
+    def run():
+        stack.display()
+        return 1
+    return run
+
+
+@case("display", "Queue")
+def _(songs):
+    queue = Queue()
+    queue.enqueue_many(songs)
+    def run():
+        queue.to_list()
+        return 1
+    return run
+
+
+@case("display", "MultiLinkedList")
+def _(songs):
+    mll = MultiLinkedList()
+    mll.rebuild(songs)
+    vibes = list(mll.cells)
+    def run():
+        for vibe in vibes:
+            mll.get_songs_by_vibe(vibe)
+        return 1
+    return run
+
+
+@case("display", "list")
+def _(songs):
+    arr = list(songs)
+    def run():
+        list(arr)
+        return 1
+    return run
+
+
+@case("display", "deque")
+def _(songs):
+    dq = deque(songs)
+    def run():
+        list(dq)
+        return 1
+    return run
+
+
+# ----------------------------
+# RUNNER
+# ----------------------------
+def _time_case(setup, songs, repeat):
+    best = None
+    ops = 0
+    for _ in range(repeat):
+        run = setup(songs)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            ops = run()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+        del run
+    return ops, best
+
+
+def run(sizes=DEFAULT_SIZES, repeat=3, ops=None, structures=None, out=None):
+    results = []
+    for n in sizes:
+        songs = generate_songs(n)
+        print(f"\n== {n} lagu ==")
+        print(f"{'operasi':<14}{'struktur':<32}{'ops':>8}{'ns/op':>14}")
+        for op, structure, setup in CASES:
+            if ops and op not in ops:
+                continue
+            if structures and not any(structure.startswith(name) for name in structures):
+                continue
+            count, seconds = _time_case(setup, songs, repeat)
+            ns_per_op = seconds * 1e9 / count
+            print(f"{op:<14}{structure:<32}{count:>8}{ns_per_op:>14.1f}")
+            results.append({
+                "size": n,
+                "op": op,
+                "structure": structure,
+                "ops": count,
+                "seconds": seconds,
+                "ns_per_op": ns_per_op,
+            })
+        del songs
+
+    if out:
+        report = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "results": results,
+        }
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nhasil ditulis ke {out}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark struktur data GoSic")
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES),
+                        help="ukuran katalog, dipisah koma")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--ops", help="hanya operasi ini (dipisah koma)")
+    parser.add_argument("--structures", help="hanya struktur ini (dipisah koma, mis. Queue,deque)")
+    parser.add_argument("--out", help="tulis hasil ke file JSON")
+    args = parser.parse_args()
+
+    run(
+        sizes=[int(n) for n in args.sizes.split(",")],
+        repeat=args.repeat,
+        ops=set(args.ops.split(",")) if args.ops else None,
+        structures=set(args.structures.split(",")) if args.structures else None,
+        out=args.out,
+    )
+
+
+if __name__ == "__main__":
+    main()
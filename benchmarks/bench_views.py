@@ -0,0 +1,205 @@
+# benchmarks/bench_views.py
+"""
+Waktu membangun dan membongkar setiap view GUI, tanpa layar
+(platform Qt "offscreen").
+
+    python -m benchmarks.bench_views [--sizes 100,1000,10000] [--views SongGridView,QueueView]
+        [--repeat 3] [--out hasil.json]
+
+Per view dan ukuran diukur:
+- build    : konstruktor view (atau load_songs untuk SongTableView)
+- show     : show() + proses event sampai layout dan paint pertama selesai
+- teardown : deleteLater() + proses DeferredDelete
+- widget   : jumlah QWidget di dalam view (makin banyak, makin perlu virtualisasi)
+- leak     : QWidget yang masih hidup setelah teardown
+- peak RSS : puncak memori proses (ru_maxrss) setelah kasus ini
+
+Parent window diganti FakeWindow yang hanya punya data yang dibaca view;
+callback (play, add_to_queue, ...) tidak melakukan apa-apa.
+"""
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication, QEvent
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from benchmarks.synthetic import generate_catalog
+from controllers.lagu_controller import SongController
+from controllers.paths import BASE_DIR
+from gui.views.favorites_view import FavoritesView
+from gui.views.history_view import HistoryView
+from gui.views.playlist_detail import PlaylistDetailView
+from gui.views.playlist_view import PlaylistView
+from gui.views.queue_view import QueueView
+from gui.views.song_card import SongGridView
+from gui.views_admin.song_table_view import SongTableView
+from structures.double_linked_list import DoubleLinkedList
+from structures.history import History
+from structures.queue import Queue
+
+DEFAULT_SIZES = (100, 1_000, 10_000)
+PLAYLIST_SONGS = 20      # isi tiap playlist di PlaylistView
+WINDOW_SIZE = (1200, 800)
+
+
+class FakeWindow:
+    """Pengganti UserWindow: data yang dibaca view, callback diabaikan."""
+
+    def __init__(self, songs, n):
+        self.controller = SongController(songs=songs)
+        self.controller.wait_until_ready()
+
+        self.favorites = {s.id for s in songs[:n]}
+
+        self.history = History(capacity=max(n, 1))
+        for s in songs[:n]:
+            self.history.push(s)
+
+        self.queue = Queue()
+        self.queue.enqueue_many(songs[:n])
+
+        self.playlists = {}
+        self.playlist_covers = {}
+        for i in range(n):
+            dll = DoubleLinkedList(index_by_id=True)
+            for s in songs[i:i + PLAYLIST_SONGS]:
+                dll.add_last(s)
+            self.playlists[f"Playlist {i + 1}"] = dll
+
+        self.detail = DoubleLinkedList(index_by_id=True)
+        for s in songs[:n]:
+            self.detail.add_last(s)
+
+    def get_favorite_songs(self):
+        find = self.controller.find_song_by_id
+        return [s for s in map(find, self.favorites) if s is not None]
+
+    def __getattr__(self, name):
+        # callback UI (_play_song, add_to_queue, toggle_favorite, ...)
+        return lambda *args, **kwargs: None
+
+
+def _song_table(window, n):
+    table = SongTableView()
+    table.load_songs(window.controller.get_all_songs()[:n])
+    return table
+
+
+VIEWS = {
+    "SongGridView": lambda w, n: SongGridView(w, w.controller.get_all_songs()[:n]),
+    "HistoryView": lambda w, n: HistoryView(w),
+    "FavoritesView": lambda w, n: FavoritesView(w),
+    "QueueView": lambda w, n: QueueView(w, w.queue),
+    "PlaylistView": lambda w, n: PlaylistView(w),
+    "PlaylistDetailView": lambda w, n: PlaylistDetailView(w, "Benchmark", w.detail),
+    "SongTableView.load_songs": _song_table,
+}
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: byte
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _process_events(app):
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+
+
+def _measure(app, build, window, n):
+    before = len(QApplication.allWidgets())
+
+    start = time.perf_counter()
+    view = build(window, n)
+    built = time.perf_counter()
+
+    view.resize(*WINDOW_SIZE)
+    view.show()
+    app.processEvents()
+    shown = time.perf_counter()
+
+    widgets = len(view.findChildren(QWidget)) + 1
+
+    view.hide()
+    view.deleteLater()
+    del view
+    _process_events(app)
+    gc.collect()
+    done = time.perf_counter()
+
+    return {
+        "build_ms": (built - start) * 1000,
+        "show_ms": (shown - built) * 1000,
+        "teardown_ms": (done - shown) * 1000,
+        "widgets": widgets,
+        "leaked_widgets": len(QApplication.allWidgets()) - before,
+    }
+
+
+def run(sizes=DEFAULT_SIZES, views=None, repeat=3, out=None):
+    app = QApplication.instance() or QApplication(sys.argv)
+    style = os.path.join(BASE_DIR, "style.qss")
+    if os.path.exists(style):
+        with open(style, "r") as f:
+            app.setStyleSheet(f.read())
+
+    names = [name for name in VIEWS if not views or name in views]
+    results = []
+    print(f"{'view':<26}{'n':>7}{'build ms':>11}{'show ms':>10}{'teardown':>10}"
+          f"{'widget':>9}{'leak':>6}{'peak MB':>9}")
+
+    for n in sizes:
+        window = FakeWindow(generate_catalog(max(n, PLAYLIST_SONGS), seed=n), n)
+        for name in names:
+            runs = [_measure(app, VIEWS[name], window, n) for _ in range(repeat)]
+            best = {key: min(r[key] for r in runs) for key in ("build_ms", "show_ms", "teardown_ms")}
+            row = {
+                "view": name,
+                "size": n,
+                **best,
+                "widgets": runs[-1]["widgets"],
+                "leaked_widgets": runs[-1]["leaked_widgets"],
+                "peak_rss_mb": _peak_rss_mb(),
+            }
+            results.append(row)
+            print(f"{name:<26}{n:>7}{row['build_ms']:>11.1f}{row['show_ms']:>10.1f}"
+                  f"{row['teardown_ms']:>10.1f}{row['widgets']:>9}{row['leaked_widgets']:>6}"
+                  f"{row['peak_rss_mb']:>9.1f}")
+        del window
+        gc.collect()
+
+    if out:
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump({"platform": app.platformName(), "repeat": repeat, "results": results}, f, indent=2)
+        print(f"hasil ditulis ke {out}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pembuatan view GUI GoSic (offscreen)")
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES),
+                        help="jumlah item, dipisah koma")
+    parser.add_argument("--views", help="hanya view ini (dipisah koma)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", help="tulis hasil ke file JSON")
+    args = parser.parse_args()
+
+    run(
+        sizes=[int(n) for n in args.sizes.split(",")],
+        views=set(args.views.split(",")) if args.views else None,
+        repeat=args.repeat,
+        out=args.out,
+    )
+
+
+if __name__ == "__main__":
+    main()
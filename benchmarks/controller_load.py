@@ -0,0 +1,222 @@
+# benchmarks/controller_load.py
+"""
+Beban campuran ke SongController tanpa GUI.
+
+    python -m benchmarks.controller_load [--songs 100000] [--duration 10]
+        [--rate search=40,suggest=40,add=2,update=2,delete=1,vibe=20,favorites=10]
+        [--out hasil.json]
+
+Setiap jenis operasi datang dengan laju sendiri (operasi per detik,
+jarak antar kedatangan acak / Poisson), dijalankan berurutan di satu
+thread seperti event loop UI:
+
+- search / suggest : satu ketikan di kotak pencarian (prefix bertambah
+                     satu huruf sampai kata selesai, lalu kata baru)
+- add / update / delete : CRUD admin, listener ikut dipanggil
+- vibe      : next / prev lagu dengan vibe sama (bergantian)
+- favorites : ambil semua lagu favorit berdasarkan id (seperti FavoritesView)
+
+Latency yang dilaporkan adalah waktu eksekusi operasi (p50/p95/p99/max).
+Kalau harness tertinggal dari jadwal, keterlambatan terbesar ikut dicetak
+karena di aplikasi asli itu berarti UI tersendat.
+"""
+import argparse
+import heapq
+import json
+import math
+import random
+import time
+
+from benchmarks.synthetic import generate_catalog
+from controllers.lagu_controller import SongController
+from structures.song import Song
+
+DEFAULT_RATES = {
+    "search": 40,
+    "suggest": 40,
+    "add": 2,
+    "update": 2,
+    "delete": 1,
+    "vibe": 20,
+    "favorites": 10,
+}
+FAVORITES = 200
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile dari list yang sudah urut."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def parse_rates(text):
+    rates = dict(DEFAULT_RATES)
+    if text:
+        for part in text.split(","):
+            name, _, value = part.partition("=")
+            if name not in DEFAULT_RATES:
+                raise SystemExit(f"operasi tidak dikenal: {name}")
+            rates[name] = float(value)
+    return {name: rate for name, rate in rates.items() if rate > 0}
+
+
+class Workload:
+    """State simulasi: katalog, kotak pencarian, lagu yang diputar, favorit."""
+
+    def __init__(self, controller, seed=0):
+        self.controller = controller
+        self.rng = random.Random(seed)
+        self.songs = controller.get_all_songs()
+        self.spare = generate_catalog(1000, seed=seed + 1)
+        self.events = 0
+        controller.subscribe(self._on_changes)
+
+        self.favorites = {s.id for s in self.rng.sample(self.songs, min(FAVORITES, len(self.songs)))}
+        self.current = self.rng.choice(self.songs)
+        self._word = ""
+        self._typed = 0
+        self._forward = True
+
+    def _on_changes(self, changes):
+        self.events += 1
+
+    def _random_song(self):
+        # katalog berubah karena add/delete, jadi index acak bisa sudah terhapus
+        while True:
+            song = self.rng.choice(self.songs)
+            if self.controller.find_song_by_id(song.id) is not None:
+                return song
+
+    def _next_keystroke(self):
+        if self._typed >= len(self._word):
+            song = self._random_song()
+            self._word = self.rng.choice((song.judul, song.artis)).split()[0]
+            self._typed = 0
+        self._typed += 1
+        return self._word[:self._typed]
+
+    # OPERASI
+    def search(self):
+        self.controller.search(self._next_keystroke())
+
+    def suggest(self):
+        self.controller.suggest(self._word[:max(self._typed, 1)] or "a")
+
+    def add(self):
+        template = self.spare[self.rng.randrange(len(self.spare))]
+        song_id = f"load-{self.rng.getrandbits(64):x}"
+        song = Song(template.judul, template.artis, template.genre, template.vibes,
+                    template.file_path, template.cover_path, song_id)
+        self.controller.add_song(song)
+        self.songs.append(song)
+
+    def update(self):
+        song = self._random_song()
+        template = self.spare[self.rng.randrange(len(self.spare))]
+        self.controller.update_song(song.id, song.judul, song.artis, song.genre, template.vibes)
+
+    def delete(self):
+        song = self._random_song()
+        self.controller.delete_song_by_id(song.id)
+        self.favorites.discard(song.id)
+        if song is self.current:
+            self.current = self._random_song()
+
+    def vibe(self):
+        if self.controller.find_song_by_id(self.current.id) is None:
+            self.current = self._random_song()
+        step = self.controller.get_next_same_vibe if self._forward else self.controller.get_prev_same_vibe
+        self._forward = not self._forward
+        self.current = step(self.current) or self.current
+
+    def favorites_lookup(self):
+        find = self.controller.find_song_by_id
+        [song for song in map(find, self.favorites) if song is not None]
+
+
+def _schedule(rates, duration, rng):
+    """Heap (waktu, nama) dengan kedatangan Poisson per operasi."""
+    heap = []
+    for name, rate in rates.items():
+        heapq.heappush(heap, (rng.expovariate(rate), name))
+    while heap:
+        at, name = heapq.heappop(heap)
+        if at > duration:
+            continue
+        yield at, name
+        heapq.heappush(heap, (at + rng.expovariate(rates[name]), name))
+
+
+def run(n=100_000, duration=10.0, rates=None, seed=0, out=None):
+    rates = rates or dict(DEFAULT_RATES)
+
+    start = time.perf_counter()
+    controller = SongController(songs=generate_catalog(n, seed=seed))
+    controller.wait_until_ready()
+    print(f"{n} lagu, index siap dalam {time.perf_counter() - start:.2f} s")
+
+    workload = Workload(controller, seed=seed)
+    handlers = {
+        "search": workload.search,
+        "suggest": workload.suggest,
+        "add": workload.add,
+        "update": workload.update,
+        "delete": workload.delete,
+        "vibe": workload.vibe,
+        "favorites": workload.favorites_lookup,
+    }
+    latencies = {name: [] for name in rates}
+    max_lag = 0.0
+
+    t0 = time.perf_counter()
+    for at, name in _schedule(rates, duration, random.Random(seed)):
+        now = time.perf_counter() - t0
+        if now < at:
+            time.sleep(at - now)
+        else:
+            max_lag = max(max_lag, now - at)
+        began = time.perf_counter()
+        handlers[name]()
+        latencies[name].append(time.perf_counter() - began)
+    elapsed = time.perf_counter() - t0
+
+    report = {"songs": n, "duration": elapsed, "rates": rates, "max_lag_ms": max_lag * 1000,
+              "events": workload.events, "operations": {}}
+    print(f"{'operasi':<12}{'n':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, values in latencies.items():
+        values.sort()
+        stats = {
+            "count": len(values),
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "p99_ms": percentile(values, 99) * 1000,
+            "max_ms": (values[-1] if values else 0.0) * 1000,
+        }
+        report["operations"][name] = stats
+        print(f"{name:<12}{stats['count']:>7}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}"
+              f"{stats['p99_ms']:>10.3f}{stats['max_ms']:>10.3f}")
+    print(f"durasi {elapsed:.1f} s, event listener {workload.events}, "
+          f"keterlambatan terbesar {max_lag * 1000:.1f} ms")
+
+    if out:
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"hasil ditulis ke {out}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Beban campuran ke SongController")
+    parser.add_argument("--songs", type=int, default=100_000)
+    parser.add_argument("--duration", type=float, default=10.0, help="detik")
+    parser.add_argument("--rate", help="operasi=per_detik, dipisah koma (0 = matikan)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="tulis hasil ke file JSON")
+    args = parser.parse_args()
+    run(args.songs, args.duration, parse_rates(args.rate), args.seed, args.out)
+
+
+if __name__ == "__main__":
+    main()
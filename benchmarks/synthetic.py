@@ -0,0 +1,88 @@
+# benchmarks/synthetic.py
+import itertools
+import os
+import random
+
+from structures.multi_linked_list import VIBE_COORDINATES
+from structures.song import Song
+
+GENRES = [
+    "Pop", "Rock", "Jazz", "R&B", "Hip Hop", "Indie", "Dangdut", "K-Pop",
+    "EDM", "Folk", "Acoustic", "Ballad", "Metal", "Reggae", "Blues", "Soul",
+]
+VIBES = sorted(VIBE_COORDINATES)
+
+_SYLLABLES = [
+    "ka", "ra", "mi", "lo", "na", "se", "ta", "ri", "ma", "da",
+    "lu", "ne", "sa", "yo", "ki", "ba", "no", "le", "pa", "hi",
+]
+
+
+def _word(rng, min_syl=2, max_syl=4):
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(min_syl, max_syl)))
+
+
+def _title(rng):
+    return " ".join(_word(rng).capitalize() for _ in range(rng.randint(1, 4)))
+
+
+def generate_songs(n, seed=0, artists=None):
+    """
+    Katalog sintetis berisi n lagu (deterministik untuk seed yang sama).
+    Judul acak, artis dari pool (default n/20 artis), genre dan vibes
+    dari daftar di atas. File audio / cover tidak ada (None).
+    """
+    rng = random.Random(seed)
+    artists = artists or max(1, n // 20)
+    artist_pool = [f"{_word(rng).capitalize()} {_word(rng).capitalize()}" for _ in range(artists)]
+
+    return [
+        Song(_title(rng), rng.choice(artist_pool), rng.choice(GENRES), rng.choice(VIBES))
+        for _ in range(n)
+    ]
+
+
+def _zipf_weights(count, s):
+    """Bobot kumulatif Zipf: item ke-k muncul sebanding 1/k^s."""
+    return list(itertools.accumulate(1 / (k ** s) for k in range(1, count + 1)))
+
+
+def generate_catalog(n, seed=0, artists=None, skew=1.1, asset_root="assets"):
+    """
+    Katalog sintetis yang lebih mirip katalog asli:
+    - artis, genre, dan vibes mengikuti distribusi Zipf (sedikit artis /
+      genre sangat populer, sisanya ekor panjang)
+    - path file audio dan cover palsu mengikuti format nama file GoSic
+      ("Judul - Artis - Genre - Vibes.mp3"), file-nya tidak dibuat
+    - durasi acak 2-6 menit
+    """
+    rng = random.Random(seed)
+    artists = artists or max(1, n // 20)
+    artist_pool = [f"{_word(rng).capitalize()} {_word(rng).capitalize()}" for _ in range(artists)]
+    genres = list(GENRES)
+    vibes = list(VIBES)
+    rng.shuffle(genres)
+    rng.shuffle(vibes)
+
+    artist_weights = _zipf_weights(len(artist_pool), skew)
+    genre_weights = _zipf_weights(len(genres), skew)
+    vibe_weights = _zipf_weights(len(vibes), skew)
+
+    music_dir = os.path.join(asset_root, "music")
+    cover_dir = os.path.join(asset_root, "cover")
+
+    songs = []
+    for _ in range(n):
+        judul = _title(rng)
+        artis = rng.choices(artist_pool, cum_weights=artist_weights)[0]
+        genre = rng.choices(genres, cum_weights=genre_weights)[0]
+        vibe = rng.choices(vibes, cum_weights=vibe_weights)[0]
+        filename = f"{judul} - {artis} - {genre} - {vibe}"
+        song = Song(
+            judul, artis, genre, vibe,
+            os.path.join(music_dir, f"{filename}.mp3"),
+            os.path.join(cover_dir, f"{filename}.jpg"),
+        )
+        song.duration = rng.uniform(120, 360)
+        songs.append(song)
+    return songs
@@ -0,0 +1,464 @@
+# controllers/audio_metadata.py
+import hashlib
+import os
+import sqlite3
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# ----------------------------
+# TABEL HEADER FRAME MPEG
+# ----------------------------
+# bitrate (kbps) per [versi MPEG-1?][layer][index]
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# sample rate per bit versi (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+# frame teks ID3 yang dipakai (v2.3/v2.4 dan v2.2)
+_TEXT_FRAMES = {
+    "TIT2": "title", "TPE1": "artist", "TALB": "album", "TCON": "genre",
+    "TT2": "title", "TP1": "artist", "TAL": "album", "TCO": "genre",
+}
+_TEXT_ENCODINGS = ("latin-1", "utf-16", "utf-16-be", "utf-8")
+
+ART_DIR_NAME = "art"
+SCAN_BYTES = 64 * 1024     # batas byte yang dicari untuk frame sync pertama
+
+
+class AudioInfo:
+    """Hasil parse satu file audio."""
+    def __init__(self, duration=None, bitrate=None, sample_rate=None,
+                 title=None, artist=None, album=None, genre=None, art_path=None):
+        self.duration = duration        # detik
+        self.bitrate = bitrate          # kbps (rata-rata untuk VBR)
+        self.sample_rate = sample_rate
+        self.title = title
+        self.artist = artist
+        self.album = album
+        self.genre = genre
+        self.art_path = art_path        # cover yang tertanam di tag (APIC)
+
+
+def format_duration(seconds):
+    """3:07, atau 1:02:05 kalau lebih dari sejam."""
+    if seconds is None:
+        return "--:--"
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+# ----------------------------
+# ID3v2
+# ----------------------------
+def _syncsafe(data):
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _resync(data):
+    """Balik unsynchronisation ID3: setiap FF 00 kembali jadi FF."""
+    return data.replace(b"\xff\x00", b"\xff")
+
+
+def _decode_text(data):
+    if not data:
+        return None
+    encoding = _TEXT_ENCODINGS[data[0]] if data[0] < 4 else "latin-1"
+    text = data[1:].decode(encoding, errors="replace")
+    # beberapa nilai dipisah \0, ambil yang pertama
+    text = text.split("\x00")[0].strip()
+    return text or None
+
+
+def _split_terminated(data, start, encoding):
+    """Lewati string ber-terminator (\0 atau \0\0 untuk UTF-16), return posisi setelahnya."""
+    if encoding in (1, 2):
+        i = start
+        while i + 1 < len(data):
+            if data[i] == 0 and data[i + 1] == 0:
+                return i + 2
+            i += 2
+        return len(data)
+    end = data.find(b"\x00", start)
+    return len(data) if end < 0 else end + 1
+
+
+def _parse_picture(frame_id, data):
+    """Return (mime, bytes gambar) dari frame APIC / PIC."""
+    if len(data) < 4:
+        return None
+    encoding = data[0]
+    if frame_id == "PIC":
+        fmt = data[1:4].decode("latin-1", errors="replace").lower()
+        mime = "image/png" if fmt == "png" else "image/jpeg"
+        pos = 5
+    else:
+        end = data.find(b"\x00", 1)
+        if end < 0:
+            return None
+        mime = data[1:end].decode("latin-1", errors="replace").lower() or "image/jpeg"
+        pos = end + 2          # lewati \0 + tipe gambar
+    pos = _split_terminated(data, pos, encoding)
+    image = data[pos:]
+    return (mime, image) if image else None
+
+
+def _parse_id3v2(f):
+    """Return (tags dict, gambar atau None, posisi awal audio)."""
+    header = f.read(10)
+    if len(header) < 10 or header[:3] != b"ID3":
+        return {}, None, 0
+
+    major = header[3]
+    flags = header[5]
+    size = _syncsafe(header[6:10])
+    audio_start = 10 + size + (10 if flags & 0x10 else 0)
+
+    tag = f.read(size)
+    # v2.2/v2.3: unsynchronisation berlaku untuk seluruh tag (termasuk header
+    # frame), jadi dibalik dulu. v2.4: per frame (lihat flag frame di bawah).
+    unsync = bool(flags & 0x80)
+    if unsync and major < 4:
+        tag = _resync(tag)
+    tags = {}
+    picture = None
+    pos = 0
+
+    # extended header
+    if flags & 0x40 and len(tag) >= 4:
+        ext = _syncsafe(tag[:4]) if major == 4 else struct.unpack(">I", tag[:4])[0] + 4
+        pos = ext
+
+    id_len, head_len = (3, 6) if major == 2 else (4, 10)
+    while pos + head_len <= len(tag):
+        frame_id = tag[pos:pos + id_len]
+        if not frame_id.strip(b"\x00"):
+            break   # padding
+        if major == 2:
+            frame_size = int.from_bytes(tag[pos + 3:pos + 6], "big")
+        elif major == 4:
+            frame_size = _syncsafe(tag[pos + 4:pos + 8])
+        else:
+            frame_size = struct.unpack(">I", tag[pos + 4:pos + 8])[0]
+
+        frame_flags = tag[pos + 9] if major > 2 else 0
+        body = tag[pos + head_len:pos + head_len + frame_size]
+        pos += head_len + frame_size
+        if frame_size <= 0:
+            break
+
+        if major == 4:
+            if frame_flags & 0x0C:
+                continue    # terkompresi / terenkripsi, tidak dibaca
+            if frame_flags & 0x02 or unsync:
+                body = _resync(body[4:] if frame_flags & 0x01 else body)
+            elif frame_flags & 0x01:
+                body = body[4:]     # data length indicator
+        elif major == 3 and frame_flags & 0xC0:
+            continue        # terkompresi / terenkripsi, tidak dibaca
+
+        name = frame_id.decode("latin-1", errors="replace")
+        if name in _TEXT_FRAMES:
+            tags.setdefault(_TEXT_FRAMES[name], _decode_text(body))
+        elif name in ("APIC", "PIC") and picture is None:
+            picture = _parse_picture(name, body)
+
+    return tags, picture, audio_start
+
+
+# ----------------------------
+# FRAME MPEG
+# ----------------------------
+def _parse_frame_header(data, i):
+    """Return dict info header frame MPEG di data[i:], atau None kalau bukan frame."""
+    if i + 4 > len(data) or data[i] != 0xFF or (data[i + 1] & 0xE0) != 0xE0:
+        return None
+    version_bits = (data[i + 1] >> 3) & 0x03
+    layer_bits = (data[i + 1] >> 1) & 0x03
+    bitrate_index = data[i + 2] >> 4
+    rate_index = (data[i + 2] >> 2) & 0x03
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version_bits == 3
+    layer = 4 - layer_bits
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index]
+    sample_rate = _SAMPLE_RATES[version_bits][rate_index]
+    padding = (data[i + 2] >> 1) & 0x01
+    mono = (data[i + 3] >> 6) == 3
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate * 1000 // sample_rate + padding) * 4
+    else:
+        samples = 1152 if (layer == 2 or mpeg1) else 576
+        length = samples // 8 * bitrate * 1000 // sample_rate + padding
+
+    return {
+        "mpeg1": mpeg1, "layer": layer, "bitrate": bitrate,
+        "sample_rate": sample_rate, "samples": samples, "mono": mono,
+        "length": length,
+    }
+
+
+def _find_first_frame(data):
+    """Frame sync pertama yang diikuti frame valid lagi (hindari false sync)."""
+    i = data.find(b"\xff")
+    while 0 <= i < len(data) - 4:
+        frame = _parse_frame_header(data, i)
+        if frame:
+            nxt = i + frame["length"]
+            if nxt + 4 > len(data) or _parse_frame_header(data, nxt):
+                return i, frame
+        i = data.find(b"\xff", i + 1)
+    return None, None
+
+
+def _vbr_frames(data, i, frame):
+    """Jumlah frame dari header Xing/Info atau VBRI (None kalau CBR tanpa header)."""
+    if frame["mpeg1"]:
+        side = 17 if frame["mono"] else 32
+    else:
+        side = 9 if frame["mono"] else 17
+
+    x = i + 4 + side
+    if data[x:x + 4] in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", data[x + 4:x + 8])[0]
+        if flags & 0x01:
+            return struct.unpack(">I", data[x + 8:x + 12])[0]
+        return None
+
+    v = i + 4 + 32
+    if data[v:v + 4] == b"VBRI":
+        return struct.unpack(">I", data[v + 14:v + 18])[0]
+    return None
+
+
+def parse_mp3(path, art_dir=None):
+    """
+    Baca tag ID3 dan header frame MPEG langsung dari file.
+    Durasi dari header Xing/Info/VBRI kalau ada (VBR), kalau tidak dihitung
+    dari ukuran data audio / bitrate (CBR). Cover tertanam disimpan ke art_dir.
+    """
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        tags, picture, audio_start = _parse_id3v2(f)
+        f.seek(audio_start)
+        data = f.read(SCAN_BYTES)
+
+        # tag ID3v1 di 128 byte terakhir
+        audio_end = file_size
+        if file_size >= 128:
+            f.seek(file_size - 128)
+            if f.read(3) == b"TAG":
+                audio_end -= 128
+
+    info = AudioInfo(
+        title=tags.get("title"), artist=tags.get("artist"),
+        album=tags.get("album"), genre=tags.get("genre"),
+    )
+
+    offset, frame = _find_first_frame(data)
+    if frame:
+        info.sample_rate = frame["sample_rate"]
+        frames = _vbr_frames(data, offset, frame)
+        audio_bytes = audio_end - (audio_start + offset)
+        if frames:
+            info.duration = frames * frame["samples"] / frame["sample_rate"]
+            if info.duration > 0:
+                info.bitrate = int(round(audio_bytes * 8 / info.duration / 1000))
+        elif frame["bitrate"]:
+            info.bitrate = frame["bitrate"]
+            info.duration = audio_bytes * 8 / (frame["bitrate"] * 1000)
+
+    if picture and art_dir:
+        mime, image = picture
+        ext = ".png" if "png" in mime else ".jpg"
+        digest = hashlib.sha1(image).hexdigest()
+        art_path = os.path.join(art_dir, digest + ext)
+        if not os.path.exists(art_path):
+            os.makedirs(art_dir, exist_ok=True)
+            with open(art_path, "wb") as out:
+                out.write(image)
+        info.art_path = art_path
+
+    return info
+
+
+# ----------------------------
+# CACHE
+# ----------------------------
+SCAN_CHUNK = 32       # lagu per task parse di MetadataCache.scan
+SQL_MAX_VARS = 900    # batas aman parameter "?" per query SQLite
+_COLUMNS = ("duration", "bitrate", "sample_rate", "title", "artist", "album", "genre", "art_path")
+
+
+class MetadataCache:
+    """
+    Cache hasil parse di SQLite, key: (path, ukuran, mtime).
+    File yang tidak berubah tidak dibaca ulang, jadi scan berikutnya
+    cukup stat() per file.
+    """
+
+    def __init__(self, path, max_workers=4):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.art_dir = os.path.join(folder, ART_DIR_NAME)
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS media (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                duration REAL,
+                bitrate INTEGER,
+                sample_rate INTEGER,
+                title TEXT,
+                artist TEXT,
+                album TEXT,
+                genre TEXT,
+                art_path TEXT
+            )
+        """)
+        self.conn.commit()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="metadata")
+
+    def _stat(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def get(self, path):
+        """Info dari cache, None kalau belum ada / file sudah berubah."""
+        stat = self._stat(path)
+        if stat is None:
+            return None
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT size, mtime_ns, {', '.join(_COLUMNS)} FROM media WHERE path = ?",
+                (path,),
+            ).fetchone()
+        if row is None or (row[0], row[1]) != stat:
+            return None
+        return AudioInfo(*row[2:])
+
+    def lookup(self, path):
+        """Info dari cache; kalau belum ada, parse file lalu simpan."""
+        info = self.get(path)
+        if info is not None:
+            return info
+
+        if self._stat(path) is None:
+            return None
+        try:
+            info = parse_mp3(path, self.art_dir)
+        except (OSError, ValueError, struct.error, IndexError):
+            info = AudioInfo()
+
+        self.put_many([(path, info)])
+        return info
+
+    def put_many(self, items):
+        """Simpan banyak (path, AudioInfo) sekaligus dalam satu transaksi."""
+        rows = []
+        for path, info in items:
+            stat = self._stat(path)
+            if stat is not None:
+                rows.append((path, *stat, *(getattr(info, c) for c in _COLUMNS)))
+
+        with self._lock, self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO media (path, size, mtime_ns, {', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(_COLUMNS) + 3))})",
+                rows,
+            )
+
+    def _cached_rows(self, paths):
+        """path -> row (size, mtime_ns, kolom...) untuk banyak path, satu query."""
+        select = f"SELECT path, size, mtime_ns, {', '.join(_COLUMNS)} FROM media"
+        with self._lock:
+            if len(paths) <= SQL_MAX_VARS:
+                cur = self.conn.execute(
+                    f"{select} WHERE path IN ({', '.join('?' * len(paths))})", paths
+                )
+            else:
+                # terlalu banyak untuk IN (...): baca tabel sekali, saring di dict
+                cur = self.conn.execute(select)
+            wanted = set(paths)
+            return {row[0]: row[1:] for row in cur if row[0] in wanted}
+
+    def scan(self, songs, callback=None):
+        """
+        Isi song.duration untuk banyak lagu di background thread pool.
+        callback(song, info) dipanggil dari worker thread setelah tiap lagu.
+
+        Cache dicek sekali untuk semua lagu (satu query); lagu yang belum
+        ada di cache di-parse per potongan SCAN_CHUNK lagu, dan hasil tiap
+        potongan disimpan dengan satu put_many. Return Future tahap cek
+        cache (hasilnya list Future parse), None kalau tidak ada file.
+        """
+        songs = [song for song in songs if song.file_path]
+        if not songs:
+            return None
+
+        def finish(song, info):
+            if info is not None:
+                song.duration = info.duration
+            if callback:
+                callback(song, info)
+
+        def parse_chunk(chunk):
+            parsed = []
+            for song in chunk:
+                try:
+                    info = parse_mp3(song.file_path, self.art_dir)
+                except (OSError, ValueError, struct.error, IndexError):
+                    info = AudioInfo()
+                parsed.append((song, info))
+            self.put_many([(song.file_path, info) for song, info in parsed])
+            for song, info in parsed:
+                finish(song, info)
+
+        def check_cache():
+            rows = self._cached_rows(list({song.file_path for song in songs}))
+            misses = []
+            for song in songs:
+                stat = self._stat(song.file_path)
+                row = rows.get(song.file_path)
+                if stat is None:
+                    finish(song, None)
+                elif row is not None and (row[0], row[1]) == stat:
+                    finish(song, AudioInfo(*row[2:]))
+                else:
+                    misses.append(song)
+            return [
+                self._executor.submit(parse_chunk, misses[i:i + SCAN_CHUNK])
+                for i in range(0, len(misses), SCAN_CHUNK)
+            ]
+
+        return self._executor.submit(check_cache)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,170 @@
+# controllers/bulk_import.py
+import multiprocessing
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from controllers.audio_metadata import AudioInfo, parse_mp3
+from controllers.paths import BASE_DIR
+from structures.song import Song
+
+AUDIO_EXTENSIONS = (".mp3", ".wav")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+DEFAULT_COVER_DIR = os.path.join(BASE_DIR, "assets", "cover")
+
+# di bawah jumlah ini file di-parse langsung (start process pool lebih mahal)
+POOL_THRESHOLD = 64
+CHUNK_SIZE = 128
+UNKNOWN = "Unknown"
+
+
+class ImportResult:
+    def __init__(self, songs, skipped):
+        self.songs = songs        # lagu yang ditambahkan
+        self.skipped = skipped    # file yang sudah ada di katalog
+
+
+# ----------------------------
+# WALK FOLDER
+# ----------------------------
+def scan_folder(root):
+    """
+    Jelajah folder (rekursif, os.scandir) dan return:
+    - list path file audio (urut nama)
+    - dict nama file tanpa ekstensi (lowercase) -> path gambar
+    """
+    audio = []
+    images = {}
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+                continue
+            stem, ext = os.path.splitext(entry.name)
+            ext = ext.lower()
+            if ext in AUDIO_EXTENSIONS:
+                audio.append(entry.path)
+            elif ext in IMAGE_EXTENSIONS:
+                images.setdefault(stem.lower(), entry.path)
+    audio.sort()
+    return audio, images
+
+
+# ----------------------------
+# PARSE NAMA FILE + TAG
+# ----------------------------
+def parse_filename(stem):
+    """
+    "Judul - Artis - Genre - Vibes" -> (judul, artis, genre, vibes).
+    Tiga bagian terakhir selalu artis, genre, vibes; sisanya judul.
+    '_' dipakai sebagai pengganti tanda petik (God_s -> God's).
+    Return None kalau nama file tidak mengikuti format.
+    """
+    parts = [p.strip() for p in stem.split(" - ")]
+    if len(parts) < 4 or not all(parts):
+        return None
+    judul = " ".join(parts[:-3]).replace("_", "'")
+    artis, genre, vibes = parts[-3:]
+    return judul, artis, genre, vibes
+
+
+def _parse_file(path, art_dir=None):
+    """Dijalankan di worker process: baca nama file + tag, return tuple biasa."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    fields = parse_filename(stem)
+
+    info = AudioInfo()
+    if path.lower().endswith(".mp3"):
+        try:
+            info = parse_mp3(path, art_dir)
+        except (OSError, ValueError, struct.error, IndexError):
+            pass
+
+    if fields is None:
+        # nama file tidak sesuai format, pakai tag kalau ada
+        fields = (info.title or stem, info.artist or UNKNOWN, info.genre or UNKNOWN, UNKNOWN)
+    return path, stem, fields, info
+
+
+def _parse_all(paths, art_dir=None, max_workers=None):
+    work = partial(_parse_file, art_dir=art_dir)
+    if len(paths) < POOL_THRESHOLD:
+        return [work(p) for p in paths]
+    # spawn, bukan fork: proses GUI punya thread Qt / SQLite yang tidak aman
+    # di-fork. Worker hanya mengimpor modul ini (tanpa Qt).
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        return list(pool.map(work, paths, chunksize=CHUNK_SIZE))
+
+
+# ----------------------------
+# IMPORT
+# ----------------------------
+def existing_paths(controller):
+    """Path file lagu yang sudah ada di katalog (dibaca di GUI thread)."""
+    return {
+        os.path.normcase(os.path.abspath(s.file_path))
+        for s in controller.get_all_songs() if s.file_path
+    }
+
+
+def prepare_import(root, existing, metadata=None, cover_dirs=(DEFAULT_COVER_DIR,), max_workers=None):
+    """
+    Bagian berat import: scan folder, parse nama file + tag, simpan hasil
+    parse ke cache metadata. Tidak menyentuh controller, jadi aman dijalankan
+    di worker thread; lagunya dimasukkan lewat commit_import().
+    `existing`: hasil existing_paths(), file yang path-nya ada di sini dilewati.
+    """
+    paths, images = scan_folder(root)
+
+    new_paths = [p for p in paths if os.path.normcase(os.path.abspath(p)) not in existing]
+    skipped = len(paths) - len(new_paths)
+
+    # cover folder default cukup di-scan sekali, bukan exists() per file
+    cover_images = dict(images)
+    for folder in cover_dirs:
+        if os.path.isdir(folder):
+            for stem, path in scan_folder(folder)[1].items():
+                cover_images.setdefault(stem, path)
+
+    art_dir = metadata.art_dir if metadata is not None else None
+
+    songs = []
+    infos = []
+    for path, stem, (judul, artis, genre, vibes), info in _parse_all(new_paths, art_dir, max_workers):
+        cover = cover_images.get(stem.lower()) or info.art_path
+        song = Song(judul, artis, genre, vibes, path, cover)
+        song.duration = info.duration
+        songs.append(song)
+        infos.append((path, info))
+
+    # hasil parse langsung masuk cache metadata, tidak perlu dibaca ulang saat start
+    if metadata is not None:
+        metadata.put_many(infos)
+    return ImportResult(songs, skipped)
+
+
+def commit_import(controller, result):
+    """Masukkan hasil prepare_import() ke katalog sekaligus (di GUI thread)."""
+    controller.add_songs(result.songs)
+    return result
+
+
+def import_folder(controller, root, cover_dirs=(DEFAULT_COVER_DIR,), max_workers=None):
+    """
+    Import semua file audio di `root` ke katalog. File yang path-nya sudah
+    ada di katalog dilewati. Cover dicari dari gambar bernama sama di folder
+    yang di-import, lalu di cover_dirs (default assets/cover), lalu cover
+    yang tertanam di tag MP3.
+    Semua lagu masuk ke controller sekaligus lewat add_songs().
+    """
+    result = prepare_import(root, existing_paths(controller), controller.metadata,
+                            cover_dirs, max_workers)
+    return commit_import(controller, result)
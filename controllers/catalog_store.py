@@ -0,0 +1,102 @@
+# controllers/catalog_store.py
+import os
+import sqlite3
+
+from controllers.paths import BASE_DIR
+from structures.song import Song
+
+BASE_PREFIX = os.path.join(BASE_DIR, "")
+
+
+class CatalogStore:
+    """
+    Penyimpanan katalog lagu di SQLite (mode WAL).
+    - seq (INTEGER PRIMARY KEY) menyimpan urutan katalog
+    - path di dalam folder project disimpan relatif supaya project bisa dipindah
+    """
+
+    def __init__(self, path):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS songs (
+                seq INTEGER PRIMARY KEY,
+                id TEXT NOT NULL UNIQUE,
+                judul TEXT NOT NULL,
+                artis TEXT NOT NULL,
+                genre TEXT NOT NULL,
+                vibes TEXT NOT NULL,
+                file_path TEXT,
+                cover_path TEXT
+            )
+        """)
+        self.conn.commit()
+
+    # PATH HELPER
+    def _to_db_path(self, path):
+        if not path:
+            return path
+        rel = os.path.relpath(os.path.abspath(path), BASE_DIR)
+        return path if rel.startswith("..") else rel.replace(os.sep, "/")
+
+    def _from_db_path(self, path):
+        if not path or os.path.isabs(path):
+            return path
+        return BASE_PREFIX + path.replace("/", os.sep)
+
+    def _row(self, song):
+        return (
+            song.judul, song.artis, song.genre, song.vibes,
+            self._to_db_path(song.file_path), self._to_db_path(song.cover_path),
+            song.id,
+        )
+
+    # READ
+    def is_empty(self):
+        return self.conn.execute("SELECT 1 FROM songs LIMIT 1").fetchone() is None
+
+    def load_all(self):
+        """Return semua lagu sesuai urutan katalog."""
+        rows = self.conn.execute(
+            "SELECT id, judul, artis, genre, vibes, file_path, cover_path "
+            "FROM songs ORDER BY seq"
+        )
+        from_db = self._from_db_path
+        return [
+            Song(judul, artis, genre, vibes, from_db(file_path), from_db(cover_path), song_id=song_id)
+            for song_id, judul, artis, genre, vibes, file_path, cover_path in rows
+        ]
+
+    # WRITE-THROUGH
+    def add(self, song):
+        self.add_many([song])
+
+    def add_many(self, songs):
+        """Simpan banyak lagu dalam satu transaksi."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO songs (judul, artis, genre, vibes, file_path, cover_path, id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self._row(song) for song in songs),
+            )
+
+    def update(self, song):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE songs SET judul = ?, artis = ?, genre = ?, vibes = ?, "
+                "file_path = ?, cover_path = ? WHERE id = ?",
+                self._row(song),
+            )
+
+    def delete(self, song_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM songs WHERE id = ?", (song_id,))
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,381 @@
+# controllers/history_store.py
+import os
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+LOG_NAME = "history.log"
+SNAPSHOT_NAME = "history.snap"
+
+FSYNC_EVERY = 16          # fsync setelah sekian entri baru
+COMPACT_AFTER = 2000      # log dipadatkan ke snapshot setelah sekian entri
+
+# header snapshot: magic, jumlah entri, panjang daftar id (byte), generasi
+SNAPSHOT_MAGIC = b"GSH2"
+SNAPSHOT_HEADER = struct.Struct("<4sIII")
+# format lama (tanpa generasi) tetap bisa dibaca sebagai generasi 0
+OLD_SNAPSHOT_MAGIC = b"GSH1"
+OLD_SNAPSHOT_HEADER = struct.Struct("<4sII")
+
+
+def _read_log_file(path):
+    entries = []
+    if not os.path.exists(path):
+        return entries
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            ts, sep, song_id = line.rstrip("\n").partition("\t")
+            if not sep or not song_id:
+                continue   # baris terakhir yang terpotong (crash)
+            try:
+                entries.append((float(ts), song_id))
+            except ValueError:
+                continue
+    return entries
+
+
+def _truncate_torn_tail(path):
+    """
+    Buang baris terakhir yang tidak lengkap (crash saat menulis), supaya
+    append berikutnya tidak tersambung ke sisa baris itu.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            cut = f.read(step).rfind(b"\n")
+            if cut >= 0:
+                pos += cut + 1
+                break
+        if pos != end:
+            f.truncate(pos)
+
+
+class _DiskColumn:
+    """
+    Kolom float64 di file yang dibaca per elemen (seek + 8 byte), supaya
+    bisect di snapshot cukup O(log n) pembacaan, bukan memuat seluruh kolom.
+    """
+
+    def __init__(self, f, offset, count):
+        self.f = f
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        self.f.seek(self.offset + i * 8)
+        return struct.unpack("=d", self.f.read(8))[0]   # urutan byte sama dengan array("d")
+
+
+class HistoryStore:
+    """
+    Riwayat putar per user di disk.
+
+    - history.log: append-only, satu baris "timestamp<TAB>song_id".
+      fsync dilakukan per batch (FSYNC_EVERY entri) atau saat flush().
+    - history.snap: snapshot kolom hasil compaction:
+        header | daftar id unik (utf-8, dipisah \\n)
+               | timestamp float64[n] | kode id uint32[n]
+      Kolom timestamp terurut, jadi rentang waktu dicari dengan bisect
+      langsung di file (seek per langkah) dan N entri terakhir dibaca dari
+      ujung file. Entri log / segmen di memori punya kolom timestamp
+      paralel (array "d") untuk bisect yang sama.
+
+    Compaction: history.log di-rename (atomic) jadi segmen history.log.<gen>
+    dan log baru dibuka, lalu thread background menggabungkan snapshot lama
+    + segmen ke snapshot generasi <gen> dan baru setelah itu segmen dihapus.
+    Kalau crash di tengah jalan, saat load segmen dengan gen <= generasi
+    snapshot sudah terlipat (dihapus, tidak dihitung dua kali), sisanya
+    dibaca ulang dan dipadatkan lagi.
+    """
+
+    def __init__(self, folder):
+        os.makedirs(folder, exist_ok=True)
+        self.folder = folder
+        self.log_path = os.path.join(folder, LOG_NAME)
+        self.snapshot_path = os.path.join(folder, SNAPSHOT_NAME)
+
+        # _lock menjaga snapshot + _pending selalu dibaca sebagai satu pasangan
+        self._lock = threading.Lock()
+        self._compactor = None
+
+        generation = self._snapshot_generation()
+        self._next_generation = generation + 1
+        self._pending = []         # entri segmen yang sedang / belum dipadatkan
+        self._segments = []        # path segmen untuk _pending
+        for gen, path in self._find_segments():
+            if gen <= generation:
+                os.remove(path)    # sudah masuk snapshot sebelum crash
+                continue
+            self._pending.extend(_read_log_file(path))
+            self._segments.append(path)
+            self._next_generation = max(self._next_generation, gen + 1)
+        self._pending_stamps = array("d", (ts for ts, _ in self._pending))
+
+        _truncate_torn_tail(self.log_path)
+        self._log = _read_log_file(self.log_path)
+        self._log_stamps = array("d", (ts for ts, _ in self._log))
+
+        # timestamp terakhir (log, segmen, atau snapshot) untuk menjaga urutan
+        if self._log_stamps or self._pending_stamps:
+            self._last_ts = (self._log_stamps or self._pending_stamps)[-1]
+        else:
+            count = self._snapshot_count()
+            stamps, _ = self._read_snapshot(count - 1, count)
+            self._last_ts = stamps[-1] if stamps else None
+        self._file = open(self.log_path, "a", encoding="utf-8")
+        self._unsynced = 0
+
+        if self._segments:
+            self._start_compaction()
+
+    def _find_segments(self):
+        prefix = LOG_NAME + "."
+        segments = []
+        for name in os.listdir(self.folder):
+            if name.startswith(prefix) and name[len(prefix):].isdigit():
+                segments.append((int(name[len(prefix):]), os.path.join(self.folder, name)))
+        return sorted(segments)
+
+    # ----------------------------
+    # LOG
+    # ----------------------------
+    def append(self, song_id, ts=None):
+        if ts is None:
+            ts = time.time()
+        # jaga kolom timestamp tetap terurut, juga setelah log dipadatkan
+        if self._last_ts is not None and ts < self._last_ts:
+            ts = self._last_ts
+        self._last_ts = ts
+
+        self._file.write(f"{ts!r}\t{song_id}\n")
+        self._log.append((ts, song_id))
+        self._log_stamps.append(ts)
+        self._unsynced += 1
+
+        if self._unsynced >= FSYNC_EVERY:
+            self.flush()
+        if len(self._log) >= COMPACT_AFTER and not self._compacting():
+            self.compact(wait=False)
+
+    def flush(self):
+        if self._file.closed:
+            return
+        self._file.flush()
+        if self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    # ----------------------------
+    # SNAPSHOT
+    # ----------------------------
+    def _read_snapshot_header(self, f):
+        """Return (count, vocab, offset timestamp, generasi) atau None."""
+        raw = f.read(SNAPSHOT_HEADER.size)
+        if raw[:4] == SNAPSHOT_MAGIC and len(raw) == SNAPSHOT_HEADER.size:
+            _, count, vocab_len, generation = SNAPSHOT_HEADER.unpack(raw)
+            offset = SNAPSHOT_HEADER.size
+        elif raw[:4] == OLD_SNAPSHOT_MAGIC and len(raw) >= OLD_SNAPSHOT_HEADER.size:
+            _, count, vocab_len = OLD_SNAPSHOT_HEADER.unpack(raw[:OLD_SNAPSHOT_HEADER.size])
+            offset, generation = OLD_SNAPSHOT_HEADER.size, 0
+            f.seek(offset)
+        else:
+            return None
+        vocab = f.read(vocab_len).decode("utf-8").split("\n") if vocab_len else []
+        return count, vocab, offset + vocab_len, generation
+
+    def _read_rows(self, f, header, start, stop):
+        """(timestamps, song_ids) entri [start:stop] dari file snapshot yang terbuka."""
+        count, vocab, ts_offset, _ = header
+        stop = count if stop is None else min(stop, count)
+        start = max(0, min(start, stop))
+        n = stop - start
+
+        stamps = array("d")
+        f.seek(ts_offset + start * stamps.itemsize)
+        stamps.frombytes(f.read(n * stamps.itemsize))
+
+        codes = array("I")
+        f.seek(ts_offset + count * stamps.itemsize + start * codes.itemsize)
+        codes.frombytes(f.read(n * codes.itemsize))
+
+        return stamps, [vocab[c] for c in codes]
+
+    def _read_snapshot(self, start=0, stop=None):
+        """Return (timestamps, song_ids) entri snapshot [start:stop]."""
+        if not os.path.exists(self.snapshot_path):
+            return array("d"), []
+
+        with open(self.snapshot_path, "rb") as f:
+            header = self._read_snapshot_header(f)
+            if header is None:
+                return array("d"), []
+            return self._read_rows(f, header, start, stop)
+
+    def _snapshot_between(self, start, end):
+        """Entri snapshot dalam rentang waktu; bisect langsung di kolom file."""
+        if not os.path.exists(self.snapshot_path):
+            return []
+
+        with open(self.snapshot_path, "rb") as f:
+            header = self._read_snapshot_header(f)
+            if header is None:
+                return []
+            count, _, ts_offset, _ = header
+            column = _DiskColumn(f, ts_offset, count)
+            lo = bisect_left(column, start)
+            hi = bisect_right(column, end, lo)
+            if lo >= hi:
+                return []
+            stamps, song_ids = self._read_rows(f, header, lo, hi)
+        return list(zip(stamps, song_ids))
+
+    def _snapshot_info(self):
+        """(jumlah entri, generasi) snapshot tanpa membaca isinya."""
+        if not os.path.exists(self.snapshot_path):
+            return 0, 0
+        with open(self.snapshot_path, "rb") as f:
+            raw = f.read(SNAPSHOT_HEADER.size)
+        if raw[:4] == SNAPSHOT_MAGIC and len(raw) == SNAPSHOT_HEADER.size:
+            _, count, _, generation = SNAPSHOT_HEADER.unpack(raw)
+            return count, generation
+        if raw[:4] == OLD_SNAPSHOT_MAGIC and len(raw) >= OLD_SNAPSHOT_HEADER.size:
+            return OLD_SNAPSHOT_HEADER.unpack(raw[:OLD_SNAPSHOT_HEADER.size])[1], 0
+        return 0, 0
+
+    def _snapshot_count(self):
+        return self._snapshot_info()[0]
+
+    def _snapshot_generation(self):
+        return self._snapshot_info()[1]
+
+    # ----------------------------
+    # COMPACTION
+    # ----------------------------
+    def _compacting(self):
+        return self._compactor is not None and self._compactor.is_alive()
+
+    def compact(self, wait=True):
+        """
+        Putar log ke segmen baru lalu padatkan di thread background.
+        wait=True menunggu sampai snapshot selesai ditulis.
+        """
+        if self._compacting():
+            self._compactor.join()
+        if self._log:
+            self._rotate_log()
+        if self._segments:
+            self._start_compaction()
+        if wait and self._compactor is not None:
+            self._compactor.join()
+
+    def _rotate_log(self):
+        """history.log -> history.log.<gen> (atomic), log baru dibuka kosong."""
+        self.flush()
+        self._file.close()
+        segment = f"{self.log_path}.{self._next_generation}"
+        self._next_generation += 1
+        os.replace(self.log_path, segment)
+        self._file = open(self.log_path, "a", encoding="utf-8")
+        self._unsynced = 0
+
+        with self._lock:
+            self._pending = self._pending + self._log
+            self._pending_stamps = self._pending_stamps + self._log_stamps
+        self._segments.append(segment)
+        self._log = []
+        self._log_stamps = array("d")
+
+    def _start_compaction(self):
+        segments = list(self._segments)
+        entries = list(self._pending)
+        generation = self._next_generation - 1
+        self._compactor = threading.Thread(
+            target=self._write_snapshot, args=(segments, entries, generation),
+            name="history-compact", daemon=True,
+        )
+        self._compactor.start()
+
+    def _write_snapshot(self, segments, entries, generation):
+        """Thread background: snapshot lama + segmen -> snapshot generasi baru."""
+        stamps, song_ids = self._read_snapshot()
+        for ts, song_id in entries:
+            stamps.append(ts)
+            song_ids.append(song_id)
+
+        vocab = {}
+        codes = array("I", (vocab.setdefault(s, len(vocab)) for s in song_ids))
+        vocab_bytes = "\n".join(vocab).encode("utf-8")
+
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(stamps), len(vocab_bytes), generation))
+            f.write(vocab_bytes)
+            stamps.tofile(f)
+            codes.tofile(f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        with self._lock:
+            os.replace(tmp_path, self.snapshot_path)
+            # snapshot (dengan generasi) sudah aman di disk, segmen boleh dihapus
+            self._pending = self._pending[len(entries):]
+            self._pending_stamps = self._pending_stamps[len(entries):]
+            self._segments = self._segments[len(segments):]
+        for path in segments:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    # ----------------------------
+    # READ
+    # ----------------------------
+    def last(self, n):
+        """n entri terakhir (timestamp, song_id), terbaru dulu."""
+        if n <= 0:
+            return []
+        result = self._log[-n:][::-1]
+        with self._lock:
+            if len(result) < n:
+                result.extend(self._pending[-(n - len(result)):][::-1])
+            missing = n - len(result)
+            if missing > 0:
+                count = self._snapshot_count()
+                stamps, song_ids = self._read_snapshot(count - missing, count)
+                result.extend(zip(reversed(stamps), reversed(song_ids)))
+        return result
+
+    def between(self, start, end):
+        """Entri dengan start <= timestamp <= end, urut dari yang terlama."""
+        with self._lock:
+            result = self._snapshot_between(start, end)
+            pending, pending_stamps = self._pending, self._pending_stamps
+
+        for entries, stamps in ((pending, pending_stamps), (self._log, self._log_stamps)):
+            lo = bisect_left(stamps, start)
+            hi = bisect_right(stamps, end, lo)
+            result.extend(entries[lo:hi])
+        return result
+
+    def __len__(self):
+        with self._lock:
+            return self._snapshot_count() + len(self._pending) + len(self._log)
+
+    def close(self):
+        if self._compactor is not None:
+            self._compactor.join()
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
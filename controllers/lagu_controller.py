@@ -1,24 +1,118 @@
 # controllers/lagu_controller.py
 
 import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+from controllers.song_events import SongChanges
+from controllers.tracing import traced
+
 from structures.double_linked_list import DoubleLinkedList
 from structures.song import Song
-from structures.single_linked_list import SingleLinkedList
 from structures.multi_linked_list import MultiLinkedList
+from structures.search_index import SearchIndex
+from structures.trie import Trie
 
 class SongController:
     """
     Controller lagu dengan:
     - DoubleLinkedList (data utama)
     - MultiLinkedList (index vibes)
+    - SearchIndex (index pencarian)
+    - Trie (saran pencarian / autocomplete)
+
+    Kalau diberi CatalogStore, katalog dibaca dari store saat start
+    dan setiap CRUD langsung ditulis ke store (write-through).
+
+    Saat start hanya DLL yang diisi; index pencarian, trie, dan index
+    vibes dibangun di background thread supaya UI bisa tampil duluan.
+    Method yang memakai index menunggu sampai index siap.
+
+    Kalau diberi MetadataCache, durasi lagu dibaca dari file audio
+    di background (hasilnya di-cache, scan berikutnya hampir instan).
+
+    `songs` (opsional) dipakai sebagai isi katalog awal menggantikan
+    store dan lagu default, mis. katalog sintetis untuk benchmark.
+
+    Setiap CRUD dikabarkan ke listener (subscribe) sebagai SongChanges,
+    jadi window yang terbuka cukup menambal baris yang berubah.
     """
 
-    def __init__(self):
-        self.songs = DoubleLinkedList()
+    def __init__(self, store=None, metadata=None, songs=None):
+        self.store = store
+        self.metadata = metadata
+        self._listeners = []
+        self._batch = None
+        self.songs = DoubleLinkedList(index_by_id=True)
         self.vibe_index = MultiLinkedList()
-
-        self._load_default_songs()
-        self.rebuild_vibe_index()
+        self.search_index = SearchIndex()
+        self.suggestions = Trie()
+
+        self._index_ready = threading.Event()
+        self._index_error = None
+
+        # lagu yang durasinya baru terbaca di worker thread metadata
+        self._metadata_lock = threading.Lock()
+        self._metadata_ready = {}
+        self._metadata_wakers = []
+
+        if songs is not None:
+            # katalog disuntik dari luar (benchmark / test), store tidak dibaca
+            for song in songs:
+                self.songs.add_last(song)
+        elif store is not None and not store.is_empty():
+            self._load_from_store()
+        else:
+            self._load_default_songs()
+            if store is not None:
+                store.add_many(self.get_all_songs())
+
+        threading.Thread(
+            target=self._build_indexes,
+            args=(self.get_all_songs(),),
+            name="song-index-builder",
+            daemon=True,
+        ).start()
+
+        if metadata is not None:
+            metadata.scan(self.get_all_songs(), self._metadata_loaded)
+
+    # LOAD DARI STORE
+    def _load_from_store(self):
+        for song in self.store.load_all():
+            self.songs.add_last(song)
+
+    # BANGUN INDEX (BACKGROUND)
+    def _build_indexes(self, songs):
+        try:
+            self.search_index.add_many(songs)
+
+            terms = Counter()
+            for song in songs:
+                terms.update(self._suggestion_terms(song))
+            for term, count in terms.items():
+                self.suggestions.insert(term, count)
+
+            self.vibe_index.rebuild(songs)
+        except Exception as exc:
+            # disimpan, dilempar ulang ke setiap pemakai index (bukan hilang di thread)
+            self._index_error = exc
+        finally:
+            self._index_ready.set()
+
+    def _wait_index(self, timeout=None):
+        ready = self._index_ready.wait(timeout)
+        if ready and self._index_error is not None:
+            raise RuntimeError("index lagu gagal dibangun") from self._index_error
+        return ready
+
+    def wait_until_ready(self, timeout=None):
+        """
+        Tunggu index selesai dibangun, return True kalau sudah siap.
+        Kalau pembangunan index gagal, RuntimeError dilempar di sini.
+        """
+        return self._wait_index(timeout)
 
     # LOAD DEFAULT SONGS 
     def _load_default_songs(self):
@@ -109,87 +203,235 @@ class SongController:
 
 
         for judul, artis, genre, vibes, filename in default_songs:
-            self.songs.add_last(
-                Song(
-                    judul,
-                    artis,
-                    genre,
-                    vibes,
-                    os.path.join(music_dir, f"{filename}.mp3"),
-                    os.path.join(cover_dir, f"{filename}.jpg"),
-                )
+            song = Song(
+                judul,
+                artis,
+                genre,
+                vibes,
+                os.path.join(music_dir, f"{filename}.mp3"),
+                os.path.join(cover_dir, f"{filename}.jpg"),
             )
+            self.songs.add_last(song)
+
+    # NOTIFIKASI PERUBAHAN
+    def subscribe(self, callback):
+        """callback(changes: SongChanges) dipanggil setiap katalog berubah."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _emit(self, changes):
+        if not changes:
+            return
+        if self._batch is not None:
+            self._batch.merge(changes)
+            return
+        for callback in list(self._listeners):
+            callback(changes)
+
+    def _notify(self, kind, song):
+        changes = SongChanges()
+        getattr(changes, kind)(song)
+        self._emit(changes)
+
+    @contextmanager
+    def batch(self):
+        """Semua perubahan di dalam blok dikirim sekali sebagai satu event batch."""
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        self._batch = changes = SongChanges()
+        changes.batch = True
+        try:
+            yield changes
+        finally:
+            self._batch = None
+            self._emit(changes)
 
     # GET DATA
     def get_all_songs(self):
         return self.songs.to_list()
 
     def find_song_by_id(self, song_id):
-        node = self.songs.head
-        while node:
-            if node.data.id == song_id:
-                return node.data
-            node = node.next
-        return None
+        return self.songs.find_by_id(song_id)
+
+    # INDEX PENCARIAN
+    def _suggestion_terms(self, song):
+        return (song.judul, song.artis, song.genre, song.vibes)
+
+    def _index_song(self, song):
+        self.search_index.add(song)
+        for term in self._suggestion_terms(song):
+            self.suggestions.insert(term)
+
+    def _unindex_song(self, song):
+        self.search_index.remove(song.id)
+        for term in self._suggestion_terms(song):
+            self.suggestions.remove(term)
 
     # SEARCH
+    @traced("SongController.search")
     def search(self, keyword):
-        if not keyword:
+        if not keyword or not keyword.strip():
             return self.get_all_songs()
 
-        keyword = keyword.lower().strip()
-        sll = SingleLinkedList()
-
-        node = self.songs.head
-        while node:
-            sll.add_last(node.data)
-            node = node.next
-
-        return sll.search(keyword)
+        self._wait_index()
+        return self.search_index.search(keyword)
+
+    def suggest(self, prefix, limit=8):
+        """Saran judul/artis/genre/vibes yang diawali prefix."""
+        self._wait_index()
+        return self.suggestions.complete(prefix, limit)
+
+    # METADATA AUDIO
+    def prefetch_metadata(self, song):
+        """Baca durasi lagu di background kalau belum diketahui."""
+        if song is not None and song.duration is None and self.metadata is not None:
+            self.metadata.scan([song], self._metadata_loaded)
+
+    def subscribe_metadata(self, waker):
+        """
+        waker() dipanggil dari worker thread saat ada durasi baru. GUI cukup
+        meneruskannya ke GUI thread (mis. lewat signal) lalu memanggil
+        apply_metadata() di sana.
+        """
+        if waker not in self._metadata_wakers:
+            self._metadata_wakers.append(waker)
+        with self._metadata_lock:
+            pending = bool(self._metadata_ready)
+        if pending:
+            waker()
+
+    def unsubscribe_metadata(self, waker):
+        if waker in self._metadata_wakers:
+            self._metadata_wakers.remove(waker)
+
+    def _metadata_loaded(self, song, info):
+        # worker thread: hanya dicatat, listener dipanggil dari apply_metadata()
+        if info is None or info.duration is None:
+            return
+        with self._metadata_lock:
+            first = not self._metadata_ready
+            self._metadata_ready[song.id] = song
+        if first:
+            for waker in list(self._metadata_wakers):
+                waker()
+
+    def apply_metadata(self):
+        """Kirim lagu yang durasinya baru terbaca sebagai satu event "updated"."""
+        with self._metadata_lock:
+            ready, self._metadata_ready = self._metadata_ready, {}
+        changes = SongChanges()
+        for song_id, song in ready.items():
+            if self.songs.find_by_id(song_id) is song:
+                changes.update(song)
+        self._emit(changes)
 
     # CRUD (ADMIN)
     def add_song(self, song: Song):
+        self._wait_index()
         self.songs.add_last(song)
         self.vibe_index.add_song_to_vibe(song)
+        self._index_song(song)
+        if self.store is not None:
+            self.store.add(song)
+        self.prefetch_metadata(song)
+        self._notify("add", song)
+
+    def add_songs(self, songs):
+        """
+        Tambah banyak lagu sekaligus (import folder): satu transaksi ke store
+        dan index vibe dibangun ulang sekali, bukan per lagu.
+        """
+        songs = list(songs)
+        if not songs:
+            return 0
+
+        self._wait_index()
+        for song in songs:
+            self.songs.add_last(song)
+
+        self.search_index.add_many(songs)
+        terms = Counter()
+        for song in songs:
+            terms.update(self._suggestion_terms(song))
+        for term, count in terms.items():
+            self.suggestions.insert(term, count)
+
+        self.vibe_index.rebuild(self.get_all_songs())
+        if self.store is not None:
+            self.store.add_many(songs)
+
+        with self.batch() as changes:
+            for song in songs:
+                changes.add(song)
+        return len(songs)
 
     def update_song(self, song_id, judul, artis, genre, vibes, file_path=None, cover_path=None):
-        node = self.songs.head
-        while node:
-            if node.data.id == song_id:
-                node.data.judul = judul
-                node.data.artis = artis
-                node.data.genre = genre
-                node.data.vibes = vibes
-                if file_path:
-                    node.data.file_path = file_path
-                if cover_path:
-                    node.data.cover_path = cover_path
-                self.rebuild_vibe_index()
-                return True
-            node = node.next
-        return False
+        self._wait_index()
+        song = self.songs.find_by_id(song_id)
+        if not song:
+            return False
+
+        for term in self._suggestion_terms(song):
+            self.suggestions.remove(term)
+
+        song.judul = judul
+        song.artis = artis
+        song.genre = genre
+        song.vibes = vibes
+        if file_path and file_path != song.file_path:
+            song.file_path = file_path
+            song.duration = None
+            self.prefetch_metadata(song)
+        if cover_path:
+            song.cover_path = cover_path
+
+        self.search_index.update(song)
+        for term in self._suggestion_terms(song):
+            self.suggestions.insert(term)
+        self.vibe_index.update_song(song)
+        if self.store is not None:
+            self.store.update(song)
+        self._notify("update", song)
+        return True
 
     def delete_song_by_id(self, song_id):
-        idx = 0
-        node = self.songs.head
-        while node:
-            if node.data.id == song_id:
-                self.songs.delete_at(idx)
-                self.rebuild_vibe_index()
-                return True
-            node = node.next
-            idx += 1
-        return False
+        self._wait_index()
+        song = self.songs.find_by_id(song_id)
+        if not song:
+            return False
+
+        self._unindex_song(song)
+        self.songs.remove_by_id(song_id)
+        self.vibe_index.remove_song(song)
+        if self.store is not None:
+            self.store.delete(song_id)
+        self._notify("remove", song)
+        return True
 
     # VIBE NAVIGATION (MULTI LINKED LIST)
+    @traced("SongController.rebuild_vibe_index")
     def rebuild_vibe_index(self):
+        self._wait_index()
         self.vibe_index.rebuild(self.get_all_songs())
 
     def get_songs_by_vibe(self, vibe_name):
+        self._wait_index()
         return self.vibe_index.get_songs_by_vibe(vibe_name)
 
     def get_next_same_vibe(self, current_song):
+        self._wait_index()
         return self.vibe_index.get_next_song_same_vibe(current_song)
 
     def get_prev_same_vibe(self, current_song):
-        return self.vibe_index.get_prev_song_same_vibe(current_song)
\ No newline at end of file
+        self._wait_index()
+        return self.vibe_index.get_prev_song_same_vibe(current_song)
+    def get_vibe_neighbor(self, current_song, axis, direction):
+        """Lagu di vibe terdekat dengan mood / energy lebih tinggi (1) atau rendah (-1)."""
+        self._wait_index()
+        return self.vibe_index.get_neighbor(current_song, axis, direction)
@@ -0,0 +1,12 @@
+# controllers/paths.py
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# folder data aplikasi (katalog, data user); bisa dipindah lewat env GOSIC_DATA_DIR
+DATA_DIR = os.environ.get("GOSIC_DATA_DIR") or os.path.join(BASE_DIR, "data")
+
+
+def user_dir(username):
+    """Folder data milik satu user (history, playlist, favorit, antrian)."""
+    return os.path.join(DATA_DIR, "users", username)
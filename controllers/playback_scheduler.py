@@ -0,0 +1,135 @@
+# controllers/playback_scheduler.py
+
+MODE_HOME = "home"           # All Songs: lagu berikutnya berdasarkan vibe
+MODE_PLAYLIST = "playlist"   # playlist / view lain: urutan DLL biasa
+
+
+class PlaybackScheduler:
+    """
+    Penentu lagu berikutnya / sebelumnya (tanpa Qt, bisa dites headless).
+
+    Urutan next:
+      1. antrian (Queue) dulu
+      2. mode home: lagu terdekat di index vibe (MultiLinkedList)
+      3. lagu berikutnya di DLL playlist (circular)
+    Mode playlist melewati langkah 2.
+
+    Vibe sengaja dicek sebelum DLL (bukan antrian -> DLL -> vibe): DLL
+    playlist circular (cur.next or head) selalu menghasilkan lagu selama
+    ada lagu yang diputar, jadi langkah vibe sesudahnya tidak akan pernah
+    jalan. DLL menjadi fallback terakhir.
+
+    peek_next() hanya menebak (tidak mengubah state), advance() benar-benar
+    pindah. Setiap tebakan berubah, listener upcoming dipanggil dengan lagu
+    tersebut, dipakai untuk preload audio dan metadata.
+    """
+
+    def __init__(self, queue, playlist, vibe_next=None, vibe_prev=None,
+                 on_queue_changed=None, vibe_neighbor=None):
+        self.queue = queue
+        self.playlist = playlist
+        self.vibe_next = vibe_next
+        self.vibe_prev = vibe_prev
+        self.vibe_neighbor = vibe_neighbor   # (song, axis, direction) -> Song
+        self.on_queue_changed = on_queue_changed
+        self.mode = MODE_HOME
+        self._upcoming_listeners = []
+
+    # ----------------------------
+    # LISTENER / MODE
+    # ----------------------------
+    def subscribe_upcoming(self, callback):
+        self._upcoming_listeners.append(callback)
+
+    def refresh_upcoming(self):
+        """Hitung ulang tebakan lagu berikutnya dan kabari listener."""
+        song = self.peek_next()
+        for callback in self._upcoming_listeners:
+            callback(song)
+        return song
+
+    def set_mode(self, mode):
+        if mode == self.mode:
+            return
+        self.mode = mode
+        if self.playlist.current:
+            self.refresh_upcoming()
+
+    # ----------------------------
+    # POSISI SEKARANG
+    # ----------------------------
+    def current(self):
+        return self.playlist.current.data if self.playlist.current else None
+
+    def set_current(self, song):
+        """Arahkan kursor DLL playlist ke lagu ini (ditambah kalau belum ada)."""
+        cur = self.playlist.current
+        if cur and cur.data is song:
+            return
+        if not self.playlist.jump_to_song(song):
+            self.playlist.add_last(song)
+            self.playlist.current = self.playlist.tail
+
+    # ----------------------------
+    # NEXT / PREV
+    # ----------------------------
+    def peek_next(self):
+        head = self.queue.peek()
+        if head:
+            return head
+
+        cur = self.playlist.current
+        if not cur:
+            return None
+
+        if self.mode == MODE_HOME and self.vibe_next:
+            vibe_next = self.vibe_next(cur.data)
+            if vibe_next:
+                return vibe_next
+
+        return (cur.next or self.playlist.head).data
+
+    def advance(self):
+        """Pindah ke lagu berikutnya dan return lagunya (None kalau tidak ada)."""
+        if not self.queue.is_empty():
+            song = self.queue.dequeue()
+            # kursor dipindah dulu: listener antrian bisa langsung
+            # refresh_upcoming() dan tebakannya dihitung dari lagu ini
+            self.set_current(song)
+            if self.on_queue_changed:
+                self.on_queue_changed()
+            return song
+
+        cur = self.playlist.current
+        if cur and self.mode == MODE_HOME and self.vibe_next:
+            vibe_next = self.vibe_next(cur.data)
+            if vibe_next:
+                self.set_current(vibe_next)
+                return vibe_next
+
+        return self.playlist.next_song()
+
+    def prev(self):
+        """Pindah ke lagu sebelumnya (antrian tidak dipakai untuk prev)."""
+        cur = self.playlist.current
+        if cur and self.mode == MODE_HOME and self.vibe_prev:
+            vibe_prev = self.vibe_prev(cur.data)
+            if vibe_prev:
+                self.set_current(vibe_prev)
+                return vibe_prev
+
+        return self.playlist.prev_song()
+
+    def shift_vibe(self, axis, direction):
+        """
+        Pindah ke vibe terdekat dengan mood / energy lebih tinggi (direction=1)
+        atau lebih rendah (-1), tombol geser vibe di player. Antrian tidak
+        dipakai. Return lagunya, None kalau tidak ada vibe ke arah itu.
+        """
+        cur = self.playlist.current
+        if not cur or not self.vibe_neighbor:
+            return None
+        song = self.vibe_neighbor(cur.data, axis, direction)
+        if song:
+            self.set_current(song)
+        return song
@@ -1,9 +1,18 @@
 # controllers/shared.py
 
+import os
+
+from controllers.audio_metadata import MetadataCache
+from controllers.catalog_store import CatalogStore
 from controllers.lagu_controller import SongController
+from controllers.paths import DATA_DIR
 
-# controller global dibuat sekali
-_shared_song_controller = SongController()
+# controller global dibuat sekali, katalog disimpan di data/catalog.db
+# dan cache metadata audio (durasi, tag) di data/metadata.db
+_shared_song_controller = SongController(
+    CatalogStore(os.path.join(DATA_DIR, "catalog.db")),
+    MetadataCache(os.path.join(DATA_DIR, "metadata.db")),
+)
 
 def get_song_controller():
     return _shared_song_controller
\ No newline at end of file
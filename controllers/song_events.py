@@ -0,0 +1,56 @@
+# controllers/song_events.py
+
+class SongChanges:
+    """
+    Perubahan katalog yang dikirim SongController ke listener.
+    Satu objek bisa berisi satu perubahan (add/update/delete biasa)
+    atau banyak sekaligus (batch, mis. import folder).
+
+    merge() menggabungkan perubahan beruntun untuk lagu yang sama:
+    - ditambah lalu diedit   -> tetap "added"
+    - ditambah lalu dihapus  -> hilang sama sekali
+    - diedit lalu dihapus    -> "removed"
+    """
+
+    def __init__(self):
+        self.added = {}      # song.id -> Song (urutan = urutan ditambah)
+        self.updated = {}    # song.id -> Song
+        self.removed = {}    # song.id -> Song
+        self.batch = False   # True kalau berasal dari controller.batch()
+
+    def __bool__(self):
+        return bool(self.added or self.updated or self.removed)
+
+    @property
+    def kind(self):
+        """'added' / 'updated' / 'removed' kalau hanya satu jenis, selain itu 'batch'."""
+        kinds = [name for name in ("added", "updated", "removed") if getattr(self, name)]
+        if self.batch or len(kinds) != 1:
+            return "batch"
+        return kinds[0]
+
+    # CATAT PERUBAHAN
+    def add(self, song):
+        self.removed.pop(song.id, None)
+        self.added[song.id] = song
+
+    def update(self, song):
+        if song.id in self.added:
+            return
+        self.updated[song.id] = song
+
+    def remove(self, song):
+        self.updated.pop(song.id, None)
+        if self.added.pop(song.id, None) is not None:
+            return
+        self.removed[song.id] = song
+
+    def merge(self, other):
+        for song in other.removed.values():
+            self.remove(song)
+        for song in other.added.values():
+            self.add(song)
+        for song in other.updated.values():
+            self.update(song)
+        self.batch = self.batch or other.batch
+        return self
@@ -0,0 +1,206 @@
+# controllers/tracing.py
+"""
+Tracing ringan untuk jalur panas (controller + GUI).
+
+Aktif kalau env GOSIC_TRACE diisi:
+    GOSIC_TRACE=1                -> trace ditulis ke data/logs/trace.json saat keluar
+    GOSIC_TRACE=/tmp/gosic.json  -> ditulis ke path tersebut
+
+Span disimpan di ring buffer (deque, default 100k event, env
+GOSIC_TRACE_BUFFER) dan bisa ditulis kapan saja dengan dump_chrome_trace()
+dalam format Chrome trace-event (buka di chrome://tracing atau Perfetto).
+
+Saat tidak aktif, span() mengembalikan objek kosong yang sama dan
+@traced hanya menambah satu pengecekan flag, jadi aman dibiarkan terpasang.
+"""
+import atexit
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+from collections import deque
+from time import perf_counter_ns
+
+from controllers.paths import DATA_DIR
+
+DEFAULT_CAPACITY = 100_000
+DEFAULT_PATH = os.path.join(DATA_DIR, "logs", "trace.json")
+
+_enabled = False
+_events = deque(maxlen=DEFAULT_CAPACITY)
+_thread_names = {}
+_async_ids = itertools.count(1)
+_origin = perf_counter_ns()
+
+
+# ----------------------------
+# ON / OFF
+# ----------------------------
+def enable(capacity=None):
+    global _enabled, _events
+    if capacity and capacity != _events.maxlen:
+        _events = deque(_events, maxlen=capacity)
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def clear():
+    _events.clear()
+
+
+# ----------------------------
+# REKAM EVENT
+# ----------------------------
+def _thread_id():
+    tid = threading.get_ident()
+    if tid not in _thread_names:
+        _thread_names[tid] = threading.current_thread().name
+    return tid
+
+
+def _record(name, start, args=None):
+    # event "X" (complete): nama, mulai, durasi, thread, args
+    _events.append(("X", name, start, perf_counter_ns() - start, _thread_id(), None, args))
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, self.start, self.args)
+        return False
+
+
+def span(name, **args):
+    """with span("nama", key=value): ... -> satu span sinkron."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args or None)
+
+
+def traced(name=None):
+    """Decorator span untuk satu fungsi. Bisa dipakai @traced atau @traced("nama")."""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(label, start)
+        return wrapper
+
+    if callable(name):
+        func, name = name, None
+        return decorate(func)
+    return decorate
+
+
+def begin(name, **args):
+    """
+    Mulai span async (selesai di callback lain, mis. saat audio siap).
+    Return token untuk end(); None kalau tracing tidak aktif.
+    """
+    if not _enabled:
+        return None
+    token = (name, next(_async_ids))
+    _events.append(("b", name, perf_counter_ns(), 0, _thread_id(), token[1], args or None))
+    return token
+
+
+def end(token, **args):
+    if token is None or not _enabled:
+        return
+    name, async_id = token
+    _events.append(("e", name, perf_counter_ns(), 0, _thread_id(), async_id, args or None))
+
+
+# ----------------------------
+# DUMP (CHROME TRACE-EVENT)
+# ----------------------------
+def dump_chrome_trace(path=None):
+    """Tulis isi ring buffer sebagai JSON trace-event, return path file."""
+    path = path or DEFAULT_PATH
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    pid = os.getpid()
+    trace = [
+        {"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": name}}
+        for tid, name in list(_thread_names.items())
+    ]
+    for ph, name, start, duration, tid, async_id, args in list(_events):
+        event = {"ph": ph, "name": name, "cat": "gosic", "pid": pid, "tid": tid,
+                 "ts": (start - _origin) / 1000}
+        if ph == "X":
+            event["dur"] = duration / 1000
+        else:
+            event["id"] = async_id
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        trace.append(event)
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+    return path
+
+
+# ----------------------------
+# AKTIFKAN DARI ENV
+# ----------------------------
+def _env_capacity():
+    """GOSIC_TRACE_BUFFER; nilai tidak valid tidak boleh bikin import gagal."""
+    raw = os.environ.get("GOSIC_TRACE_BUFFER")
+    if not raw:
+        return DEFAULT_CAPACITY
+    try:
+        capacity = int(raw)
+    except ValueError:
+        capacity = 0
+    if capacity < 1:
+        print(f"GOSIC_TRACE_BUFFER={raw!r} tidak valid, pakai {DEFAULT_CAPACITY}.", file=sys.stderr)
+        return DEFAULT_CAPACITY
+    return capacity
+
+
+_env = os.environ.get("GOSIC_TRACE")
+if _env and _env != "0":
+    enable(_env_capacity())
+    _dump_path = _env if _env.lower().endswith(".json") else None
+    atexit.register(lambda: dump_chrome_trace(_dump_path))
@@ -0,0 +1,233 @@
+# controllers/user_state_store.py
+import os
+import sqlite3
+import threading
+
+STATE_NAME = "state.db"
+FLUSH_DELAY = 0.25     # detik menunggu perubahan lain sebelum ditulis
+
+
+class UserStateStore:
+    """
+    Data milik satu user (playlist, cover playlist, favorit, antrian) di SQLite.
+
+    - load(): dibaca sekali saat login dengan beberapa query batch
+      (bukan satu query per playlist), jadi ribuan playlist tetap cepat.
+    - perubahan dicatat per key di `_pending` (perubahan berikutnya untuk
+      key yang sama menimpa yang lama) lalu ditulis oleh writer thread
+      dalam satu transaksi, tidak di GUI thread.
+    """
+
+    def __init__(self, folder):
+        os.makedirs(folder, exist_ok=True)
+        self.path = os.path.join(folder, STATE_NAME)
+
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS playlists (
+                name TEXT PRIMARY KEY,
+                position INTEGER NOT NULL,
+                cover_path TEXT
+            );
+            CREATE TABLE IF NOT EXISTS playlist_songs (
+                playlist TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                song_id TEXT NOT NULL,
+                PRIMARY KEY (playlist, position)
+            );
+            CREATE TABLE IF NOT EXISTS favorites (
+                song_id TEXT PRIMARY KEY
+            );
+            CREATE TABLE IF NOT EXISTS queue (
+                position INTEGER PRIMARY KEY,
+                song_id TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+        self._positions = {}     # nama playlist -> posisi (urutan tampil)
+        self._next_position = 0
+
+        self._pending = {}       # key -> operasi terakhir
+        self._cond = threading.Condition()
+        # urutan lock: _write_lock lalu _cond (batch lama selalu ditulis duluan)
+        self._write_lock = threading.Lock()
+        self._closing = False
+        self._writer = threading.Thread(target=self._run_writer, daemon=True)
+        self._writer.start()
+
+    # ----------------------------
+    # LOAD (SAAT LOGIN)
+    # ----------------------------
+    def load(self):
+        """
+        Return dict:
+          playlists: [(nama, cover_path, [song_id, ...]), ...] sesuai urutan
+          favorites: [song_id, ...]
+          queue:     [song_id, ...]
+        """
+        with self._write_lock:
+            conn = self.conn
+            playlists = conn.execute(
+                "SELECT name, position, cover_path FROM playlists ORDER BY position"
+            ).fetchall()
+
+            songs_of = {name: [] for name, _, _ in playlists}
+            for playlist, song_id in conn.execute(
+                "SELECT playlist, song_id FROM playlist_songs ORDER BY playlist, position"
+            ):
+                ids = songs_of.get(playlist)
+                if ids is not None:
+                    ids.append(song_id)
+
+            favorites = [r[0] for r in conn.execute("SELECT song_id FROM favorites ORDER BY rowid")]
+            queue = [r[0] for r in conn.execute("SELECT song_id FROM queue ORDER BY position")]
+
+        self._positions = {name: position for name, position, _ in playlists}
+        self._next_position = max(self._positions.values(), default=-1) + 1
+
+        return {
+            "playlists": [(name, cover, songs_of[name]) for name, _, cover in playlists],
+            "favorites": favorites,
+            "queue": queue,
+        }
+
+    # ----------------------------
+    # PERUBAHAN (DIPANGGIL DARI GUI THREAD)
+    # ----------------------------
+    def _submit(self, key, op):
+        with self._cond:
+            self._pending[key] = op
+            self._cond.notify()
+
+    def _renamed_from(self, name):
+        """Nama lama di database kalau rename playlist ini belum ditulis."""
+        op = self._pending.get(("playlist", name))
+        return op[-1] if op else None
+
+    def save_playlist(self, name, song_ids, cover_path=None):
+        position = self._positions.get(name)
+        if position is None:
+            position = self._positions[name] = self._next_position
+            self._next_position += 1
+        with self._cond:
+            op = ("save", position, cover_path, list(song_ids), self._renamed_from(name))
+            self._pending[("playlist", name)] = op
+            self._cond.notify()
+
+    def rename_playlist(self, old_name, new_name):
+        """Ganti nama di tempat (UPDATE), posisi playlist tidak berubah."""
+        if old_name in self._positions:
+            self._positions[new_name] = self._positions.pop(old_name)
+        with self._cond:
+            db_name = self._renamed_from(old_name) or old_name
+            op = self._pending.pop(("playlist", old_name), None)
+            if op and op[0] == "save":
+                op = op[:-1] + (db_name,)
+            else:
+                op = ("rename", db_name)
+            self._pending[("playlist", new_name)] = op
+            self._cond.notify()
+
+    def delete_playlist(self, name):
+        self._positions.pop(name, None)
+        with self._cond:
+            self._pending[("playlist", name)] = ("delete", self._renamed_from(name))
+            self._cond.notify()
+
+    def set_favorite(self, song_id, favorited):
+        self._submit(("favorite", song_id), ("save",) if favorited else ("delete",))
+
+    def save_queue(self, song_ids):
+        self._submit(("queue",), ("save", list(song_ids)))
+
+    # ----------------------------
+    # WRITER THREAD
+    # ----------------------------
+    def _run_writer(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait()
+                if not self._pending and self._closing:
+                    return
+                # tunggu sebentar supaya perubahan beruntun digabung
+                if not self._closing:
+                    self._cond.wait(FLUSH_DELAY)
+            self.flush()
+
+    def _write(self, pending):
+        with self.conn:
+            for key, op in pending.items():
+                kind = key[0]
+                if kind == "playlist":
+                    self._write_playlist(key[1], op)
+                elif kind == "favorite":
+                    if op[0] == "save":
+                        self.conn.execute(
+                            "INSERT OR IGNORE INTO favorites (song_id) VALUES (?)", (key[1],)
+                        )
+                    else:
+                        self.conn.execute("DELETE FROM favorites WHERE song_id = ?", (key[1],))
+                elif kind == "queue":
+                    self.conn.execute("DELETE FROM queue")
+                    self.conn.executemany(
+                        "INSERT INTO queue (position, song_id) VALUES (?, ?)",
+                        enumerate(op[1]),
+                    )
+
+    def _write_playlist(self, name, op):
+        # op[-1]: nama lama kalau playlist diganti nama sebelum ditulis
+        old_name = op[-1]
+        if op[0] == "delete":
+            for n in filter(None, (name, old_name)):
+                self.conn.execute("DELETE FROM playlist_songs WHERE playlist = ?", (n,))
+                self.conn.execute("DELETE FROM playlists WHERE name = ?", (n,))
+            return
+
+        if old_name:
+            # baris lama bernama `name` (kalau ada) sudah dihapus user sebelum rename
+            self.conn.execute("DELETE FROM playlist_songs WHERE playlist = ?", (name,))
+            self.conn.execute("DELETE FROM playlists WHERE name = ?", (name,))
+            self.conn.execute("UPDATE playlists SET name = ? WHERE name = ?", (name, old_name))
+            self.conn.execute(
+                "UPDATE playlist_songs SET playlist = ? WHERE playlist = ?", (name, old_name)
+            )
+        if op[0] == "rename":
+            return
+
+        self.conn.execute("DELETE FROM playlist_songs WHERE playlist = ?", (name,))
+        _, position, cover_path, song_ids, _ = op
+        self.conn.execute(
+            "INSERT INTO playlists (name, position, cover_path) VALUES (?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET position = excluded.position, "
+            "cover_path = excluded.cover_path",
+            (name, position, cover_path),
+        )
+        self.conn.executemany(
+            "INSERT INTO playlist_songs (playlist, position, song_id) VALUES (?, ?, ?)",
+            ((name, i, song_id) for i, song_id in enumerate(song_ids)),
+        )
+
+    # ----------------------------
+    # FLUSH / CLOSE
+    # ----------------------------
+    def flush(self):
+        """Tulis semua perubahan yang masih tertunda sekarang juga."""
+        with self._write_lock:
+            with self._cond:
+                pending, self._pending = self._pending, {}
+            if pending:
+                self._write(pending)
+
+    def close(self):
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify()
+        self._writer.join()
+        self.flush()
+        self.conn.close()
@@ -2,12 +2,14 @@
 import sys
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QApplication, QMessageBox
+    QLabel, QPushButton, QApplication, QMessageBox, QFileDialog
 )
 from PyQt6.QtGui import QFont
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 
+from controllers.bulk_import import commit_import, existing_paths, prepare_import
 from controllers.shared import get_song_controller
+from controllers.song_events import SongChanges
 from structures.song import Song
 
 from gui.views_admin.song_table_view import SongTableView
@@ -16,14 +18,36 @@ from gui.views_admin.delete_confirm_dialog import confirm_delete
 from gui.icons import icon
 
 
+# IMPORT FOLDER DI BACKGROUND
+class _ImportSignals(QObject):
+    finished = pyqtSignal(object)   # ImportResult (belum masuk katalog)
+    failed = pyqtSignal(str)
+
+
+class _ImportJob(QRunnable):
+    def __init__(self, folder, existing, metadata):
+        super().__init__()
+        self.folder = folder
+        self.existing = existing
+        self.metadata = metadata
+        self.signals = _ImportSignals()
+
+    def run(self):
+        try:
+            result = prepare_import(self.folder, self.existing, self.metadata)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
 class AdminWindow(QMainWindow):
-    def __init__(self, user_window_ref=None, login_window_ref=None):
+    def __init__(self, login_window_ref=None):
         super().__init__()
         self.setWindowTitle("Admin Panel Musik")
         self.setGeometry(150, 80, 1000, 700)
 
         self.song_controller = get_song_controller()
-        self.user_window_ref = user_window_ref
         self.login_window_ref = login_window_ref
 
         root = QWidget()
@@ -68,26 +92,71 @@ class AdminWindow(QMainWindow):
         btn_edit.clicked.connect(self._edit_song)
         btn_delete.clicked.connect(self._delete_song)
 
+        self.btn_import = btn_import = QPushButton("Import Folder")
+        btn_import.setIcon(icon("library_music"))
+        btn_import.setProperty("buttonRole", "secondary")
+        btn_import.clicked.connect(self._import_folder)
+        self._import_job = None
+
         controls.addWidget(btn_add)
         controls.addWidget(btn_edit)
         controls.addWidget(btn_delete)
+        controls.addWidget(btn_import)
         controls.addStretch()
 
         layout.addLayout(controls)
 
         self.setCentralWidget(root)
+        self._pending_changes = None
         self.refresh_table()
 
+        # tabel ditambal dari notifikasi controller selama window terbuka,
+        # digabung per putaran event loop seperti di UserWindow
+        self._on_changes = self._on_catalog_changed
+        self._subscribed = False
+        self._subscribe()
+        # controller global hidup lebih lama dari window: lepas juga saat dihapus
+        controller, callback = self.song_controller, self._on_changes
+        self.destroyed.connect(lambda *_: controller.unsubscribe(callback))
+
+    def _subscribe(self):
+        if not self._subscribed:
+            self.song_controller.subscribe(self._on_changes)
+            self._subscribed = True
+
+    def showEvent(self, event):
+        if not self._subscribed:
+            # perubahan selama window tertutup tidak ditambal, muat ulang sekali
+            self.refresh_table()
+            self._subscribe()
+        super().showEvent(event)
+
+    def closeEvent(self, event):
+        self.song_controller.unsubscribe(self._on_changes)
+        self._subscribed = False
+        super().closeEvent(event)
+
+    def _on_catalog_changed(self, changes):
+        if self._pending_changes is None:
+            self._pending_changes = SongChanges()
+            QTimer.singleShot(0, self._apply_catalog_changes)
+        self._pending_changes.merge(changes)
+
+    def _apply_catalog_changes(self):
+        changes, self._pending_changes = self._pending_changes, None
+        if changes:
+            self.table.apply_changes(changes)
+
     def refresh_table(self, keep_song_id=None):
+        # muat ulang penuh: perubahan yang belum ditambal sudah termasuk
+        self._pending_changes = None
         songs = self.song_controller.get_all_songs()
         self.table.load_songs(songs)
 
         if keep_song_id:
-            for row in range(self.table.rowCount()):
-                item = self.table.item(row, 0)
-                if item.data(Qt.ItemDataRole.UserRole) == keep_song_id:
-                    self.table.selectRow(row)
-                    break
+            row = self.table.row_of(keep_song_id)
+            if row is not None:
+                self.table.selectRow(row)
 
     # ADD SONG
     def _add_song(self):
@@ -96,14 +165,43 @@ class AdminWindow(QMainWindow):
             data = dialog.get_data()
             if data:
                 judul, artis, genre, vibes, file_path, cover_path = data
+                # tabel admin & window user diperbarui lewat notifikasi controller
                 self.song_controller.add_song(
                     Song(judul, artis, genre, vibes, file_path, cover_path)
                 )
-                self.refresh_table()
 
-                # realtime ke user
-                if self.user_window_ref:
-                    self.user_window_ref.refresh_current_view()
+    # IMPORT FOLDER (BANYAK LAGU SEKALIGUS)
+    def _import_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Pilih Folder Musik")
+        if not folder:
+            return
+
+        # scan + parse di thread pool, UI tetap jalan; hasil dimasukkan
+        # ke katalog di GUI thread saat job selesai
+        job = _ImportJob(folder, existing_paths(self.song_controller), self.song_controller.metadata)
+        job.signals.finished.connect(self._import_finished)
+        job.signals.failed.connect(self._import_failed)
+        self._import_job = job
+        self.btn_import.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.CursorShape.BusyCursor)
+        QThreadPool.globalInstance().start(job)
+
+    def _import_done(self):
+        self._import_job = None
+        self.btn_import.setEnabled(True)
+        QApplication.restoreOverrideCursor()
+
+    def _import_finished(self, result):
+        self._import_done()
+        commit_import(self.song_controller, result)
+        QMessageBox.information(
+            self, "Import",
+            f"{len(result.songs)} songs imported, {result.skipped} already in the catalog."
+        )
+
+    def _import_failed(self, message):
+        self._import_done()
+        QMessageBox.warning(self, "Import", f"Import failed: {message}")
 
     # EDIT SONG
     def _edit_song(self):
@@ -120,7 +218,6 @@ class AdminWindow(QMainWindow):
             if data:
                 judul, artis, genre, vibes, file_path, cover_path = data
                 self.song_controller.update_song(song_id, judul, artis, genre, vibes, file_path, cover_path)
-                self.refresh_table(keep_song_id=song_id)
 
     def _get_selected_song_id(self):
         row = self.table.currentRow()
@@ -138,7 +235,6 @@ class AdminWindow(QMainWindow):
 
         if confirm_delete(self):
             self.song_controller.delete_song_by_id(song_id)
-            self.refresh_table()
 
     # LOGOUT
     def _logout(self):
@@ -144,18 +144,18 @@ class LoginWindow(QWidget):
         if role == "admin":
             from gui.admin_window import AdminWindow
             if self.admin_window is None:
-                self.admin_window = AdminWindow(
-                    user_window_ref=self.user_window,
-                    login_window_ref=self
-                )
+                self.admin_window = AdminWindow(login_window_ref=self)
             else:
-                self.admin_window.user_window_ref = self.user_window
                 self.admin_window.login_window_ref = self
             self.win = self.admin_window
         else:
             from gui.user_window import UserWindow
-            if self.user_window is None:
-                self.user_window = UserWindow(login_window_ref=self)
+            # data (history dll.) milik user, jadi window dibuat ulang kalau ganti user
+            if self.user_window is None or self.user_window.username != username:
+                if self.user_window is not None:
+                    self.user_window.shutdown()
+                    self.user_window.deleteLater()
+                self.user_window = UserWindow(login_window_ref=self, username=username)
             self.win = self.user_window
 
         self.win.show()
@@ -0,0 +1,163 @@
+# gui/playback_engine.py
+from PyQt6.QtCore import QObject, QUrl, pyqtSignal
+from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+
+from controllers import tracing
+
+# status yang berarti audio sudah bisa keluar
+_READY = (QMediaPlayer.MediaStatus.BufferedMedia, QMediaPlayer.MediaStatus.EndOfMedia)
+
+
+class _Deck:
+    """Satu pemutar (QMediaPlayer + QAudioOutput) beserta lagu yang dimuat."""
+    def __init__(self, volume):
+        self.output = QAudioOutput()
+        self.output.setVolume(volume)
+        self.player = QMediaPlayer()
+        self.player.setAudioOutput(self.output)
+        self.song = None
+        self.trace = None       # token tracing.begin() yang menunggu audio siap
+
+    def end_trace(self, **args):
+        tracing.end(self.trace, **args)
+        self.trace = None
+
+    def load(self, song):
+        self.song = song
+        self.player.setSource(QUrl.fromLocalFile(song.file_path))
+
+    def unload(self):
+        self.end_trace(cancelled=True)
+        self.song = None
+        self.player.stop()
+        self.player.setSource(QUrl())
+
+
+class PlaybackEngine(QObject):
+    """
+    Pemutar dengan dua deck. Deck aktif memutar lagu sekarang, deck cadangan
+    sudah memuat (open file + demux + decoder siap) lagu yang diperkirakan
+    diputar berikutnya. Saat lagu habis atau tombol Next ditekan, deck
+    ditukar, jadi lagu berikutnya langsung jalan tanpa jeda loading.
+
+    `resolver()` mengembalikan tebakan lagu berikutnya tanpa mengubah state.
+    """
+
+    advanced = pyqtSignal(object)   # lagu cadangan mulai otomatis setelah lagu habis
+    finished = pyqtSignal()         # lagu habis dan tidak ada lagu berikutnya
+
+    def __init__(self, resolver=None, volume=0.5, parent=None):
+        super().__init__(parent)
+        self.resolver = resolver
+        self.volume = volume
+
+        self.active = _Deck(volume)
+        self.standby = _Deck(volume)
+        for deck in (self.active, self.standby):
+            deck.player.mediaStatusChanged.connect(
+                lambda status, d=deck: self._on_status(d, status)
+            )
+
+    @property
+    def current_song(self):
+        return self.active.song
+
+    @property
+    def player(self):
+        """QMediaPlayer yang sedang aktif (untuk posisi / durasi)."""
+        return self.active.player
+
+    # ----------------------------
+    # KONTROL
+    # ----------------------------
+    def play(self, song, trace=None):
+        """
+        Putar lagu; kalau sudah dimuat di deck cadangan, cukup tukar deck.
+        `trace` (token tracing.begin) diakhiri saat audio deck aktif siap.
+        """
+        if self.standby.song is song:
+            self._swap()
+        else:
+            self.active.unload()
+            if song.file_path:
+                self.active.load(song)
+                self.active.player.play()
+            else:
+                self.active.song = song
+
+        if trace is not None:
+            self.active.trace = trace
+            if not song.file_path or self.active.player.mediaStatus() in _READY:
+                self.active.end_trace()
+
+        self.preload_next()
+
+    def pause(self):
+        self.active.player.pause()
+
+    def resume(self):
+        self.active.player.play()
+
+    def stop(self):
+        self.active.unload()
+        self.standby.unload()
+
+    def discard(self, song_id):
+        """
+        Lepas lagu yang dihapus dari deck mana pun yang memuatnya.
+        Return True kalau lagu itu yang sedang diputar (pemutaran berhenti).
+        """
+        stopped = False
+        if self.active.song is not None and self.active.song.id == song_id:
+            self.active.unload()
+            stopped = True
+        if self.standby.song is not None and self.standby.song.id == song_id:
+            self.standby.unload()
+        return stopped
+
+    def set_volume(self, volume):
+        self.volume = volume
+        self.active.output.setVolume(volume)
+        self.standby.output.setVolume(volume)
+
+    # ----------------------------
+    # PRELOAD
+    # ----------------------------
+    def preload_next(self):
+        """Muat tebakan lagu berikutnya ke deck cadangan (kalau berubah)."""
+        self.preload(self.resolver() if self.resolver else None)
+
+    def preload(self, song):
+        if song is None or not song.file_path:
+            if self.standby.song is not None:
+                self.standby.unload()
+            return
+        if self.standby.song is song:
+            return
+        self.standby.load(song)
+
+    def _swap(self):
+        old = self.active
+        self.active, self.standby = self.standby, old
+        self.active.player.play()
+        old.unload()
+
+    def _on_status(self, deck, status):
+        if deck.trace is not None:
+            if status in _READY:
+                deck.end_trace()
+            elif status == QMediaPlayer.MediaStatus.InvalidMedia:
+                deck.end_trace(error="invalid media")
+        if deck is not self.active or status != QMediaPlayer.MediaStatus.EndOfMedia:
+            return
+
+        # tebakan bisa berubah (mis. antrian diedit), cek ulang dulu
+        self.preload_next()
+        if self.standby.song is None:
+            self.finished.emit()
+            return
+
+        song = self.standby.song
+        self._swap()
+        self.advanced.emit(song)
+        self.preload_next()
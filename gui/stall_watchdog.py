@@ -0,0 +1,186 @@
+# gui/stall_watchdog.py
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from PyQt6.QtCore import QObject, QTimer
+
+from controllers.paths import BASE_DIR, DATA_DIR
+
+DEFAULT_THRESHOLD_MS = 250
+HEARTBEAT_MS = 50
+SAMPLE_MS = 10
+MAX_DEPTH = 40
+TOP_STACKS = 5
+LOG_PATH = os.path.join(DATA_DIR, "logs", "stalls.log")
+
+
+def _frame_key(frame):
+    """Stack sebagai tuple (file, fungsi, baris) dari luar ke dalam."""
+    stack = []
+    while frame is not None and len(stack) < MAX_DEPTH:
+        code = frame.f_code
+        stack.append((code.co_filename, code.co_name, frame.f_lineno))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+def _short(filename):
+    if filename.startswith(BASE_DIR):
+        return os.path.relpath(filename, BASE_DIR)
+    return os.path.basename(filename)
+
+
+def _own_frames(stack):
+    """Hanya frame dari kode GoSic (bukan library), tanpa main.py."""
+    return [f for f in stack
+            if f[0].startswith(BASE_DIR) and os.path.basename(f[0]) != "main.py"]
+
+
+def _handler(stack):
+    """Frame GoSic terluar = handler yang dipanggil event loop (mis. UserWindow._next)."""
+    own = _own_frames(stack)
+    frame = own[0] if own else (stack[-1] if stack else ("?", "?", 0))
+    return f"{_short(frame[0])}:{frame[1]}"
+
+
+def _format_stack(stack):
+    frames = _own_frames(stack) or list(stack[-3:])
+    return " > ".join(f"{_short(f[0])}:{f[1]}:{f[2]}" for f in frames)
+
+
+class StallWatchdog(QObject):
+    """
+    Pendeteksi UI macet (event loop main thread tidak jalan).
+
+    - QTimer di main thread mencatat waktu "detak" setiap HEARTBEAT_MS.
+    - Thread watchdog tidur sampai detak terakhir bisa dianggap terlambat
+      (paling cepat tiap HEARTBEAT_MS, saat sehat biasanya sekali per
+      threshold). Kalau detak terlambat lebih dari threshold, stack Python
+      main thread diambil (sys._current_frames) setiap SAMPLE_MS sampai
+      detak kembali; sampling 10 ms hanya jalan selama macet.
+    - Setelah macet selesai, sampel dikelompokkan per stack dan ditulis ke
+      log (data/logs/stalls.log): durasi, handler, dan stack terbanyak.
+      Saat stop() ditambahkan ringkasan per handler.
+
+    Kalau main thread tertahan di dalam kode C++ Qt yang memegang GIL,
+    sampel baru bisa diambil setelah kembali ke Python; stack yang tercatat
+    tetap menunjuk ke pemanggil Python-nya.
+    """
+
+    def __init__(self, threshold_ms=DEFAULT_THRESHOLD_MS, log_path=LOG_PATH,
+                 heartbeat_ms=HEARTBEAT_MS, sample_ms=SAMPLE_MS, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.heartbeat = heartbeat_ms / 1000
+        self.sample_interval = sample_ms / 1000
+        self.log_path = log_path
+
+        self._main_id = threading.main_thread().ident
+        self._last_beat = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+
+        # ringkasan seluruh sesi: handler -> [jumlah macet, total detik, terlama]
+        self.summary = {}
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(heartbeat_ms)
+        self._timer.timeout.connect(self._beat)
+
+    # ----------------------------
+    # START / STOP
+    # ----------------------------
+    def start(self):
+        if self._thread is not None:
+            return
+        self._last_beat = time.monotonic()
+        self._timer.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._timer.stop()
+        self._stop.set()
+        self._thread.join(timeout=1)
+        self._thread = None
+        self._write_summary()
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+
+    # ----------------------------
+    # THREAD WATCHDOG
+    # ----------------------------
+    def _run(self):
+        delay = self.heartbeat
+        while not self._stop.wait(delay):
+            beat = self._last_beat
+            late = time.monotonic() - beat - self.heartbeat
+            if late > self.threshold:
+                self._record_stall(beat)
+                delay = self.heartbeat
+            else:
+                # sehat: tidur sampai detak ini baru bisa dianggap macet
+                delay = max(self.heartbeat, self.threshold - late)
+
+    def _record_stall(self, beat):
+        """Ambil sampel stack main thread sampai detak berikutnya masuk."""
+        samples = Counter()
+        started = beat + self.heartbeat
+        while self._last_beat == beat and not self._stop.is_set():
+            frame = sys._current_frames().get(self._main_id)
+            if frame is not None:
+                samples[_frame_key(frame)] += 1
+            del frame
+            time.sleep(self.sample_interval)
+
+        duration = (self._last_beat if self._last_beat != beat else time.monotonic()) - started
+        if samples:
+            self._report(duration, samples)
+
+    # ----------------------------
+    # LAPORAN
+    # ----------------------------
+    def _report(self, duration, samples):
+        total = sum(samples.values())
+        handlers = Counter()
+        for stack, count in samples.items():
+            handlers[_handler(stack)] += count
+        handler = handlers.most_common(1)[0][0]
+
+        entry = self.summary.setdefault(handler, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += duration
+        entry[2] = max(entry[2], duration)
+
+        lines = [f"=== {time.strftime('%Y-%m-%d %H:%M:%S')}  macet {duration * 1000:.0f} ms"
+                 f"  ({total} sampel)  handler: {handler}"]
+        for stack, count in samples.most_common(TOP_STACKS):
+            lines.append(f"  {count * 100 / total:5.1f}%  {_format_stack(stack)}")
+        self._write(lines)
+
+    def _write_summary(self):
+        if not self.summary:
+            return
+        lines = [f"=== ringkasan sesi {time.strftime('%Y-%m-%d %H:%M:%S')}"
+                 f" (threshold {self.threshold * 1000:.0f} ms)"]
+        ranked = sorted(self.summary.items(), key=lambda item: item[1][1], reverse=True)
+        for handler, (count, total, longest) in ranked:
+            lines.append(f"  {handler}: {count}x, total {total * 1000:.0f} ms,"
+                         f" terlama {longest * 1000:.0f} ms")
+        self._write(lines)
+
+    def _write(self, lines):
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError:
+            pass
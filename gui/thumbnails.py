@@ -0,0 +1,335 @@
+# gui/thumbnails.py
+import hashlib
+import os
+from collections import OrderedDict
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QRunnable, QSize, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+from controllers.paths import DATA_DIR
+
+# ukuran thumbnail yang dipakai view
+CARD_SIZE = (252, 150)
+FAVORITE_CARD_SIZE = (260, 150)
+PLAYLIST_CARD_SIZE = (240, 180)
+ROW_SIZE = (64, 64)
+
+THUMBNAIL_DIR = os.path.join(DATA_DIR, "thumbnails")
+MAX_CACHE_BYTES = 48 * 1024 * 1024
+MAX_DISK_BYTES = 64 * 1024 * 1024
+PRUNE_EVERY = 200       # cek ukuran folder thumbnail setiap sekian decode baru
+
+
+class ThumbnailCache:
+    """
+    Cache cover yang sudah di-scale, key: (path, mtime, lebar, tinggi).
+    - memori: LRU dibatasi total byte pixmap
+    - disk (opsional): PNG kecil di disk_dir, jadi JPEG besar tidak perlu
+      di-decode ulang setelah aplikasi dibuka lagi. Dibatasi max_disk_bytes,
+      file yang paling lama tidak dipakai dibuang duluan (prune_disk).
+
+    mtime file cover di-cache per path, jadi paint() tidak memanggil
+    os.stat(); stat ulang hanya saat cover diminta (refresh=True).
+    """
+
+    def __init__(self, max_bytes=MAX_CACHE_BYTES, disk_dir=None, max_disk_bytes=MAX_DISK_BYTES):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._items = OrderedDict()   # key -> QPixmap
+        self._bytes = 0
+        self._mtimes = {}             # path -> mtime_ns (None kalau file tidak ada)
+
+    # KEY
+    def key(self, path, width, height, refresh=False):
+        if not path:
+            return None
+        if refresh or path not in self._mtimes:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except (OSError, TypeError):
+                mtime = None
+            old = self._mtimes.get(path)
+            if old is not None and old != mtime:
+                self._drop_path(path)
+            self._mtimes[path] = mtime
+        mtime = self._mtimes[path]
+        if mtime is None:
+            return None
+        return (path, mtime, width, height)
+
+    def _drop_path(self, path):
+        """File cover berubah: buang thumbnail versi lama (memori + disk)."""
+        for key in [k for k in self._items if k[0] == path]:
+            self._bytes -= self._cost(self._items.pop(key))
+            disk = self.disk_path(key)
+            if disk:
+                try:
+                    os.remove(disk)
+                except OSError:
+                    pass
+
+    def disk_path(self, key):
+        if not self.disk_dir:
+            return None
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.disk_dir, f"{digest}.png")
+
+    # MEMORY LRU
+    def get(self, key):
+        pixmap = self._items.get(key)
+        if pixmap is not None:
+            self._items.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        if key in self._items:
+            old = self._items.pop(key)
+            self._bytes -= self._cost(old)
+
+        self._items[key] = pixmap
+        self._bytes += self._cost(pixmap)
+
+        # buang yang paling lama tidak dipakai
+        while self._bytes > self.max_bytes and len(self._items) > 1:
+            _, old = self._items.popitem(last=False)
+            self._bytes -= self._cost(old)
+
+    def clear(self):
+        self._items.clear()
+        self._bytes = 0
+        self._mtimes.clear()
+
+    # DISK
+    def prune_disk(self):
+        """Hapus PNG terlama (mtime = terakhir dipakai) sampai di bawah max_disk_bytes."""
+        if not self.disk_dir:
+            return
+        try:
+            entries = [e for e in os.scandir(self.disk_dir) if e.name.endswith(".png")]
+        except OSError:
+            return
+
+        files = []
+        total = 0
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, entry.path))
+            total += st.st_size
+
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * 4
+
+    # LOAD
+    def load(self, path, width, height):
+        """Return QPixmap ukuran (width, height), decode hanya kalau belum ada di cache."""
+        key = self.key(path, width, height, refresh=True)
+        if key is None:
+            return QPixmap()
+
+        pixmap = self.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        image = decode_image(path, width, height, self.disk_path(key))
+        if image.isNull():
+            return QPixmap()
+
+        pixmap = QPixmap.fromImage(image)
+        self.put(key, pixmap)
+        return pixmap
+
+
+def decode_image(path, width, height, disk_path=None):
+    """
+    Decode cover langsung ke ukuran target (tidak decode full-size dulu).
+    Hanya memakai QImage, jadi aman dipanggil dari worker thread.
+    """
+    if disk_path and os.path.exists(disk_path):
+        image = QImage(disk_path)
+        if not image.isNull():
+            try:
+                os.utime(disk_path)     # tandai baru dipakai (untuk prune_disk)
+            except OSError:
+                pass
+            return image
+
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    reader.setScaledSize(QSize(width, height))
+    image = reader.read()
+
+    if not image.isNull() and disk_path:
+        os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+        image.save(disk_path, "PNG")
+    return image
+
+
+# DECODE DI BACKGROUND
+class _DecodeSignals(QObject):
+    finished = pyqtSignal(object, QImage)   # key, image
+
+
+class _PruneJob(QRunnable):
+    def __init__(self, cache):
+        super().__init__()
+        self.cache = cache
+
+    def run(self):
+        self.cache.prune_disk()
+
+
+class _DecodeJob(QRunnable):
+    def __init__(self, key, disk_path, signals):
+        super().__init__()
+        self.key = key
+        self.disk_path = disk_path
+        self.signals = signals
+        self.cancelled = False
+
+    def run(self):
+        if self.cancelled:
+            return
+        path, _, width, height = self.key
+        image = decode_image(path, width, height, self.disk_path)
+        if not self.cancelled:
+            self.signals.finished.emit(self.key, image)
+
+
+class CoverLoader(QObject):
+    """
+    Decode cover di QThreadPool. View langsung tampil dengan placeholder,
+    gambar dipasang saat decode selesai. Request yang sama digabung, dan
+    request dari widget yang sudah dihapus dibatalkan.
+    """
+
+    def __init__(self, cache, max_threads=None):
+        super().__init__()
+        self.cache = cache
+        self.pool = QThreadPool(self)
+        if max_threads is None:
+            max_threads = max(2, QThreadPool.globalInstance().maxThreadCount() - 1)
+        self.pool.setMaxThreadCount(max_threads)
+
+        self._pending = {}    # key -> (job, {ticket: callback})
+        self._tickets = {}    # ticket -> key
+        self._next_ticket = 0
+
+        self._signals = _DecodeSignals()
+        self._signals.finished.connect(self._on_finished)
+
+        # rapikan folder thumbnail sekali saat start, lalu berkala
+        self._decoded = 0
+        self.pool.start(_PruneJob(cache))
+
+    def request(self, path, size, callback):
+        """
+        Minta cover ukuran `size`. Kalau sudah ada di cache, callback langsung
+        dipanggil dan return None; kalau belum, return ticket untuk cancel().
+        """
+        width, height = size
+        key = self.cache.key(path, width, height, refresh=True)
+        if key is None:
+            return None
+
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            callback(pixmap)
+            return None
+
+        self._next_ticket += 1
+        ticket = self._next_ticket
+        self._tickets[ticket] = key
+
+        entry = self._pending.get(key)
+        if entry is None:
+            job = _DecodeJob(key, self.cache.disk_path(key), self._signals)
+            entry = self._pending[key] = (job, {})
+            self.pool.start(job)
+        entry[1][ticket] = callback
+        return ticket
+
+    def cancel(self, ticket):
+        key = self._tickets.pop(ticket, None)
+        if key is None:
+            return
+
+        entry = self._pending.get(key)
+        if entry is None:
+            return
+        job, callbacks = entry
+        callbacks.pop(ticket, None)
+
+        # tidak ada lagi yang menunggu, job di-skip kalau belum jalan
+        if not callbacks:
+            job.cancelled = True
+            del self._pending[key]
+
+    def _on_finished(self, key, image):
+        entry = self._pending.pop(key, None)
+        if entry is None:
+            return
+        if image.isNull():
+            for ticket in entry[1]:
+                self._tickets.pop(ticket, None)
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        self.cache.put(key, pixmap)
+
+        self._decoded += 1
+        if self._decoded % PRUNE_EVERY == 0:
+            self.pool.start(_PruneJob(self.cache))
+
+        for ticket, callback in entry[1].items():
+            self._tickets.pop(ticket, None)
+            callback(pixmap)
+
+
+# cache global dipakai semua view
+_shared_cache = ThumbnailCache(disk_dir=THUMBNAIL_DIR)
+_shared_loader = None
+
+
+def get_thumbnail_cache():
+    return _shared_cache
+
+
+def get_cover_loader():
+    global _shared_loader
+    if _shared_loader is None:
+        _shared_loader = CoverLoader(_shared_cache)
+    return _shared_loader
+
+
+def thumbnail(path, size) -> QPixmap:
+    """Versi sinkron (decode di GUI thread kalau belum ada di cache)."""
+    width, height = size
+    return _shared_cache.load(path, width, height)
+
+
+def load_cover_async(label, path, size):
+    """Pasang cover ke QLabel setelah selesai di-decode di background."""
+    def apply(pixmap):
+        if not sip.isdeleted(label):
+            label.setPixmap(pixmap)
+
+    loader = get_cover_loader()
+    ticket = loader.request(path, size, apply)
+    if ticket is not None:
+        label.destroyed.connect(lambda *_: loader.cancel(ticket))
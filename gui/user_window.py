@@ -2,19 +2,23 @@
 import sys
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-    QLabel, QFrame, QScrollArea, QApplication, QMessageBox, QFileDialog
+    QLabel, QFrame, QScrollArea, QApplication, QMessageBox, QFileDialog,
+    QCompleter, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QStringListModel, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PyQt6.QtCore import QUrl
 
+from controllers.history_store import HistoryStore
+from controllers.paths import user_dir
+from controllers.playback_scheduler import PlaybackScheduler, MODE_HOME, MODE_PLAYLIST
+from controllers.user_state_store import UserStateStore
 from controllers.shared import get_song_controller
+from controllers.song_events import SongChanges
+from controllers import tracing
 from structures.double_linked_list import DoubleLinkedList
-from structures.stack import Stack
+from structures.history import History
 from structures.queue import Queue
 from structures.song import Song
-from structures.multi_linked_list import MultiLinkedList
 
 from gui.views.playlist_view import PlaylistView
 from gui.views.playlist_detail import PlaylistDetailView
@@ -22,12 +26,20 @@ from gui.views.queue_view import QueueView
 from gui.views.favorites_view import FavoritesView
 from gui.views.history_view import HistoryView
 from gui.views.song_card import SongGridView
+from gui.playback_engine import PlaybackEngine
 from gui.icons import icon
 
+SEARCH_DELAY_MS = 250   # jeda ketikan sebelum grid hasil pencarian dibangun
+
+
 class UserWindow(QWidget):
-    def __init__(self, login_window_ref=None):
+    # durasi baru terbaca di worker thread metadata (diteruskan ke GUI thread)
+    metadata_ready = pyqtSignal()
+
+    def __init__(self, login_window_ref=None, username=None):
         super().__init__()
         self.login_window_ref = login_window_ref
+        self.username = username
         self.setWindowTitle("Music Player - User")
         self.setGeometry(120, 60, 1200, 780)
 
@@ -35,34 +47,63 @@ class UserWindow(QWidget):
         self.controller = get_song_controller()
 
         # Data structures
-        self.playlist = DoubleLinkedList()
+        self.playlist = DoubleLinkedList(index_by_id=True)
         self.queue = Queue()
-        self.history = Stack()
+        self.history = History()
         self.favorites = set()
+
+        # riwayat putar tersimpan per user
+        self.history_store = HistoryStore(user_dir(username)) if username else None
+        self._load_history()
         self.is_playing = False
-        self.vibe_mll = MultiLinkedList()
-        
-        # Inisialisasi player audio
-        self.audio_output = QAudioOutput()
-        self.player = QMediaPlayer()
-        self.player.setAudioOutput(self.audio_output)
-        self.audio_output.setVolume(0.5)   # 50% volume
+
+        # Penentu lagu berikutnya: antrian -> vibe (home) -> playlist DLL
+        self.scheduler = PlaybackScheduler(
+            self.queue, self.playlist,
+            vibe_next=self.controller.get_next_same_vibe,
+            vibe_prev=self.controller.get_prev_same_vibe,
+            on_queue_changed=self._queue_changed,
+            vibe_neighbor=self.controller.get_vibe_neighbor,
+        )
+
+        # Inisialisasi player audio (dua deck, lagu berikutnya dimuat duluan)
+        self.engine = PlaybackEngine(resolver=self.scheduler.peek_next, volume=0.5, parent=self)
+        self.scheduler.subscribe_upcoming(self.engine.preload)
+        self.scheduler.subscribe_upcoming(self.controller.prefetch_metadata)
+        self.engine.advanced.connect(self._on_track_advanced)
+        self.engine.finished.connect(self._on_playback_finished)
 
         # Load all songs awal ke playlist utama
         all_songs = self.controller.get_all_songs()
         for s in all_songs:
             self.playlist.add_last(s)
-            self.vibe_mll.add_song(s)
         self.playlist.current = None
 
         # Named playlists
         self.playlists: dict[str, DoubleLinkedList] = {}
         self.playlist_covers: dict[str, str] = {}   # namenya path cover
 
+        # playlist, favorit, dan antrian tersimpan per user
+        self.state_store = UserStateStore(user_dir(username)) if username else None
+        self._load_user_state()
+
         # View state
         self.current_view_name = "all_songs"
         self.viewing_playlist_name: str | None = None
 
+        # View cache: nama view -> (view, halaman di stack)
+        self._views: dict[str, tuple[QWidget, QWidget]] = {}
+        self._dirty_views: set[str] = set()
+
+        # perubahan katalog dari admin, ditambal per lagu
+        self._pending_changes: SongChanges | None = None
+        self.controller.subscribe(self._on_catalog_changed)
+
+        # durasi lagu dari worker thread ikut jadi event "updated" di GUI thread
+        self._metadata_waker = self.metadata_ready.emit
+        self.metadata_ready.connect(self.controller.apply_metadata)
+        self.controller.subscribe_metadata(self._metadata_waker)
+
         # ROOT LAYOUT
         root = QHBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -146,7 +187,25 @@ class UserWindow(QWidget):
         self.search = QLineEdit()
         self.search.setPlaceholderText("Search for music, artists, or playlists...")
         self.search.setMinimumHeight(42)
-        self.search.textChanged.connect(self._on_search_text)
+
+        # autocomplete dari Trie di controller
+        self.suggestion_model = QStringListModel(self)
+        self.completer = QCompleter(self.suggestion_model, self)
+        self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.search.setCompleter(self.completer)
+
+        # pencarian ditunda sampai user berhenti mengetik; Enter atau memilih
+        # saran langsung mencari tanpa menunggu
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._run_search)
+
+        self.search.textEdited.connect(self._update_suggestions)
+        self.search.textChanged.connect(self._schedule_search)
+        self.search.returnPressed.connect(self._run_search)
+        self.completer.activated.connect(self._run_search)
         h.addWidget(self.search)
 
         return header
@@ -187,21 +246,53 @@ class UserWindow(QWidget):
         v.setContentsMargins(0, 0, 0, 0)
         v.setSpacing(0)
 
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("border:none;")
-
-        self._current_view_widget = QWidget()
-        self.scroll.setWidget(self._current_view_widget)
+        # setiap view dibuat sekali lalu disimpan di stack
+        self.stack = QStackedWidget()
+        self._current_view_widget = None
 
-        v.addWidget(self.scroll)
+        v.addWidget(self.stack)
         return container
 
+    # VIEW CACHE
+    def _mark_dirty(self, *view_names: str):
+        """Tandai view yang datanya berubah, di-refresh saat ditampilkan."""
+        self._dirty_views.update(view_names)
+
+    def _cached_view(self, view_name: str, create, refresh, scrollable=True):
+        """
+        Ambil view dari cache. Dibuat sekali lewat create(); setelah itu hanya
+        refresh(view) kalau view ditandai dirty.
+        """
+        if view_name not in self._views:
+            view = create()
+            page = view
+            if scrollable:
+                page = QScrollArea()
+                page.setWidgetResizable(True)
+                page.setStyleSheet("border:none;")
+                page.setWidget(view)
+            self.stack.addWidget(page)
+            self._views[view_name] = (view, page)
+            self._dirty_views.discard(view_name)
+            return view
+
+        view = self._views[view_name][0]
+        if view_name in self._dirty_views:
+            self._dirty_views.discard(view_name)
+            refresh(view)
+        return view
+
+    def _built_view(self, view_name: str):
+        """View di cache (None kalau belum pernah dibuat), untuk ditambal langsung."""
+        entry = self._views.get(view_name)
+        return entry[0] if entry else None
+
+    @tracing.traced("UserWindow._set_central_widget")
     def _set_central_widget(self, widget: QWidget, view_name: str):
-        self._current_view_widget.setParent(None)
+        self.stack.setCurrentWidget(self._views[view_name][1])
         self._current_view_widget = widget
-        self.scroll.setWidget(self._current_view_widget)
         self.current_view_name = view_name
+        self.scheduler.set_mode(MODE_HOME if view_name == "all_songs" else MODE_PLAYLIST)
 
     # PLAYER BAR
     def _player_bar(self):
@@ -245,6 +336,20 @@ class UserWindow(QWidget):
         h.addWidget(self.lbl_now)
         h.addStretch()
 
+        # geser vibe: sel terdekat di grid mood / energy (MultiLinkedList)
+        for text, tip, axis, direction in (
+            ("Mood −", "Vibe terdekat yang lebih sedih", "mood", -1),
+            ("Mood +", "Vibe terdekat yang lebih senang", "mood", 1),
+            ("Energy −", "Vibe terdekat yang lebih tenang", "energy", -1),
+            ("Energy +", "Vibe terdekat yang lebih bersemangat", "energy", 1),
+        ):
+            btn = QPushButton(text)
+            btn.setToolTip(tip)
+            btn.setProperty("buttonRole", "secondary")
+            btn.setFixedHeight(34)
+            btn.clicked.connect(lambda _, a=axis, d=direction: self._shift_vibe(a, d))
+            h.addWidget(btn)
+
         return bar
 
     # VIEW SWITCHING
@@ -254,8 +359,12 @@ class UserWindow(QWidget):
         self.back_btn.hide()
         self.viewing_playlist_name = "All Songs"
 
-        songs = self.controller.get_all_songs()
-        view = SongGridView(parent_window=self, songs=songs)
+        view = self._cached_view(
+            "all_songs",
+            lambda: SongGridView(parent_window=self, songs=self.controller.get_all_songs()),
+            lambda v: v.set_songs(self.controller.get_all_songs()),
+            scrollable=False,
+        )
         self._set_central_widget(view, "all_songs")
 
     def _show_playlist_view(self):
@@ -264,7 +373,11 @@ class UserWindow(QWidget):
         self.back_btn.hide()
         self.viewing_playlist_name = None
 
-        view = PlaylistView(parent_window=self)
+        view = self._cached_view(
+            "playlists",
+            lambda: PlaylistView(parent_window=self),
+            lambda v: v.refresh(),
+        )
         self._set_central_widget(view, "playlists")
 
     def _show_playlist_detail(self, name: str, dll: DoubleLinkedList):
@@ -273,28 +386,48 @@ class UserWindow(QWidget):
         self.back_btn.show()
         self.viewing_playlist_name = name
 
-        view = PlaylistDetailView(parent_window=self, playlist_name=name, dll=dll)
+        view = self._cached_view(
+            "playlist_detail",
+            lambda: PlaylistDetailView(parent_window=self, playlist_name=name, dll=dll),
+            lambda v: v.set_playlist(name, dll),
+            scrollable=False,
+        )
+        if view.dll is not dll or view.playlist_name != name:
+            view.set_playlist(name, dll)
         self._set_central_widget(view, "playlist_detail")
 
     def _show_queue_view(self):
         self.title_lbl.setText("Queue")
         self.create_btn.hide()
         self.back_btn.show()
-        view = QueueView(parent_window=self, queue=self.queue)
+        view = self._cached_view(
+            "queue",
+            lambda: QueueView(parent_window=self, queue=self.queue),
+            lambda v: v.refresh(),
+            scrollable=False,
+        )
         self._set_central_widget(view, "queue")
 
     def _show_favorites_view(self):
         self.title_lbl.setText("Favorite Song")
         self.create_btn.hide()
         self.back_btn.show()
-        view = FavoritesView(parent_window=self)
+        view = self._cached_view(
+            "favorites",
+            lambda: FavoritesView(parent_window=self),
+            lambda v: v.refresh(),
+        )
         self._set_central_widget(view, "favorites")
 
     def _show_history_view(self):
         self.title_lbl.setText("Playback History")
         self.create_btn.hide()
         self.back_btn.show()
-        view = HistoryView(parent_window=self)
+        view = self._cached_view(
+            "history",
+            lambda: HistoryView(parent_window=self),
+            lambda v: v.refresh(),
+        )
         self._set_central_widget(view, "history")
 
     def _show_search_results(self, text: str):
@@ -302,10 +435,31 @@ class UserWindow(QWidget):
         self.title_lbl.setText(f"Search: {text}")
         self.create_btn.hide()
         self.back_btn.show()
-        view = SongGridView(parent_window=self, songs=songs)
+        view = self._cached_view(
+            "search",
+            lambda: SongGridView(parent_window=self, songs=songs),
+            lambda v: None,
+            scrollable=False,
+        )
+        if view.songs is not songs:
+            view.set_songs(songs)
         self._set_central_widget(view, "search")
 
     # SEARCH HANDLER
+    def _update_suggestions(self, text: str):
+        self.suggestion_model.setStringList(self.controller.suggest(text.strip()))
+
+    def _schedule_search(self, text: str):
+        if not text.strip():
+            # kotak dikosongkan: langsung kembali ke view sebelumnya
+            self._run_search()
+            return
+        self._search_timer.start()
+
+    def _run_search(self, *_):
+        self._search_timer.stop()
+        self._on_search_text(self.search.text())
+
     def _on_search_text(self, text: str):
         text = text.strip()
         if text == "":
@@ -381,7 +535,7 @@ class UserWindow(QWidget):
                 QMessageBox.warning(self, "Failed", "A playlist with this name already exists.")
                 return
 
-            self.playlists[name] = DoubleLinkedList()
+            self.playlists[name] = DoubleLinkedList(index_by_id=True)
             cover_path, _ = QFileDialog.getOpenFileName(
                 self,
                 "Pilih Cover Playlist",
@@ -391,6 +545,7 @@ class UserWindow(QWidget):
             if cover_path:
                 self.playlist_covers[name] = cover_path
 
+            self._playlist_changed(name)
             QMessageBox.information(self, "Playlist Created", f"Playlist '{name}' has been created!")
             self._show_playlist_view()
 
@@ -398,11 +553,16 @@ class UserWindow(QWidget):
         if new_name in self.playlists:
             QMessageBox.warning(self, "Failed", "A playlist with this name already exists.")
             return False
-        self.playlists[new_name] = self.playlists.pop(old_name)
+        # ganti key di tempat supaya urutan playlist tidak berubah
+        self.playlists = {new_name if name == old_name else name: dll
+                          for name, dll in self.playlists.items()}
         if old_name in self.playlist_covers:
             self.playlist_covers[new_name] = self.playlist_covers.pop(old_name)
         if self.viewing_playlist_name == old_name:
             self.viewing_playlist_name = new_name
+        if self.state_store:
+            self.state_store.rename_playlist(old_name, new_name)
+        self._playlist_changed(new_name)
         QMessageBox.information(self, "Berhasil", "Playlist berhasil diubah.")
         self._show_playlist_view()
         return True
@@ -417,6 +577,7 @@ class UserWindow(QWidget):
         removed = dll.remove(song)
 
         if removed:
+            self._playlist_changed(name)
             QMessageBox.information(
                 self,
                 "Deleted",
@@ -434,6 +595,12 @@ class UserWindow(QWidget):
         if name in self.playlist_covers:
             self.playlist_covers.pop(name)
 
+        if self.state_store:
+            self.state_store.delete_playlist(name)
+        self._mark_dirty("playlist_detail")
+        view = self._built_view("playlists")
+        if view:
+            view.update_playlist(name)
         QMessageBox.information(self, "Dihapus", "Playlist berhasil dihapus.")
         self._show_playlist_view()
 
@@ -474,6 +641,7 @@ class UserWindow(QWidget):
 
             song = songs[selected]
             self.playlists[playlist_name].add_last(song)
+            self._playlist_changed(playlist_name)
 
             QMessageBox.information(self, "Succeed", f"Music '{song.judul}' added.")
             self._show_playlist_view()
@@ -485,12 +653,30 @@ class UserWindow(QWidget):
         # sudah favorit maka hapus
         if key in self.favorites:
             self.favorites.remove(key)
+            if self.state_store:
+                self.state_store.set_favorite(key, False)
+            self._favorite_changed(song, False)
             return False
 
         # belum favorit maka tambah
         self.favorites.add(key)
+        if self.state_store:
+            self.state_store.set_favorite(key, True)
+        self._favorite_changed(song, True)
         return True
 
+    def _favorite_changed(self, song, state):
+        """Tambal kartu favorit dan tanda ♥ di history, tanpa membangun ulang view."""
+        favorites_view = self._built_view("favorites")
+        if favorites_view:
+            if state:
+                favorites_view.add_song(song)
+            else:
+                favorites_view.remove_song(song.id)
+        history_view = self._built_view("history")
+        if history_view:
+            history_view.set_favorited(song.id, state)
+
 
     def get_favorite_songs(self):
         fav_list = []
@@ -506,15 +692,79 @@ class UserWindow(QWidget):
         key = song.id
         if key in self.favorites:
             self.favorites.remove(key)
+            if self.state_store:
+                self.state_store.set_favorite(key, False)
+            self._favorite_changed(song, False)
 
     # QUEUE & HISTORY HELPERS
     def add_to_queue(self, song: Song, show_message=True):
         self.queue.enqueue(song)
+        self._queue_changed()
         if show_message:
             QMessageBox.information(self, "Queue", f"'{song.judul}' added to queue.")
 
     def record_history(self, song: Song):
         self.history.push(song)
+        if self.history_store:
+            self.history_store.append(song.id)
+        view = self._built_view("history")
+        if view:
+            view.push_song(song)
+
+    # PENYIMPANAN DATA USER
+    def _load_user_state(self):
+        """Isi playlist, favorit, dan antrian dari state store (sekali saat login)."""
+        if not self.state_store:
+            return
+        state = self.state_store.load()
+        find = self.controller.find_song_by_id
+
+        for name, cover_path, song_ids in state["playlists"]:
+            dll = DoubleLinkedList(index_by_id=True)
+            for song_id in song_ids:
+                song = find(song_id)
+                if song:
+                    dll.add_last(song)
+            self.playlists[name] = dll
+            if cover_path:
+                self.playlist_covers[name] = cover_path
+
+        self.favorites.update(song_id for song_id in state["favorites"] if find(song_id))
+
+        for song_id in state["queue"]:
+            song = find(song_id)
+            if song:
+                self.queue.enqueue(song)
+
+    def _playlist_changed(self, name: str):
+        """Dipanggil setiap isi / cover playlist berubah."""
+        self._mark_dirty("playlist_detail")
+        view = self._built_view("playlists")
+        if view:
+            view.update_playlist(name)
+        dll = self.playlists.get(name)
+        if self.state_store and dll is not None:
+            self.state_store.save_playlist(
+                name, [s.id for s in dll.to_list()], self.playlist_covers.get(name)
+            )
+
+    def _queue_changed(self):
+        self._mark_dirty("queue")
+        if self.state_store:
+            self.state_store.save_queue([s.id for s in self.queue])
+        # lagu berikutnya mungkin berubah
+        if self.engine.current_song is not None:
+            self.scheduler.refresh_upcoming()
+
+    def _load_history(self):
+        """Isi History dari log di disk (hanya entri terakhir sebanyak kapasitas)."""
+        if not self.history_store:
+            return
+        entries = self.history_store.last(self.history.capacity)
+        for _, song_id in reversed(entries):
+            song = self.controller.find_song_by_id(song_id)
+            if song:
+                self.history.push(song)
 
     # PLAYBACK
     def _play_playlist_first(self, dll: DoubleLinkedList):
@@ -534,18 +784,20 @@ class UserWindow(QWidget):
         self._play_song(song)
 
         # Jika ada di queue, hapus
-        temp = Queue()
-        removed = False
-        while not self.queue.is_empty():
-            s = self.queue.dequeue()
-            if s == song and not removed:
-                removed = True
-                continue
-            temp.enqueue(s)
-        self.queue = temp
+        if self.queue.remove(song):
+            self._queue_changed()
 
 
     def _play_song(self, song: Song):
+        # span async selesai saat audio pertama siap (lihat PlaybackEngine)
+        token = tracing.begin("UserWindow._play_song", song=song.judul)
+        with tracing.span("UserWindow._play_song (sync)"):
+            self._set_now_playing(song)
+
+            # === PEMUTARAN AUDIO ===
+            self.engine.play(song, trace=token)
+
+    def _set_now_playing(self, song: Song):
         # rekam history
         self.record_history(song)
         self.is_playing = True
@@ -553,15 +805,25 @@ class UserWindow(QWidget):
         self.lbl_now.setText(f"Now Playing: {song.judul} - {song.artis}")
 
         # arahkan DLL playlist ke lagu ini
-        node = self.playlist.jump_to_song(song)
-        if not node:
-            self.playlist.add_last(song)
-            self.playlist.current = self.playlist.tail
+        self.scheduler.set_current(song)
+
+    def _on_track_advanced(self, song: Song):
+        """
+        Lagu habis dan engine sudah memutar lagu cadangan; scheduler ikut maju.
+        Tidak ada view yang dibangun ulang di sini (kecuali queue yang sedang tampil).
+        """
+        nxt = self.scheduler.advance()
+        if nxt is not song and nxt is not None:
+            # tebakan meleset (state berubah setelah preload), putar yang benar
+            self._play_song(nxt)
+            return
+        self._set_now_playing(song)
+        if self.current_view_name == "queue":
+            self._show_queue_view()
 
-        # === PEMUTARAN AUDIO ===
-        if song.file_path:
-            self.player.setSource(QUrl.fromLocalFile(song.file_path))
-            self.player.play()
+    def _on_playback_finished(self):
+        self.is_playing = False
+        self.btn_play.setIcon(icon("play_arrow"))
 
     def _play_or_pause(self):
         if not self.playlist.current:
@@ -571,133 +833,111 @@ class UserWindow(QWidget):
             return
 
         if self.is_playing:
-            self.player.pause()
+            self.engine.pause()
             cur = self.playlist.current.data
             self.lbl_now.setText(f"Paused: {cur.judul}")
             self.btn_play.setIcon(icon("play_arrow"))
             self.is_playing = False
         else:
-            self.player.play()
+            self.engine.resume()
             cur = self.playlist.current.data
             self.lbl_now.setText(f"Now Playing: {cur.judul} - {cur.artis}")
             self.btn_play.setIcon(icon("pause"))
             self.is_playing = True
 
     def _next(self):
-        # 1. Prioritas ANTRIAN dulu
-        if not self.queue.is_empty():
-            next_song = self.queue.dequeue()
-            self._play_song(next_song)
-            if self.current_view_name == "queue":
-                self._show_queue_view()
-            return
-
-        # 2. Jika BUKAN di HOME, maka playlist navigation
-        if self.current_view_name != "all_songs":
-            nxt = self.playlist.next_song()
-            if nxt:
-                self._play_song(nxt)
-            else:
-                QMessageBox.information(self, "Info", "There is no next song.")
+        # antrian -> vibe (home) -> playlist DLL, lihat PlaybackScheduler
+        from_queue = not self.queue.is_empty()
+        nxt = self.scheduler.advance()
+        if not nxt:
+            QMessageBox.information(self, "Info", "There is no next song.")
             return
 
-        # 3. HOME MODE: berdasarkan Vibe dulu
-        if self.playlist.current:
-            current_song = self.playlist.current.data
-            vibe_next = self.controller.get_next_same_vibe(current_song)
-
-            if vibe_next:
-                self._play_song(vibe_next)
-                return
+        self._play_song(nxt)
+        if from_queue and self.current_view_name == "queue":
+            self._show_queue_view()
 
-        # 4. FALLBACK memakai DLL (All Songs)
-        nxt = self.playlist.next_song()
-        if nxt:
-            self._play_song(nxt)
+    def _shift_vibe(self, axis, direction):
+        song = self.scheduler.shift_vibe(axis, direction)
+        if song:
+            self._play_song(song)
         else:
-            QMessageBox.information(self, "Info", "There is no next song.")
+            QMessageBox.information(self, "Info", "There is no vibe in that direction.")
 
     def _prev(self):
-        # playlist mode maka DLL biasa
-        if self.current_view_name != "all_songs":
-            prev = self.playlist.prev_song()
-            if prev:
-                self._play_song(prev)
-            else:
-                QMessageBox.information(self, "Info", "There is no previous song.")
-            return
-
-        # HOME mode: VIBE first
-        if self.playlist.current:
-            current_song = self.playlist.current.data
-            vibe_prev = self.controller.get_prev_same_vibe(current_song)
-
-            if vibe_prev:
-                self._play_song(vibe_prev)
-                return
-
-        # fallback dll
-        prev = self.playlist.prev_song()
+        prev = self.scheduler.prev()
         if prev:
             self._play_song(prev)
         else:
             QMessageBox.information(self, "Info", "There is no previous song.")
 
-    # REFRESH DARI ADMIN
-    def refresh_songs_from_controller(self):
-        all_songs = self.controller.get_all_songs()
+    # PERUBAHAN KATALOG DARI ADMIN
+    def _on_catalog_changed(self, changes: SongChanges):
+        """Kumpulkan perubahan, ditambal sekali setelah event loop kembali."""
+        if self._pending_changes is None:
+            self._pending_changes = SongChanges()
+            QTimer.singleShot(0, self._apply_catalog_changes)
+        self._pending_changes.merge(changes)
+
+    def _apply_catalog_changes(self):
+        changes, self._pending_changes = self._pending_changes, None
+        if not changes:
+            return
 
-        self.playlist.clear()
-        for s in all_songs:
-            self.playlist.add_last(s)
+        # data: hanya lagu yang berubah yang disentuh
+        for song in changes.added.values():
+            self.playlist.add_last(song)
 
-        for name, dll in list(self.playlists.items()):
-            new_dll = DoubleLinkedList()
-            for song in dll.to_list():
-                if self.controller.find_song(song.judul, song.artis):
-                    new_dll.add_last(song)
-            self.playlists[name] = new_dll
-
-        new_fav = set()
-        for (j, a) in self.favorites:
-            if self.controller.find_song(j, a):
-                new_fav.add((j, a))
-        self.favorites = new_fav
-
-        new_q = Queue()
-        while not self.queue.is_empty():
-            s = self.queue.dequeue()
-            if self.controller.find_song(s.judul, s.artis):
-                new_q.enqueue(s)
-        self.queue = new_q
-
-        if self.playlist.current:
-            cur_song = self.playlist.current.data
-            if not self.controller.find_song(cur_song.judul, cur_song.artis):
+        queue_changed = False
+        for song_id in changes.removed:
+            cur = self.playlist.current
+            if cur and cur.data.id == song_id:
                 self.playlist.current = None
                 self.lbl_now.setText("No song is playing")
-
-        self.refresh_current_view()
-
-    def refresh_current_view(self):
-        if self.current_view_name == "playlists":
-            self._show_playlist_view()
-        elif self.current_view_name == "all_songs":
-            self._show_all_songs()
-        elif self.current_view_name == "playlist_detail":
-            if self.viewing_playlist_name and self.viewing_playlist_name in self.playlists:
-                dll = self.playlists[self.viewing_playlist_name]
-                self._show_playlist_detail(self.viewing_playlist_name, dll)
-            else:
-                self._show_all_songs()
-        elif self.current_view_name == "favorites":
-            self._show_favorites_view()
-        elif self.current_view_name == "history":
-            self._show_history_view()
-        elif self.current_view_name == "queue":
+            # lagu yang diputar / sudah dimuat di deck cadangan ikut dilepas
+            if self.engine.discard(song_id):
+                self._on_playback_finished()
+                self.lbl_now.setText("No song is playing")
+            self.playlist.remove_all_by_id(song_id)
+
+            for name, dll in self.playlists.items():
+                if dll.remove_all_by_id(song_id):
+                    self._playlist_changed(name)
+
+            if song_id in self.favorites:
+                self.favorites.discard(song_id)
+                if self.state_store:
+                    self.state_store.set_favorite(song_id, False)
+                self._favorite_changed(changes.removed[song_id], False)
+
+            if self.queue.remove_all_by_id(song_id):
+                queue_changed = True
+
+        if queue_changed:
+            self._queue_changed()
+        elif changes.removed and self.engine.current_song is not None:
+            # tebakan berikutnya bisa jadi lagu yang dihapus: preload ulang
+            self.scheduler.refresh_upcoming()
+
+        # view: grid lagu ditambal per baris
+        if "all_songs" in self._views:
+            self._views["all_songs"][0].apply_changes(changes, append_added=True)
+        if "search" in self._views:
+            self._views["search"][0].apply_changes(changes)
+        if "playlist_detail" in self._views:
+            self._views["playlist_detail"][0].grid_view.apply_changes(changes)
+
+        # favorit & history: hanya kartu / baris lagu yang diedit
+        if changes.updated:
+            for view_name in ("favorites", "history"):
+                view = self._built_view(view_name)
+                if view:
+                    view.update_songs(changes.updated)
+
+        # antrian cukup di-refresh saat ditampilkan
+        self._mark_dirty("queue")
+        if self.current_view_name == "queue":
             self._show_queue_view()
-        elif self.current_view_name == "search":
-            self._show_search_results(self.search.text())
 
     # BACK BUTTON
     def _back_from_detail(self):
@@ -707,6 +947,23 @@ class UserWindow(QWidget):
             self._show_all_songs()
 
     # LOGOUT
+    def shutdown(self):
+        """Dipanggil sebelum window dibuang (ganti user): simpan dan lepas semua resource."""
+        self.controller.unsubscribe(self._on_catalog_changed)
+        self.controller.unsubscribe_metadata(self._metadata_waker)
+        self.engine.stop()
+        if self.history_store:
+            self.history_store.close()
+        if self.state_store:
+            self.state_store.close()
+
+    def closeEvent(self, event):
+        if self.history_store:
+            self.history_store.flush()
+        if self.state_store:
+            self.state_store.flush()
+        super().closeEvent(event)
+
     def _action_logout(self):
         if self.login_window_ref:
             self.close()
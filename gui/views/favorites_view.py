@@ -4,8 +4,10 @@ from PyQt6.QtWidgets import (
     QPushButton, QHBoxLayout, QDialog, QListWidget, QDialogButtonBox
 )
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QPixmap
+from PyQt6.QtGui import QFont
 
+from controllers.tracing import traced
+from gui.thumbnails import load_cover_async, FAVORITE_CARD_SIZE
 from structures.song import Song
 
 
@@ -44,14 +46,13 @@ class FavoriteCard(QFrame):
         cover.setFixedSize(260, 150)
         cover.setScaledContents(True)
 
+        cover.setStyleSheet("""
+            background-color:#313137;
+            border-radius:14px;
+            border:1px solid #3A5256;
+        """)
         if song.cover_path:
-            cover.setPixmap(QPixmap(song.cover_path))
-        else:
-            cover.setStyleSheet("""
-                background-color:#313137;
-                border-radius:14px;
-                border:1px solid #3A5256;
-            """)
+            load_cover_async(cover, song.cover_path, FAVORITE_CARD_SIZE)
         layout.addWidget(cover, alignment=Qt.AlignmentFlag.AlignCenter)
 
         # Title
@@ -137,7 +138,6 @@ class FavoriteCard(QFrame):
     # REMOVE FAVORITE
     def _remove_favorite(self):
         self.parent_window.remove_favorite(self.song)
-        self.parent_window._show_favorites_view()
 
     # ADD TO PLAYLIST (dialog pilih playlist)
     def _add_to_playlist_dialog(self):
@@ -180,35 +180,85 @@ class FavoritesView(QWidget):
     """
     Menampilkan daftar lagu favorit dalam bentuk grid 3 kolom
     """
+    @traced
     def __init__(self, parent_window):
         super().__init__()
         self.parent_window = parent_window
 
         root = QVBoxLayout(self)
-        root.setContentsMargins(10, 10, 10, 10)
-        root.setSpacing(14)
+        root.setContentsMargins(0, 0, 0, 0)
 
-        fav_songs = parent_window.get_favorite_songs()
-
-        if not fav_songs:
-            empty = QLabel("There are no favorite songs yet.\nClick the ♥ icon on the song.")
-            empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty.setStyleSheet("color:#ABAAA5; font-size:15px;")
-            root.addWidget(empty)
-            return
+        self.body = None
+        self.refresh()
 
-        grid = QGridLayout()
-        grid.setSpacing(18)
+    # REFRESH (BUAT ULANG ISI, VIEW TETAP)
+    @traced
+    def refresh(self):
+        if self.body is not None:
+            self.body.setParent(None)
+            self.body.deleteLater()
 
+        self.body = QWidget()
+        root = QVBoxLayout(self.body)
+        root.setContentsMargins(10, 10, 10, 10)
+        root.setSpacing(14)
+        self.layout().addWidget(self.body)
+
+        self.empty = QLabel("There are no favorite songs yet.\nClick the ♥ icon on the song.")
+        self.empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty.setStyleSheet("color:#ABAAA5; font-size:15px;")
+        root.addWidget(self.empty)
+
+        self.grid = QGridLayout()
+        self.grid.setSpacing(18)
+        root.addLayout(self.grid)
+        root.addStretch()
+
+        # song.id -> kartu, urutan dict = urutan di grid
+        self.cards = {}
+        for s in self.parent_window.get_favorite_songs():
+            self.cards[s.id] = FavoriteCard(self.parent_window, s)
+        self._layout_cards()
+
+    def _layout_cards(self, start=0):
+        """
+        Tempatkan kartu mulai posisi `start` (kartu tidak dibuat ulang).
+        Kartu sebelum start tidak bergeser, jadi tidak disentuh.
+        """
         MAX_COL = 3
-        row = col = 0
-
-        for s in fav_songs:
-            card = FavoriteCard(parent_window, s)
-            grid.addWidget(card, row, col)
-            col += 1
-            if col >= MAX_COL:
-                col = 0
-                row += 1
-
-        root.addLayout(grid)
\ No newline at end of file
+        cards = list(self.cards.values())
+        for i in range(start, len(cards)):
+            self.grid.removeWidget(cards[i])
+            self.grid.addWidget(cards[i], i // MAX_COL, i % MAX_COL)
+        self.empty.setVisible(not self.cards)
+
+    # TAMBAL PER KARTU
+    def add_song(self, song: Song):
+        if song.id not in self.cards:
+            self.cards[song.id] = FavoriteCard(self.parent_window, song)
+            # kartu baru selalu di ujung: cukup tempatkan kartu itu
+            self._layout_cards(len(self.cards) - 1)
+
+    def remove_song(self, song_id):
+        if song_id not in self.cards:
+            return
+        index = list(self.cards).index(song_id)
+        card = self.cards.pop(song_id)
+        self.grid.removeWidget(card)
+        card.hide()
+        card.deleteLater()
+        # hanya kartu setelahnya yang mundur satu posisi
+        self._layout_cards(index)
+
+    @traced
+    def update_songs(self, songs):
+        """Buat ulang hanya kartu yang lagunya diedit (songs: id -> Song)."""
+        for song_id, song in songs.items():
+            old = self.cards.get(song_id)
+            if old is None:
+                continue
+            card = FavoriteCard(self.parent_window, song)
+            self.grid.replaceWidget(old, card)
+            self.cards[song_id] = card
+            old.hide()
+            old.deleteLater()
@@ -3,10 +3,12 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame
 )
-from PyQt6.QtGui import QFont, QPixmap  
+from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
 
-from structures.stack import Stack
+from controllers.tracing import traced
+from gui.thumbnails import load_cover_async, ROW_SIZE
+
 from structures.song import Song
 
 
@@ -37,14 +39,13 @@ class HistoryListItem(QFrame):
         thumb.setFixedSize(64, 64)
         thumb.setScaledContents(True)
 
+        thumb.setStyleSheet("""
+            background-color:#313137;
+            border-radius:8px;
+            border: 1px solid #3A5256;
+        """)
         if song.cover_path:
-            thumb.setPixmap(QPixmap(song.cover_path))
-        else:
-            thumb.setStyleSheet("""
-                background-color:#313137;
-                border-radius:8px;
-                border: 1px solid #3A5256;
-            """)
+            load_cover_async(thumb, song.cover_path, ROW_SIZE)
 
         h.addWidget(thumb)
 
@@ -70,21 +71,10 @@ class HistoryListItem(QFrame):
         self.btn_fav.setFixedSize(38, 38)
         self.btn_fav.setStyleSheet("border:none; background:transparent; font-size:22px;")
 
-        if is_favorited:
-            self.btn_fav.setText("♥")
-            self.btn_fav.setStyleSheet("color:#F92D44; border:none; background:transparent; font-size:22px;")
-        else:
-            self.btn_fav.setText("♡")
-            self.btn_fav.setStyleSheet("color:#ABAAA5; border:none; background:transparent; font-size:22px;")
+        self.set_favorited(is_favorited)
 
         def toggle():
-            state = self.parent_window.toggle_favorite(song)
-            if state:
-                self.btn_fav.setText("♥")
-                self.btn_fav.setStyleSheet("color:#F92D44; border:none; background:transparent; font-size:22px;")
-            else:
-                self.btn_fav.setText("♡")
-                self.btn_fav.setStyleSheet("color:#ABAAA5; border:none; background:transparent; font-size:22px;")
+            self.set_favorited(self.parent_window.toggle_favorite(song))
 
         self.btn_fav.clicked.connect(toggle)
         action_box.addWidget(self.btn_fav)
@@ -125,46 +115,93 @@ class HistoryListItem(QFrame):
 
         h.addLayout(action_box)
 
+    def set_favorited(self, state):
+        if state:
+            self.btn_fav.setText("♥")
+            self.btn_fav.setStyleSheet("color:#F92D44; border:none; background:transparent; font-size:22px;")
+        else:
+            self.btn_fav.setText("♡")
+            self.btn_fav.setStyleSheet("color:#ABAAA5; border:none; background:transparent; font-size:22px;")
+
 
 class HistoryView(QWidget):
     """
-    Menampilkan riwayat lagu (Stack) dalam bentuk list elegan modern
+    Menampilkan riwayat lagu (History) dalam bentuk list elegan modern
     (tanpa judul double—title sudah di UserWindow)
     """
+    @traced
     def __init__(self, parent_window):
         super().__init__()
         self.parent_window = parent_window
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(14)
+        root = QVBoxLayout(self)
+        root.setContentsMargins(0, 0, 0, 0)
 
-        # Copy stack
-        temp = Stack()
-        songs = []
+        self.body = None
+        self.refresh()
 
-        while not self.parent_window.history.is_empty():
-            s = self.parent_window.history.pop()
-            songs.append(s)
-            temp.push(s)
+    # REFRESH (BUAT ULANG ISI, VIEW TETAP)
+    @traced
+    def refresh(self):
+        if self.body is not None:
+            self.body.setParent(None)
+            self.body.deleteLater()
 
-        # Kembalikan isi stack
-        while not temp.is_empty():
-            self.parent_window.history.push(temp.pop())
+        self.body = QWidget()
+        self.list_layout = QVBoxLayout(self.body)
+        self.list_layout.setContentsMargins(12, 12, 12, 12)
+        self.list_layout.setSpacing(14)
+        self.layout().addWidget(self.body)
 
         # Empty state
-        if not songs:
-            empty = QLabel("No songs have been played yet.")
-            empty.setStyleSheet("color:#ABAAA5; font-size:15px;")
-            empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(empty)
-            return
-
-        # Tampilkan lagu terbaru paling atas
-        for s in songs[::-1]:
-            key = (s.judul, s.artis)
-            is_fav = key in self.parent_window.favorites
-            item = HistoryListItem(parent_window, s, is_favorited=is_fav)
-            layout.addWidget(item)
-
-        layout.addStretch()
\ No newline at end of file
+        self.empty = QLabel("No songs have been played yet.")
+        self.empty.setStyleSheet("color:#ABAAA5; font-size:15px;")
+        self.empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.list_layout.addWidget(self.empty)
+
+        # Tampilkan lagu terbaru paling atas (iterasi history tidak mengubah isinya)
+        self.items = []
+        favorites = self.parent_window.favorites
+        for s in self.parent_window.history:
+            item = HistoryListItem(self.parent_window, s, is_favorited=s.id in favorites)
+            self.items.append(item)
+            self.list_layout.addWidget(item)
+
+        self.list_layout.addStretch()
+        self.empty.setVisible(not self.items)
+
+    # TAMBAL PER BARIS
+    @traced
+    def push_song(self, song: Song):
+        """Lagu baru diputar: satu baris di atas, baris terlama dibuang kalau history penuh."""
+        item = HistoryListItem(self.parent_window, song,
+                               is_favorited=song.id in self.parent_window.favorites)
+        self.items.insert(0, item)
+        self.list_layout.insertWidget(1, item)   # index 0 = label kosong
+
+        while len(self.items) > len(self.parent_window.history):
+            self._drop(self.items.pop())
+        self.empty.hide()
+
+    def set_favorited(self, song_id, state):
+        for item in self.items:
+            if item.song.id == song_id:
+                item.set_favorited(state)
+
+    @traced
+    def update_songs(self, songs):
+        """Buat ulang hanya baris yang lagunya diedit (songs: id -> Song)."""
+        favorites = self.parent_window.favorites
+        for i, old in enumerate(self.items):
+            song = songs.get(old.song.id)
+            if song is None:
+                continue
+            item = HistoryListItem(self.parent_window, song, is_favorited=song.id in favorites)
+            self.list_layout.replaceWidget(old, item)
+            self.items[i] = item
+            self._drop(old)
+
+    def _drop(self, item):
+        self.list_layout.removeWidget(item)
+        item.hide()
+        item.deleteLater()
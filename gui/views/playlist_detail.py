@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
 
+from controllers.tracing import traced
 from gui.views.song_card import SongGridView
 from structures.double_linked_list import DoubleLinkedList
 from gui.dialogs.add_song_playlist_dialog import AddSongPlaylistDialog
@@ -17,6 +18,7 @@ class PlaylistDetailView(QWidget):
     + MODE PLAYLIST AKTIF (in_playlist=True)
     """
 
+    @traced
     def __init__(self, parent_window, playlist_name: str, dll: DoubleLinkedList):
         super().__init__()
         self.parent_window = parent_window
@@ -28,10 +30,10 @@ class PlaylistDetailView(QWidget):
         layout.setSpacing(14)
 
         # TITLE
-        lbl_title = QLabel(f"Playlist: {playlist_name}")
-        lbl_title.setFont(QFont("Segoe UI", 22, QFont.Weight.Bold))
-        lbl_title.setStyleSheet("color: white;")
-        layout.addWidget(lbl_title)
+        self.lbl_title = QLabel(f"Playlist: {playlist_name}")
+        self.lbl_title.setFont(QFont("Segoe UI", 22, QFont.Weight.Bold))
+        self.lbl_title.setStyleSheet("color: white;")
+        layout.addWidget(self.lbl_title)
 
         # ACTION BAR (TAMBAH LAGU)
         action_bar = QFrame()
@@ -93,19 +95,17 @@ class PlaylistDetailView(QWidget):
             for song in dialog.selected_songs:
                 self.dll.add_last(song)
 
+            self.parent_window._playlist_changed(self.playlist_name)
             self.refresh()
 
-    # REFRESH GRID (BUAT ULANG VIEW)
-    def refresh(self):
-        # hapus grid lama
-        self.grid_view.setParent(None)
-
-        # buat ulang grid dengan data terbaru (MODE PLAYLIST TETAP AKTIF)
-        self.grid_view = SongGridView(
-            self.parent_window,
-            self.dll.to_list(),
-            in_playlist=True  
-        )
+    # GANTI PLAYLIST YANG DITAMPILKAN (VIEW DIPAKAI ULANG)
+    def set_playlist(self, playlist_name: str, dll: DoubleLinkedList):
+        self.playlist_name = playlist_name
+        self.dll = dll
+        self.lbl_title.setText(f"Playlist: {playlist_name}")
+        self.refresh()
 
-        # tambahkan kembali ke layout
-        self.layout().addWidget(self.grid_view)
\ No newline at end of file
+    # REFRESH GRID (ISI MODEL DIGANTI, WIDGET TETAP)
+    @traced
+    def refresh(self):
+        self.grid_view.set_songs(self.dll.to_list())
\ No newline at end of file
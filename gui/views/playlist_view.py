@@ -4,44 +4,96 @@ from PyQt6.QtWidgets import (
     QPushButton, QGridLayout
 )
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QPixmap
+from PyQt6.QtGui import QFont
 
+from controllers.tracing import traced
 from structures.double_linked_list import DoubleLinkedList
 from gui.icons import icon
+from gui.thumbnails import load_cover_async, PLAYLIST_CARD_SIZE
 
 
 class PlaylistView(QWidget):
     """
     Tampilan daftar playlist dalam bentuk grid (kartu)
     """
+    @traced
     def __init__(self, parent_window):
         super().__init__()
         self.parent_window = parent_window
 
-        grid = QGridLayout(self)
-        grid.setSpacing(20)
-        grid.setContentsMargins(10, 10, 10, 10)
-
+        root = QVBoxLayout(self)
+        root.setContentsMargins(0, 0, 0, 0)
+
+        self.body = None
+        self.refresh()
+
+    # REFRESH (BUAT ULANG ISI, VIEW TETAP)
+    @traced
+    def refresh(self):
+        if self.body is not None:
+            self.body.setParent(None)
+            self.body.deleteLater()
+
+        self.body = QWidget()
+        self.grid = QGridLayout(self.body)
+        self.grid.setSpacing(20)
+        self.grid.setContentsMargins(10, 10, 10, 10)
+        self.layout().addWidget(self.body)
+
+        self.empty = QLabel("There are no playlists yet.\nCreate a new playlist to get started!")
+        self.empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty.setStyleSheet("color:#ABAAA5; font-size:16px;")
+
+        # nama playlist -> kartu; _order = urutan nama di grid sekarang
+        self.cards = {}
+        self._order = []
+        for name, dll in self.parent_window.playlists.items():
+            self.cards[name] = self._create_playlist_card(name, dll)
+        self._layout_cards()
+
+    def _layout_cards(self, changed=None):
+        """
+        Tempatkan kartu mengikuti urutan parent_window.playlists. Hanya kartu
+        yang posisinya bergeser (dan kartu `changed` yang baru dibuat) yang
+        dipindah di grid, kartu sebelum perubahan tidak disentuh.
+        """
         MAX_COL = 3
-        row = col = 0
-
-        playlists = parent_window.playlists.items()
+        order = [name for name in self.parent_window.playlists if name in self.cards]
+        old, self._order = self._order, order
 
-        if not playlists:
-            empty = QLabel("There are no playlists yet.\nCreate a new playlist to get started!")
-            empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty.setStyleSheet("color:#ABAAA5; font-size:16px;")
-            grid.addWidget(empty, 0, 0)
+        if not order:
+            self.empty.show()
+            self.grid.addWidget(self.empty, 0, 0)
             return
-
-        for name, dll in playlists:
-            card = self._create_playlist_card(name, dll)
-            grid.addWidget(card, row, col)
-
-            col += 1
-            if col >= MAX_COL:
-                col = 0
-                row += 1
+        if not old:
+            self.grid.removeWidget(self.empty)
+            self.empty.hide()
+
+        for i, name in enumerate(order):
+            if i < len(old) and old[i] == name and name != changed:
+                continue
+            card = self.cards[name]
+            self.grid.removeWidget(card)
+            self.grid.addWidget(card, i // MAX_COL, i % MAX_COL)
+
+    # TAMBAL PER KARTU
+    @traced
+    def update_playlist(self, name: str):
+        """
+        Satu playlist dibuat / diubah / dihapus / diganti nama: hanya kartunya
+        yang dibuat ulang, kartu playlist yang sudah tidak ada dibuang.
+        """
+        playlists = self.parent_window.playlists
+        for old_name in [n for n in self.cards if n == name or n not in playlists]:
+            card = self.cards.pop(old_name)
+            self.grid.removeWidget(card)
+            card.hide()
+            card.deleteLater()
+
+        dll = playlists.get(name)
+        if dll is not None:
+            self.cards[name] = self._create_playlist_card(name, dll)
+        self._layout_cards(changed=name)
 
     # CARD PLAYLIST
     def _create_playlist_card(self, name: str, dll: DoubleLinkedList):
@@ -68,10 +120,11 @@ class PlaylistView(QWidget):
 
         cover_path = self.parent_window.playlist_covers.get(name)
 
-        if cover_path:
-            cover.setPixmap(QPixmap(cover_path))
-        else:
-            cover.setPixmap(QPixmap("assets/cover/playlist_default.png"))
+        load_cover_async(
+            cover,
+            cover_path or "assets/cover/playlist_default.png",
+            PLAYLIST_CARD_SIZE
+        )
 
         v.addWidget(cover, alignment=Qt.AlignmentFlag.AlignCenter)
 
@@ -4,9 +4,11 @@ from PyQt6.QtWidgets import (
     QListWidgetItem, QPushButton, QHBoxLayout, QFrame,
     QSizePolicy
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QFont
 
+from controllers.audio_metadata import format_duration
+from controllers.tracing import traced
 from gui.icons import icon
 from structures.song import Song
 from structures.queue import Queue
@@ -45,6 +47,7 @@ class QueueListWidget(QListWidget):
 class QueueView(QWidget):
     """Antrian lagu dengan drag & drop serta full-height layout."""
 
+    @traced
     def __init__(self, parent_window, queue: Queue):
         super().__init__()
         self.parent_window = parent_window
@@ -55,28 +58,43 @@ class QueueView(QWidget):
         main.setSpacing(16)
 
         # CASE: EMPTY
-        if queue.is_empty():
-            empty = QLabel("Queue is empty.")
-            empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty.setStyleSheet("color:#ABAAA5; font-size:14px;")
-            main.addWidget(empty)
-            return
+        self.empty = QLabel("Queue is empty.")
+        self.empty.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty.setStyleSheet("color:#ABAAA5; font-size:14px;")
+        main.addWidget(self.empty)
+
+        # JUMLAH LAGU + TOTAL DURASI
+        self.summary = QLabel()
+        self.summary.setStyleSheet("color:#ABAAA5; font-size:13px;")
+        main.addWidget(self.summary)
 
         # LIST WIDGET FULL HEIGHT
         self.list_widget = QueueListWidget(self)
         self.list_widget.setMinimumHeight(400)  
         main.addWidget(self.list_widget, stretch=1)
 
-        # LOAD QUEUE ITEMS WITHOUT DESTROYING ORDER
-        temp = []
-        while not queue.is_empty():
-            s = queue.dequeue()
-            temp.append(s)
+        self.refresh()
+
+    # REFRESH (ISI ULANG LIST, VIEW TETAP)
+    @traced
+    def refresh(self):
+        queue = self.queue = self.parent_window.queue
+        self.list_widget.clear()
+
+        self.empty.setVisible(queue.is_empty())
+        self.list_widget.setVisible(not queue.is_empty())
+        self.summary.setVisible(not queue.is_empty())
+        if queue.is_empty():
+            return
 
-        for s in temp:
-            queue.enqueue(s)
+        # iterasi queue tidak mengubah isinya
+        total = 0
+        for s in queue:
+            total += s.duration or 0
             self._add_song_item(s)
 
+        self.summary.setText(f"{len(queue)} songs • {format_duration(total)}")
+
     def _add_song_item(self, song: Song):
         item = QListWidgetItem()
         item.setSizeHint(QSize(0, 90))
@@ -118,6 +136,11 @@ class QueueView(QWidget):
         info.addWidget(lbl_artist)
         h.addLayout(info, stretch=1)
 
+        # DURASI (dari cache metadata, tanpa membuka file audio)
+        lbl_duration = QLabel(format_duration(song.duration))
+        lbl_duration.setStyleSheet("color:#ABAAA5; font-size:13px;")
+        h.addWidget(lbl_duration)
+
         # DELETE BUTTON
         btn_del = QPushButton()
         btn_del.setIcon(icon("delete"))
@@ -137,34 +160,22 @@ class QueueView(QWidget):
 
     def _remove(self, song: Song):
         """Remove satu item dari queue dan refresh view."""
-        new_q = Queue()
-        removed = False
-
-        while not self.queue.is_empty():
-            s = self.queue.dequeue()
-            if s == song and not removed:
-                removed = True
-                continue
-            new_q.enqueue(s)
-
-        self.parent_window.queue = new_q
-        self.parent_window._show_queue_view()
+        self.parent_window.queue.remove(song)
+        self.parent_window._queue_changed()
+        # tombol yang diklik ikut dihapus, jadi refresh setelah event selesai
+        QTimer.singleShot(0, self.parent_window._show_queue_view)
 
     def update_queue_order(self):
         """Update queue sesuai hasil drag & drop."""
-        new_q = Queue()
-
+        songs = []
         for i in range(self.list_widget.count()):
             item = self.list_widget.item(i)
             widget = self.list_widget.itemWidget(item)
 
-            labels = widget.findChildren(QLabel)
-            judul = labels[0].text()
-            artis = labels[1].text()
-
             song_id = widget.property("song_id")
             song = self.parent_window.controller.find_song_by_id(song_id)
             if song:
-                new_q.enqueue(song)
+                songs.append(song)
 
-        self.parent_window.queue = new_q
\ No newline at end of file
+        self.parent_window.queue.reorder(songs)
+        self.parent_window._queue_changed()
\ No newline at end of file
@@ -1,172 +1,362 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QPushButton, QFrame,
-    QGridLayout, QHBoxLayout
+    QWidget, QVBoxLayout, QListView, QStyledItemDelegate, QStyle,
+    QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QPixmap
+from PyQt6.QtCore import (
+    Qt, QSize, QRect, QRectF, QEvent, QAbstractListModel, QModelIndex, QTimer
+)
+from PyQt6.QtGui import QFont, QColor, QPainter, QPainterPath, QFontMetrics
 
+from controllers.audio_metadata import format_duration
+from controllers.tracing import traced
 from gui.icons import icon
+from gui.thumbnails import get_cover_loader, get_thumbnail_cache, CARD_SIZE
 from structures.song import Song
 
+CARD_WIDTH = 280
+CARD_HEIGHT = 300
+CARD_SPACING = 18
+
+
+def _cancel_tickets(tickets):
+    """Batalkan decode cover untuk view yang sudah dihapus."""
+    loader = get_cover_loader()
+    for ticket in tickets.values():
+        loader.cancel(ticket)
+    tickets.clear()
+
+
+class SongListModel(QAbstractListModel):
+    """Model daftar lagu untuk SongGridView (satu baris = satu lagu)."""
+    SongRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, songs=None):
+        super().__init__()
+        self._songs = list(songs or [])
+        self._rows = {}     # song.id -> [baris, ...] (lagu bisa muncul dua kali di playlist)
+        self._dirty = 0     # baris >= _dirty belum diindex ulang (bergeser / baru)
+
+    def _reindex(self, start):
+        """Perbarui index id -> baris untuk baris start.. (setelah baris bergeser)."""
+        rows = self._rows
+        tail = self._songs[start:]
+        for song in tail:
+            old = rows.get(song.id)
+            if old and old[-1] >= start:
+                rows[song.id] = [r for r in old if r < start]
+        for row, song in enumerate(tail, start):
+            rows.setdefault(song.id, []).append(row)
+
+    def _rows_of(self, song_id):
+        """
+        Baris lagu ini. Index diperbaiki malas: penghapusan hanya memundurkan
+        _dirty, dan baris >= _dirty baru diindex ulang (O(n - _dirty)) saat
+        ada lookup yang membutuhkannya. Beberapa batch penghapusan berturut-
+        turut jadi cukup satu kali reindex.
+        """
+        rows = self._rows.get(song_id)
+        if self._dirty < len(self._songs) and (rows is None or rows[-1] >= self._dirty):
+            self._reindex(self._dirty)
+            self._dirty = len(self._songs)
+            rows = self._rows.get(song_id)
+        return rows or ()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._songs)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        song = self._songs[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return song.judul
+        if role == self.SongRole:
+            return song
+        return None
+
+    def set_songs(self, songs):
+        self.beginResetModel()
+        self._songs = list(songs)
+        self._rows = {}
+        self._dirty = 0
+        self.endResetModel()
 
-class SongCard(QFrame):
+    def songs(self):
+        return self._songs
+
+    # TAMBAL BARIS (tanpa reset model)
+    def append_songs(self, songs):
+        songs = list(songs)
+        if not songs:
+            return
+        first = len(self._songs)
+        self.beginInsertRows(QModelIndex(), first, first + len(songs) - 1)
+        self._songs.extend(songs)
+        # baris baru langsung dicatat (posisinya pasti benar), jadi setiap
+        # lagu di baris >= _dirty selalu punya entri >= _dirty di _rows
+        for row, song in enumerate(songs, first):
+            self._rows.setdefault(song.id, []).append(row)
+        self.endInsertRows()
+
+    def remove_ids(self, song_ids):
+        """Hapus baris lagu dengan id tersebut, per rentang baris yang berurutan."""
+        rows = sorted(row for song_id in song_ids for row in self._rows_of(song_id))
+        for song_id in song_ids:
+            self._rows.pop(song_id, None)
+        if not rows:
+            return
+        start = rows[0]
+        # dari belakang supaya index baris di depan tidak bergeser
+        while rows:
+            last = rows.pop()
+            first = last
+            while rows and rows[-1] == first - 1:
+                first = rows.pop()
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._songs[first:last + 1]
+            self.endRemoveRows()
+        # hanya baris setelah baris pertama yang dihapus yang bergeser
+        self._dirty = min(self._dirty, start)
+
+    def refresh_ids(self, song_ids):
+        """Gambar ulang baris lagu yang datanya diedit."""
+        for song_id in song_ids:
+            for row in self._rows_of(song_id):
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+
+class SongCardDelegate(QStyledItemDelegate):
     """
-    Full-bleed Spotify-style Song Card
-    + Favorite (♥ / ♡)
-    + Remove button (ONLY in playlist)
+    Menggambar kartu lagu (cover, judul, artis, Play, Antrian, ♥, Hapus)
+    langsung dengan QPainter, jadi tidak ada widget per lagu.
+    Klik tombol ditangani di editorEvent.
     """
-    def __init__(self, parent_window, song: Song, in_playlist=False):
-        super().__init__()
+
+    def __init__(self, parent_window, view, in_playlist=False):
+        super().__init__(view)
         self.parent_window = parent_window
-        self.song = song
+        self.view = view
         self.in_playlist = in_playlist
 
-        self.setFixedSize(280, 300)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #2B2B2E;
-                border-radius: 22px;
-            }
-            QFrame:hover {
-                background-color: #323234;
-            }
-        """)
+        self.font_title = QFont("Segoe UI", 14, QFont.Weight.Bold)
+        self.font_artist = QFont("Segoe UI", 9)
+        self.font_button = QFont("Segoe UI", 9, QFont.Weight.Bold)
+        self.font_fav = QFont("Segoe UI", 15)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(14, 14, 14, 14)
-        layout.setSpacing(10)
+        self.icon_play = icon("play_arrow")
+        self.icon_queue = icon("add")
+        self.icon_delete = icon("delete")
 
-        # COVER IMAGE
-        cover = QLabel()
-        cover.setFixedSize(252, 150)
-        cover.setScaledContents(True)
+        # cover yang sedang di-decode: path -> ticket
+        self._tickets = {}
+        tickets = self._tickets
+        view.destroyed.connect(lambda *_: _cancel_tickets(tickets))
 
-        if song.cover_path:
-            pixmap = QPixmap(song.cover_path)
-            cover.setPixmap(pixmap)
-        else:
-            cover.setStyleSheet("""
-                background-color:#323234;
-                border-radius:18px;
-                border:1px solid #3A5256;
-            """)
-        layout.addWidget(cover, alignment=Qt.AlignmentFlag.AlignCenter)
-
-        # TITLE
-        lbl_title = QLabel(song.judul)
-        lbl_title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        layout.addWidget(lbl_title)
-
-        # ARTIST
-        lbl_artist = QLabel(song.artis)
-        lbl_artist.setStyleSheet("color:#ABAAA5; font-size:12px;")
-        layout.addWidget(lbl_artist)
-
-        # BUTTON ROW (Play + Queue)
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(8)
-
-        btn_play = QPushButton("Play")
-        btn_play.setIcon(icon("play_arrow"))
-        btn_play.setIconSize(QSize(16, 16))
-        btn_play.setProperty("buttonRole", "primary")
-        btn_play.setFixedHeight(34)
-        btn_play.clicked.connect(
-            lambda _, s=song: parent_window._play_song_from_card(s)
-        )
-        btn_row.addWidget(btn_play)
-
-        btn_queue = QPushButton("Antrian")
-        btn_queue.setIcon(icon("add"))
-        btn_queue.setIconSize(QSize(16, 16))
-        btn_queue.setProperty("buttonRole", "secondary")
-        btn_queue.setFixedHeight(34)
-        btn_queue.clicked.connect(
-            lambda _, s=song: parent_window.add_to_queue(s)
+    # LAYOUT KARTU
+    def _card_rect(self, option):
+        r = option.rect
+        return QRect(
+            r.x() + (r.width() - CARD_WIDTH) // 2,
+            r.y() + (r.height() - CARD_HEIGHT) // 2,
+            CARD_WIDTH, CARD_HEIGHT
         )
-        btn_row.addWidget(btn_queue)
 
-        layout.addLayout(btn_row)
+    def _rects(self, card):
+        x, y = card.x() + 14, card.y() + 14
+        half = (CARD_WIDTH - 28 - 8) // 2
+        return {
+            "cover": QRect(x, y, CARD_SIZE[0], CARD_SIZE[1]),
+            "title": QRect(x, y + 160, 252, 24),
+            "artist": QRect(x, y + 186, 252, 18),
+            "play": QRect(x, y + 212, half, 34),
+            "queue": QRect(x + half + 8, y + 212, half, 34),
+            "remove": QRect(x, y + 252, 90, 30),
+            "fav": QRect(card.right() - 14 - 40, y + 250, 40, 34),
+        }
 
-        # FAVORITE + REMOVE ROW
-        fav_layout = QHBoxLayout()
+    def sizeHint(self, option, index):
+        return QSize(CARD_WIDTH + CARD_SPACING, CARD_HEIGHT + CARD_SPACING)
 
-        # REMOVE (ONLY IN PLAYLIST)
-        if self.in_playlist:
-            btn_remove = QPushButton("Hapus")
-            btn_remove.setIcon(icon("delete"))
-            btn_remove.setProperty("buttonRole", "danger")
-            btn_remove.setFixedHeight(32)
-            btn_remove.clicked.connect(self._remove_from_playlist)
-            fav_layout.addWidget(btn_remove)
-
-        fav_layout.addStretch()
-
-        # FAVORITE BUTTON
-        self.btn_fav = QPushButton()
-        self.btn_fav.setFixedSize(40, 36)
-        self.btn_fav.setStyleSheet(
-            "border:none; background:transparent; font-size:20px;"
+    # PAINT
+    def paint(self, painter: QPainter, option, index):
+        song = index.data(SongListModel.SongRole)
+        if song is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        card = self._card_rect(option)
+        rects = self._rects(card)
+        hover = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        self._fill(painter, card, "#323234" if hover else "#2B2B2E", 22)
+        self._paint_cover(painter, rects["cover"], song)
+
+        painter.setPen(QColor("white"))
+        painter.setFont(self.font_title)
+        title = QFontMetrics(self.font_title).elidedText(
+            song.judul, Qt.TextElideMode.ElideRight, rects["title"].width()
+        )
+        painter.drawText(rects["title"], Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+
+        painter.setPen(QColor("#ABAAA5"))
+        painter.setFont(self.font_artist)
+        artist_text = song.artis
+        if song.duration is not None:
+            artist_text = f"{song.artis} • {format_duration(song.duration)}"
+        artist = QFontMetrics(self.font_artist).elidedText(
+            artist_text, Qt.TextElideMode.ElideRight, rects["artist"].width()
         )
+        painter.drawText(rects["artist"], Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, artist)
 
-        self._update_fav_ui()
-        self.btn_fav.clicked.connect(self._toggle_fav)
+        self._paint_button(painter, rects["play"], "Play", self.icon_play, "#F92D44")
+        self._paint_button(painter, rects["queue"], "Antrian", self.icon_queue, "#3A5256")
+        if self.in_playlist:
+            self._paint_button(painter, rects["remove"], "Hapus", self.icon_delete, "#E53935")
+
+        is_fav = song.id in self.parent_window.favorites
+        painter.setPen(QColor("#F92D44" if is_fav else "#ABAAA5"))
+        painter.setFont(self.font_fav)
+        painter.drawText(rects["fav"], Qt.AlignmentFlag.AlignCenter, "♥" if is_fav else "♡")
+
+        painter.restore()
 
-        fav_layout.addWidget(self.btn_fav)
-        layout.addLayout(fav_layout)
+    def _fill(self, painter, rect, color, radius):
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(rect), radius, radius)
+        painter.fillPath(path, QColor(color))
 
-        self.setMouseTracking(True)
+    def _paint_button(self, painter, rect, text, btn_icon, color):
+        self._fill(painter, rect, color, 8)
+        fm = QFontMetrics(self.font_button)
+        content_w = 16 + 6 + fm.horizontalAdvance(text)
+        x = rect.x() + (rect.width() - content_w) // 2
+        btn_icon.paint(painter, QRect(x, rect.center().y() - 8, 16, 16))
+        painter.setPen(QColor("white"))
+        painter.setFont(self.font_button)
+        painter.drawText(
+            QRect(x + 22, rect.y(), rect.width(), rect.height()),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text
+        )
 
-    # FAVORITE HANDLER
-    def _is_favorite(self):
-        return self.song.id in self.parent_window.favorites
+    def _paint_cover(self, painter, rect, song):
+        pixmap = None
+        if song.cover_path:
+            cache = get_thumbnail_cache()
+            key = cache.key(song.cover_path, *CARD_SIZE)
+            if key is not None:
+                pixmap = cache.get(key)
+                if pixmap is None:
+                    self._request_cover(song.cover_path)
 
-    def _update_fav_ui(self):
-        if self._is_favorite():
-            self.btn_fav.setText("♥")
-            self.btn_fav.setStyleSheet(
-                "color:#F92D44; font-size:20px; border:none; background:transparent;"
-            )
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(rect), 18, 18)
+        if pixmap is not None:
+            painter.save()
+            painter.setClipPath(path)
+            painter.drawPixmap(rect, pixmap)
+            painter.restore()
         else:
-            self.btn_fav.setText("♡")
-            self.btn_fav.setStyleSheet(
-                "color:#ABAAA5; font-size:20px; border:none; background:transparent;"
-            )
+            painter.fillPath(path, QColor("#323234"))
+            painter.setPen(QColor("#3A5256"))
+            painter.drawPath(path)
+
+    # COVER ASYNC
+    def _request_cover(self, cover_path):
+        if cover_path in self._tickets:
+            return
 
-    def _toggle_fav(self):
-        self.parent_window.toggle_favorite(self.song)
-        self._update_fav_ui()
+        def done(_pixmap, p=cover_path):
+            self._tickets.pop(p, None)
+            self.view.viewport().update()
 
-    # REMOVE FROM PLAYLIST (SAFE)
-    def _remove_from_playlist(self):
-        if hasattr(self.parent_window, "remove_song_from_current_playlist"):
-            self.parent_window.remove_song_from_current_playlist(self.song)
+        ticket = get_cover_loader().request(cover_path, CARD_SIZE, done)
+        if ticket is not None:
+            self._tickets[cover_path] = ticket
 
+    # KLIK TOMBOL
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.Type.MouseButtonRelease:
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
 
-# GRID VIEW (3 columns)
+        song = index.data(SongListModel.SongRole)
+        if song is None:
+            return False
+
+        pos = event.position().toPoint()
+        rects = self._rects(self._card_rect(option))
+
+        if rects["play"].contains(pos):
+            self.parent_window._play_song_from_card(song)
+            return True
+        if rects["queue"].contains(pos):
+            self.parent_window.add_to_queue(song)
+            return True
+        if rects["fav"].contains(pos):
+            self.parent_window.toggle_favorite(song)
+            self.view.viewport().update(option.rect)
+            return True
+        if self.in_playlist and rects["remove"].contains(pos):
+            # view ini ikut dibuat ulang, jadi jalankan setelah event selesai
+            if hasattr(self.parent_window, "remove_song_from_current_playlist"):
+                QTimer.singleShot(
+                    0, lambda s=song: self.parent_window.remove_song_from_current_playlist(s)
+                )
+            return True
+        return False
+
+
+# GRID VIEW (virtualized, hanya kartu yang terlihat yang digambar)
 class SongGridView(QWidget):
+    @traced
     def __init__(self, parent_window, songs: list[Song], in_playlist=False):
         super().__init__()
         self.parent_window = parent_window
         self.songs = songs
         self.in_playlist = in_playlist
 
-        grid = QGridLayout(self)
-        grid.setSpacing(18)
-        grid.setContentsMargins(10, 10, 10, 10)
-
-        MAX_COL = 3
-        row = col = 0
-
-        for song in songs:
-            card = SongCard(
-                parent_window,
-                song,
-                in_playlist=self.in_playlist
-            )
-            grid.addWidget(card, row, col)
-
-            col += 1
-            if col >= MAX_COL:
-                col = 0
-                row += 1
\ No newline at end of file
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        self.model = SongListModel(songs)
+
+        self.list_view = QListView()
+        self.list_view.setViewMode(QListView.ViewMode.IconMode)
+        self.list_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.list_view.setMovement(QListView.Movement.Static)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.list_view.setBatchSize(200)
+        self.list_view.setGridSize(QSize(CARD_WIDTH + CARD_SPACING, CARD_HEIGHT + CARD_SPACING))
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.list_view.verticalScrollBar().setSingleStep(24)
+        self.list_view.setMouseTracking(True)
+        self.list_view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.list_view.setStyleSheet("QListView { background: transparent; border: none; }")
+
+        self.delegate = SongCardDelegate(parent_window, self.list_view, in_playlist=in_playlist)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.setModel(self.model)
+
+        layout.addWidget(self.list_view)
+
+    @traced
+    def set_songs(self, songs: list[Song]):
+        """Ganti isi grid tanpa membuat ulang widget."""
+        self.songs = songs
+        self.model.set_songs(songs)
+
+    def apply_changes(self, changes, append_added=False):
+        """Tambal grid dari SongChanges controller (hanya baris yang berubah)."""
+        if changes.removed:
+            self.model.remove_ids(changes.removed)
+        if changes.updated:
+            self.model.refresh_ids(changes.updated)
+        if append_added and changes.added:
+            self.model.append_songs(changes.added.values())
+        self.songs = self.model.songs()
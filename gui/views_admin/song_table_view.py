@@ -2,9 +2,13 @@
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
 
+from controllers.tracing import traced
+
 class SongTableView(QTableWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._rows = {}     # song.id -> baris
+        self._dirty = 0     # baris >= _dirty mungkin sudah bergeser
         self.setColumnCount(4)
         self.setHorizontalHeaderLabels(["Judul", "Artis", "Genre", "Vibes"])
         self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
@@ -22,14 +26,60 @@ class SongTableView(QTableWidget):
             }
         """)
 
+    @traced
     def load_songs(self, songs):
+        self._rows = {}
+        self._dirty = len(songs)
         self.setRowCount(len(songs))
 
         for row, song in enumerate(songs):
-            item_judul = QTableWidgetItem(song.judul)
-            item_judul.setData(Qt.ItemDataRole.UserRole, song.id) 
+            self._set_row(row, song)
+
+    def row_of(self, song_id):
+        """
+        Baris lagu ini. Setelah hapus baris, index baris >= _dirty baru
+        diperbaiki di lookup berikutnya yang membutuhkannya (O(n - _dirty)),
+        jadi beberapa batch hapus cukup satu kali perbaikan. removeRow sendiri
+        tetap O(n) di QTableWidget.
+        """
+        row = self._rows.get(song_id)
+        if self._dirty < self.rowCount() and (row is None or row >= self._dirty):
+            for r in range(self._dirty, self.rowCount()):
+                self._rows[self.item(r, 0).data(Qt.ItemDataRole.UserRole)] = r
+            self._dirty = self.rowCount()
+            row = self._rows.get(song_id)
+        return row
+
+    def _set_row(self, row, song):
+        item_judul = QTableWidgetItem(song.judul)
+        item_judul.setData(Qt.ItemDataRole.UserRole, song.id)
+        self._rows[song.id] = row
+
+        self.setItem(row, 0, item_judul)
+        self.setItem(row, 1, QTableWidgetItem(song.artis))
+        self.setItem(row, 2, QTableWidgetItem(song.genre))
+        self.setItem(row, 3, QTableWidgetItem(song.vibes))
+
+    # TAMBAL BARIS DARI SongChanges
+    def apply_changes(self, changes):
+        rows = sorted(row for row in map(self.row_of, changes.removed) if row is not None)
+        for song_id in changes.removed:
+            self._rows.pop(song_id, None)
+        # dari belakang supaya index baris di depan tidak bergeser
+        for row in reversed(rows):
+            self.removeRow(row)
+        if rows:
+            # hanya baris setelah baris pertama yang dihapus yang bergeser
+            self._dirty = min(self._dirty, rows[0])
+
+        for song_id, song in changes.updated.items():
+            row = self.row_of(song_id)
+            if row is not None:
+                self._set_row(row, song)
 
-            self.setItem(row, 0, item_judul)
-            self.setItem(row, 1, QTableWidgetItem(song.artis))
-            self.setItem(row, 2, QTableWidgetItem(song.genre))
-            self.setItem(row, 3, QTableWidgetItem(song.vibes))
\ No newline at end of file
+        if changes.added:
+            row = self.rowCount()
+            self.setRowCount(row + len(changes.added))
+            for song in changes.added.values():
+                self._set_row(row, song)
+                row += 1
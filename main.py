@@ -1,9 +1,27 @@
 # main.py
+import os
 import sys
-from PyQt6.QtWidgets import QApplication
-from gui.login_window import LoginWindow
+
+
+def stall_threshold_ms(default):
+    """GOSIC_STALL_MS (0 = mati); nilai tidak valid diganti default + peringatan."""
+    raw = os.environ.get("GOSIC_STALL_MS")
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        print(f"GOSIC_STALL_MS={raw!r} bukan angka, pakai {default} ms.", file=sys.stderr)
+        return default
+
 
 if __name__ == "__main__":
+    # Qt diimpor di sini, bukan di atas: worker import (process pool "spawn")
+    # mengimpor ulang main.py dan tidak boleh ikut memuat Qt / GUI
+    from PyQt6.QtWidgets import QApplication
+    from gui.login_window import LoginWindow
+    from gui.stall_watchdog import StallWatchdog, DEFAULT_THRESHOLD_MS
+
     app = QApplication(sys.argv)
 
     # Load 
@@ -13,6 +31,13 @@ if __name__ == "__main__":
     except FileNotFoundError:
         print("style.qss tidak ditemukan! Pastikan file ada di folder yang sama dengan main.py.")
 
+    # catat UI macet ke data/logs/stalls.log (GOSIC_STALL_MS=0 untuk mematikan)
+    stall_ms = stall_threshold_ms(DEFAULT_THRESHOLD_MS)
+    if stall_ms > 0:
+        watchdog = StallWatchdog(threshold_ms=stall_ms)
+        watchdog.start()
+        app.aboutToQuit.connect(watchdog.stop)
+
     win = LoginWindow()
     win.show()
 
@@ -7,13 +7,41 @@ class DoubleLinkedList:
     """
     Double Linked List khusus untuk pemutar musik.
     Kompatibel dengan UserWindow GUI baru.
+
+    index_by_id=True menyimpan map song.id -> [Node, ...] supaya cari,
+    hapus, dan update berdasarkan id lagu O(1). Satu lagu boleh muncul
+    lebih dari sekali (playlist), urutan node di map = urutan di list.
     """
 
-    def __init__(self):
+    def __init__(self, index_by_id=False):
         self.head: Node | None = None
         self.tail: Node | None = None
         self.current: Node | None = None
         self.size = 0
+        self._index: dict[str, list[Node]] | None = {} if index_by_id else None
+
+    # INDEX (OPSIONAL)
+    def _index_add(self, node: Node, first=False):
+        if self._index is None:
+            return
+        nodes = self._index.setdefault(node.data.id, [])
+        if first:
+            nodes.insert(0, node)
+        else:
+            nodes.append(node)
+
+    def _index_remove(self, node: Node):
+        if self._index is None:
+            return
+        nodes = self._index.get(node.data.id)
+        if not nodes:
+            return
+        for i, n in enumerate(nodes):
+            if n is node:
+                del nodes[i]
+                break
+        if not nodes:
+            del self._index[node.data.id]
 
     # INSERT
     def add_last(self, song: Song):
@@ -27,6 +55,8 @@ class DoubleLinkedList:
             self.tail = new_node
 
         self.size += 1
+        self._index_add(new_node)
+        return new_node
 
     def add_first(self, song: Song):
         new_node = Node(song)
@@ -39,51 +69,84 @@ class DoubleLinkedList:
             self.head = new_node
 
         self.size += 1
+        self._index_add(new_node, first=True)
+        return new_node
 
     # DELETE (optional, playlist)
-    def delete_at(self, index: int):
-        if index < 0 or index >= self.size:
-            return False
-
-        if self.size == 1:
-            self.clear()
-            return True
-
-        # delete head
-        if index == 0:
-            if self.current == self.head:
-                self.current = self.head.next
-            self.head = self.head.next
-            self.head.prev = None
-            self.size -= 1
-            return True
-
-        # delete tail
-        if index == self.size - 1:
-            if self.current == self.tail:
-                self.current = self.tail.prev
-            self.tail = self.tail.prev
-            self.tail.next = None
-            self.size -= 1
-            return True
-
-        # delete middle
-        node = self.get_node(index)
-        if self.current == node:
+    def remove_node(self, node: Node):
+        """Lepas node dari list dalam O(1)."""
+        if self.current is node:
             self.current = node.next or node.prev
 
-        node.prev.next = node.next
-        node.next.prev = node.prev
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+
+        node.prev = node.next = None
         self.size -= 1
+        self._index_remove(node)
         return True
 
+    def delete_at(self, index: int):
+        if index < 0 or index >= self.size:
+            return False
+
+        return self.remove_node(self.get_node(index))
+
     def get_node(self, index: int):
         if index < 0 or index >= self.size:
             return None
+
+        # jalan dari ujung yang lebih dekat
+        if index < self.size // 2:
+            cur = self.head
+            for _ in range(index):
+                cur = cur.next
+        else:
+            cur = self.tail
+            for _ in range(self.size - 1 - index):
+                cur = cur.prev
+        return cur
+
+    # AKSES BERDASARKAN ID
+    def find_node_by_id(self, song_id):
+        """Node pertama dengan song.id tersebut (O(1) kalau index aktif)."""
+        if self._index is not None:
+            nodes = self._index.get(song_id)
+            return nodes[0] if nodes else None
+
         cur = self.head
-        for _ in range(index):
+        while cur:
+            if cur.data.id == song_id:
+                return cur
             cur = cur.next
-        return cur
+        return None
+
+    def find_by_id(self, song_id):
+        node = self.find_node_by_id(song_id)
+        return node.data if node else None
+
+    def remove_by_id(self, song_id):
+        node = self.find_node_by_id(song_id)
+        if not node:
+            return False
+        return self.remove_node(node)
+
+    def remove_all_by_id(self, song_id):
+        """Hapus semua kemunculan lagu, return jumlah node yang dihapus."""
+        removed = 0
+        while self.remove_by_id(song_id):
+            removed += 1
+        return removed
+
+    def contains_id(self, song_id):
+        return self.find_node_by_id(song_id) is not None
 
     # PLAYBACK (DISIMPLEKAN)
     def play_first(self):
@@ -123,6 +186,12 @@ class DoubleLinkedList:
 
     def jump_to_song(self, song: Song):
         """Loncat ke node yang lagunya sama."""
+        if self._index is not None:
+            node = self.find_node_by_id(song.id)
+            if node:
+                self.current = node
+                return node
+
         cur = self.head
         while cur:
             if cur.data.judul == song.judul and cur.data.artis == song.artis:
@@ -147,24 +216,17 @@ class DoubleLinkedList:
         self.tail = None
         self.current = None
         self.size = 0
-        
+        if self._index is not None:
+            self._index = {}
+
     def remove(self, target):
+        if self._index is not None:
+            return self.remove_by_id(target.id)
+
         current = self.head
         while current:
             if current.data == target:
-                if current.prev:
-                    current.prev.next = current.next
-                else:
-                    self.head = current.next
-
-                if current.next:
-                    current.next.prev = current.prev
-                else:
-                    self.tail = current.prev
-
-                self.size -= 1
-                return True
-
+                return self.remove_node(current)
             current = current.next
 
-        return False
\ No newline at end of file
+        return False
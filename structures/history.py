@@ -0,0 +1,83 @@
+# structures/history.py
+
+DEFAULT_CAPACITY = 500
+
+
+class History:
+    """
+    Riwayat lagu yang diputar, disimpan di ring buffer berkapasitas tetap.
+    - push O(1); kalau penuh, entri paling lama ditimpa
+    - iterasi dari yang terbaru tanpa mengubah isi (tidak perlu pop/push ulang)
+    - method is_empty/push/pop/peek/size/display sama seperti Stack
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity minimal 1")
+        self.capacity = capacity
+        self._items = [None] * capacity
+        self._top = -1      # slot entri terbaru
+        self._size = 0
+
+    # INSERT / REMOVE
+    def push(self, item):
+        self._top = (self._top + 1) % self.capacity
+        self._items[self._top] = item
+        if self._size < self.capacity:
+            self._size += 1
+
+    def pop(self):
+        """Ambil entri terbaru."""
+        if self._size == 0:
+            return None
+        item = self._items[self._top]
+        self._items[self._top] = None
+        self._top = (self._top - 1) % self.capacity
+        self._size -= 1
+        return item
+
+    def peek(self):
+        return self._items[self._top] if self._size else None
+
+    def clear(self):
+        self._items = [None] * self.capacity
+        self._top = -1
+        self._size = 0
+
+    # INFO
+    def is_empty(self):
+        return self._size == 0
+
+    def size(self):
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    # ITERASI (TERBARU -> TERLAMA)
+    def __iter__(self):
+        items = self._items
+        cap = self.capacity
+        top = self._top
+        for i in range(self._size):
+            yield items[(top - i) % cap]
+
+    def display(self):
+        return list(self)
+
+    def recent(self, n=None, unique=True):
+        """
+        n lagu terakhir yang diputar, terbaru dulu. unique=True hanya
+        mengambil kemunculan terbaru tiap lagu (berdasarkan id).
+        """
+        result = []
+        seen = set()
+        for song in self:
+            if n is not None and len(result) >= n:
+                break
+            if unique:
+                if song.id in seen:
+                    continue
+                seen.add(song.id)
+            result.append(song)
+        return result
@@ -1,22 +1,79 @@
 # structures/multi_linked_list.py
+from bisect import bisect_left, bisect_right, insort
+
+# Koordinat (mood, energy) per vibe, skala 0-10.
+# mood = sedih -> senang, energy = tenang -> bersemangat.
+VIBE_COORDINATES = {
+    "sad": (2, 3),
+    "galau": (2, 4),
+    "emotional": (3, 5),
+    "intense": (4, 9),
+    "mellow": (5, 2),
+    "chill": (6, 2),
+    "powerful": (6, 8),
+    "sweet": (7, 3),
+    "romantic": (7, 4),
+    "energetic": (7, 9),
+    "happy": (8, 6),
+    "upbeat": (8, 8),
+    "fun": (9, 7),
+}
+
+# vibes tidak dikenal ditaruh di tengah
+DEFAULT_COORDINATE = (5, 5)
+
 
 class VibeNode:
     """Node penyimpanan lagu dengan pointer untuk navigasi vibe."""
+    __slots__ = ("song", "key", "cell", "next", "prev")
+
     def __init__(self, song):
         self.song = song
-        self.mood_up = None
-        self.mood_down = None
-        self.energy_up = None
-        self.energy_down = None
+        self.key = None      # key di MultiLinkedList.nodes
+        self.cell = None     # VibeCell tempat node ini tersambung
+        self.next = None     # lagu berikutnya di vibe yang sama
+        self.prev = None
+
+
+class VibeCell:
+    """Satu titik (mood, energy) di grid, berisi rantai lagu dengan vibe yang sama."""
+    __slots__ = ("vibe", "mood", "energy", "head", "tail", "size")
+
+    def __init__(self, vibe, mood, energy):
+        self.vibe = vibe
+        self.mood = mood
+        self.energy = energy
+        self.head = None
+        self.tail = None
+        self.size = 0
 
 
 class MultiLinkedList:
     """
     Multi Linked List untuk navigasi berdasarkan vibes.
     Key: (judul.lower(), artis.lower())
+
+    Index 2 dimensi: setiap vibe adalah satu sel di grid (mood, energy)
+    dan menyimpan rantai lagunya sendiri. Sel yang terisi disimpan urut
+    per sumbu (by_mood: (mood, energy, vibe), by_energy: (energy, mood,
+    vibe)), jadi mood dan energy berdiri sendiri: get_neighbor(song,
+    "mood", 1) dan get_neighbor(song, "energy", 1) bisa menuju sel yang
+    berbeda, masing-masing dengan binary search O(log sel).
+
+    get_next_vibe / get_prev_vibe (dipakai next/prev otomatis): lagu
+    berikutnya di vibe yang sama, lalu sel berikutnya kalau grid disapu
+    urut mood lalu energy (memutar), jadi semua vibe pasti terlewati.
+    get_neighbor dipakai tombol geser mood / energy di player.
+
+    Tambah/hapus/edit satu lagu O(1) (+ O(log sel) kalau sel baru / kosong).
     """
+
     def __init__(self):
         self.nodes = {}
+        self.by_id = {}      # song.id -> VibeNode
+        self.cells = {}      # vibe (lowercase) -> VibeCell
+        self.by_mood = []    # (mood, energy, vibe) sel yang terisi, urut
+        self.by_energy = []  # (energy, mood, vibe) sel yang terisi, urut
 
     # ----------------------------
     # Helper
@@ -24,103 +81,229 @@ class MultiLinkedList:
     def _key(self, song):
         return (song.judul.lower(), song.artis.lower())
 
+    def _vibe(self, vibe_name):
+        return " ".join((vibe_name or "").lower().split())
+
+    def _node_of(self, song):
+        return self.by_id.get(song.id) or self.nodes.get(self._key(song))
+
+    # VIBE SCORE MAPPING
+    def _vibe_score(self, song):
+        """Mapping vibes → (mood, energy) score."""
+        return VIBE_COORDINATES.get(self._vibe(song.vibes), DEFAULT_COORDINATE)
+
+    # SPLICE RANTAI VIBE
+    def _link(self, node):
+        """Sambung node di ujung rantai sel vibe-nya."""
+        vibe = self._vibe(node.song.vibes)
+        cell = self.cells.get(vibe)
+        if cell is None:
+            mood, energy = self._vibe_score(node.song)
+            cell = self.cells[vibe] = VibeCell(vibe, mood, energy)
+            insort(self.by_mood, (mood, energy, vibe))
+            insort(self.by_energy, (energy, mood, vibe))
+
+        node.cell = cell
+        node.next = None
+        node.prev = cell.tail
+        if cell.tail:
+            cell.tail.next = node
+        else:
+            cell.head = node
+        cell.tail = node
+        cell.size += 1
+
+    def _unlink(self, node):
+        """Lepas node dari rantai selnya, tetangga disambung langsung."""
+        cell = node.cell
+
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            cell.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            cell.tail = node.prev
+
+        cell.size -= 1
+        if cell.size == 0:
+            del self.cells[cell.vibe]
+            del self.by_mood[bisect_left(self.by_mood, (cell.mood, cell.energy, cell.vibe))]
+            del self.by_energy[bisect_left(self.by_energy, (cell.energy, cell.mood, cell.vibe))]
+
+        node.prev = node.next = None
+        node.cell = None
+
+    # ----------------------------
+    # INSERT / REMOVE / UPDATE
+    # ----------------------------
     def add_song(self, song):
         key = self._key(song)
-        if key not in self.nodes:
-            self.nodes[key] = VibeNode(song)
+        if key in self.nodes or song.id in self.by_id:
+            return
+
+        node = VibeNode(song)
+        node.key = key
+        self.nodes[key] = node
+        self.by_id[song.id] = node
+        self._link(node)
 
     def add_song_to_vibe(self, song):
         self.add_song(song)
 
-    # VIBE SCORE MAPPING (OPSI A)
-    def _vibe_score(self, song):
-        """Mapping vibes → (mood, energy) score."""
-        vibe = (song.vibes or "").lower()
-        if vibe == "happy":
-            return (3, 3)
-        if vibe == "chill":
-            return (2, 1)
-        if vibe == "sad":
-            return (1, 1)
+    def remove_song(self, song):
+        node = self.by_id.pop(song.id, None)
+        if not node:
+            return False
 
-        # vibes tidak dikenal
-        return (0, 0)
+        if self.nodes.get(node.key) is node:
+            del self.nodes[node.key]
+        self._unlink(node)
+        return True
+
+    def update_song(self, song):
+        """Re-key satu lagu setelah judul/artis/vibes-nya diedit."""
+        node = self.by_id.get(song.id)
+        if not node:
+            self.add_song(song)
+            return
+
+        new_key = self._key(song)
+        if new_key != node.key:
+            if self.nodes.get(node.key) is node:
+                del self.nodes[node.key]
+            self.nodes.setdefault(new_key, node)
+            node.key = new_key
+
+        if node.cell.vibe != self._vibe(song.vibes):
+            self._unlink(node)
+            self._link(node)
 
     # AUTO-CONNECT
     def rebuild(self, songs):
         """Bangun ulang MLL berdasarkan daftar lagu dari DLL."""
         self.nodes = {}
+        self.by_id = {}
+        self.cells = {}
+        self.by_mood = []
+        self.by_energy = []
 
-        # 1. Tambah node untuk semua lagu
+        # satu rantai per vibe, urutan mengikuti DLL
         for s in songs:
             self.add_song(s)
 
-        # 2. Kelompokkan lagu berdasarkan vibes
-        buckets = {}
-        for s in songs:
-            buckets.setdefault(s.vibes, []).append(s)
+    def get_songs_by_vibe(self, vibe_name):
+        result = []
+        cell = self.cells.get(self._vibe(vibe_name))
+        node = cell.head if cell else None
+        while node:
+            result.append(node.song)
+            node = node.next
+        return result
 
-        # 3. Untuk setiap vibe, urutkan dengan hubungkan node
-        for vibe, arr in buckets.items():
-
-            # urutkan berdasarkan skor vibe
-            arr_sorted = sorted(arr, key=lambda x: self._vibe_score(x))
+    # ----------------------------
+    # TETANGGA TERDEKAT PER ARAH
+    # ----------------------------
+    def _nearest_cell(self, cell, axis, direction):
+        """
+        Sel terdekat di sumbu `axis` ("mood" / "energy") yang nilainya lebih
+        tinggi (direction=1) atau lebih rendah (direction=-1). Di antara sel
+        pada nilai itu dipilih yang sumbu lainnya paling dekat. Sel lain di
+        titik yang sama dianggap tetangga (urut nama vibe). None kalau tidak
+        ada sel ke arah itu. Binary search di by_mood / by_energy.
+        """
+        if axis == "mood":
+            cells, here = self.by_mood, (cell.mood, cell.energy, cell.vibe)
+        else:
+            cells, here = self.by_energy, (cell.energy, cell.mood, cell.vibe)
+        value, other = here[0], here[1]
 
-            # hubungkan node
-            for i in range(len(arr_sorted)):
-                cur = arr_sorted[i]
-                cur_node = self.nodes[self._key(cur)]
+        if direction > 0:
+            i = bisect_right(cells, here)
+            if i < len(cells) and cells[i][:2] == here[:2]:
+                return self.cells[cells[i][2]]
+            # entri pertama dengan nilai sumbu > value
+            start = bisect_right(cells, (value, float("inf")))
+            if start == len(cells):
+                return None
+            target = cells[start][0]
+        else:
+            i = bisect_left(cells, here)
+            if i > 0 and cells[i - 1][:2] == here[:2]:
+                return self.cells[cells[i - 1][2]]
+            # entri terakhir dengan nilai sumbu < value
+            end = bisect_left(cells, (value,))
+            if end == 0:
+                return None
+            target = cells[end - 1][0]
 
-                # mood_up / mood_down
-                if i + 1 < len(arr_sorted):
-                    nxt = arr_sorted[i + 1]
-                    cur_node.mood_up = self.nodes[self._key(nxt)]
+        # di dalam satu nilai sumbu, entri urut menurut sumbu lainnya
+        k = bisect_left(cells, (target, other))
+        candidates = [cells[j] for j in (k, k - 1)
+                      if 0 <= j < len(cells) and cells[j][0] == target]
+        best = min(candidates, key=lambda c: (abs(c[1] - other), c[1]))
+        # beberapa sel di titik itu: ambil yang pertama (urut nama vibe)
+        return self.cells[cells[bisect_left(cells, best[:2])][2]]
 
-                if i - 1 >= 0:
-                    prev = arr_sorted[i - 1]
-                    cur_node.mood_down = self.nodes[self._key(prev)]
+    def get_neighbor(self, song, axis, direction):
+        """Lagu pertama di sel terdekat ke satu arah, mis. get_neighbor(s, "energy", 1)."""
+        node = self._node_of(song)
+        if not node:
+            return None
+        cell = self._nearest_cell(node.cell, axis, direction)
+        if cell is None:
+            return None
+        return (cell.head if direction > 0 else cell.tail).song
 
-                # energy_up/down = mirror mood
-                cur_node.energy_up = cur_node.mood_up
-                cur_node.energy_down = cur_node.mood_down
+    # ----------------------------
+    # URUTAN SEL DI GRID
+    # ----------------------------
+    def _step_cell(self, cell, direction):
+        """
+        Sel berikutnya (direction=1) / sebelumnya (direction=-1) kalau grid
+        disapu urut mood, lalu energy. Memutar ke ujung lain kalau habis,
+        jadi semua vibe pasti terlewati. Binary search di self.by_mood.
+        """
+        here = (cell.mood, cell.energy, cell.vibe)
+        if direction > 0:
+            i = bisect_right(self.by_mood, here)
+            pos = self.by_mood[i if i < len(self.by_mood) else 0]
+        else:
+            pos = self.by_mood[bisect_left(self.by_mood, here) - 1]
+        return self.cells[pos[2]]
 
     # NEXT / PREV VIBE NAVIGATION
     def get_next_vibe(self, song):
-        node = self.nodes.get(self._key(song))
+        node = self._node_of(song)
         if not node:
             return None
 
-        # Prioritas next vibe
-        if node.mood_up:
-            return node.mood_up.song
-        if node.energy_up:
-            return node.energy_up.song
-        if node.mood_down:
-            return node.mood_down.song
-        if node.energy_down:
-            return node.energy_down.song
+        # Prioritas: vibe yang sama dulu, lalu sel berikutnya di grid
+        if node.next:
+            return node.next.song
 
-        return None
+        cell = self._step_cell(node.cell, 1)
+        if cell.head is node:
+            return None
+        return cell.head.song
 
     def get_prev_vibe(self, song):
-        node = self.nodes.get(self._key(song))
+        node = self._node_of(song)
         if not node:
             return None
 
-        if node.mood_down:
-            return node.mood_down.song
-        if node.energy_down:
-            return node.energy_down.song
-        if node.mood_up:
-            return node.mood_up.song
-        if node.energy_up:
-            return node.energy_up.song
+        if node.prev:
+            return node.prev.song
 
-        return None
+        cell = self._step_cell(node.cell, -1)
+        if cell.tail is node:
+            return None
+        return cell.tail.song
 
     # Alias untuk kompatibilitas user_window.py
     def get_next_song_same_vibe(self, song):
         return self.get_next_vibe(song)
 
     def get_prev_song_same_vibe(self, song):
-        return self.get_prev_vibe(song)
\ No newline at end of file
+        return self.get_prev_vibe(song)
@@ -1,4 +1,6 @@
 class Node:
+    __slots__ = ("data", "next", "prev")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -1,13 +1,13 @@
 # structures/playlist.py
-import uuid
 from structures.double_linked_list import DoubleLinkedList
+from structures.song import new_id
 
 class Playlist:
     def __init__(self, name, cover_path=None):
-        self.id = str(uuid.uuid4())
+        self.id = new_id()
         self.name = name
         self.cover_path = cover_path
-        self.songs = DoubleLinkedList()
+        self.songs = DoubleLinkedList(index_by_id=True)
 
     def add_song(self, song):
         self.songs.add_last(song)
@@ -17,15 +17,7 @@ class Playlist:
             self.add_song(song)
 
     def remove_song(self, song_id):
-        idx = 0
-        node = self.songs.head
-        while node:
-            if node.data.id == song_id:
-                self.songs.delete_at(idx)
-                return True
-            node = node.next
-            idx += 1
-        return False
+        return self.songs.remove_by_id(song_id)
 
     def get_all_songs(self):
         return self.songs.to_list()
\ No newline at end of file
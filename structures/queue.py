@@ -1,30 +1,73 @@
 # structures/queue.py
+from structures.double_linked_list import DoubleLinkedList
+
 
 class Queue:
+    """
+    Antrian lagu (FIFO) di atas DoubleLinkedList dengan index id.
+    - enqueue / dequeue / peek O(1)
+    - hapus lagu berdasarkan id O(1), tidak perlu menguras antrian
+    - iterasi tidak mengubah isi antrian
+    """
+
     def __init__(self):
-        self.items = []
+        self.items = DoubleLinkedList(index_by_id=True)
 
     def enqueue(self, item):
-        self.items.append(item)
+        self.items.add_last(item)
+
+    def enqueue_many(self, items):
+        for item in items:
+            self.items.add_last(item)
 
     def dequeue(self):
-        if not self.is_empty():
-            return self.items.pop(0)
-        return None
+        node = self.items.head
+        if node is None:
+            return None
+        self.items.remove_node(node)
+        return node.data
 
     def peek(self):
-        if not self.is_empty():
-            return self.items[0]
-        return None
+        node = self.items.head
+        return node.data if node else None
 
     def is_empty(self):
-        return len(self.items) == 0
+        return self.items.head is None
 
     def size(self):
-        return len(self.items)
+        return self.items.size
 
     def clear(self):
-        self.items = []
+        self.items.clear()
 
     def to_list(self):
-        return list(self.items)
\ No newline at end of file
+        return self.items.to_list()
+
+    def __iter__(self):
+        cur = self.items.head
+        while cur:
+            yield cur.data
+            cur = cur.next
+
+    def __len__(self):
+        return self.items.size
+
+    # HAPUS
+    def remove_by_id(self, song_id):
+        """Hapus kemunculan pertama lagu dengan id tersebut."""
+        return self.items.remove_by_id(song_id)
+
+    def remove_all_by_id(self, song_id):
+        return self.items.remove_all_by_id(song_id)
+
+    def remove(self, song):
+        return self.items.remove_by_id(song.id)
+
+    def contains_id(self, song_id):
+        return self.items.contains_id(song_id)
+
+    # URUTAN BARU (drag & drop di QueueView)
+    def reorder(self, songs):
+        """Ganti urutan antrian sekaligus dengan daftar lagu baru."""
+        self.items.clear()
+        self.enqueue_many(songs)
@@ -0,0 +1,149 @@
+# structures/search_index.py
+
+class SearchIndex:
+    """
+    Inverted index untuk pencarian lagu (judul, artis, genre, vibes).
+    Key: trigram (3 huruf) dari setiap field -> set id lagu.
+
+    Keyword >= 3 huruf cukup mengiris posting list trigram-nya, lalu
+    kandidat dicek ulang dengan substring biasa. Keyword 1-2 huruf
+    memakai field lowercase yang sudah disimpan (tanpa lower() ulang).
+    """
+    GRAM = 3
+
+    def __init__(self):
+        self.postings = {}   # trigram -> set(song_id)
+        self.entries = {}    # song_id -> (urutan, song, fields lowercase)
+        self._counter = 0
+
+    # ----------------------------
+    # Helper
+    # ----------------------------
+    def _fields(self, song):
+        return tuple(
+            (value or "").lower()
+            for value in (song.judul, song.artis, song.genre, song.vibes)
+        )
+
+    def _grams(self, fields):
+        n = self.GRAM
+        return {text[i:i + n] for text in fields for i in range(len(text) - n + 1)}
+
+    # ----------------------------
+    # UPDATE INDEX
+    # ----------------------------
+    def add(self, song):
+        if song.id in self.entries:
+            self.update(song)
+            return
+
+        fields = self._fields(song)
+        self.entries[song.id] = (self._counter, song, fields)
+        self._counter += 1
+
+        for gram in self._grams(fields):
+            self.postings.setdefault(gram, set()).add(song.id)
+
+    def add_many(self, songs):
+        """Index banyak lagu sekaligus (dipakai saat start / import)."""
+        postings = self.postings
+        entries = self.entries
+        order = self._counter
+
+        for song in songs:
+            if song.id in entries:
+                self.update(song)
+                continue
+
+            fields = self._fields(song)
+            entries[song.id] = (order, song, fields)
+            order += 1
+
+            song_id = song.id
+            for gram in self._grams(fields):
+                ids = postings.get(gram)
+                if ids is None:
+                    postings[gram] = {song_id}
+                else:
+                    ids.add(song_id)
+
+        self._counter = order
+
+    def remove(self, song_id):
+        entry = self.entries.pop(song_id, None)
+        if not entry:
+            return False
+
+        for gram in self._grams(entry[2]):
+            ids = self.postings.get(gram)
+            if ids is None:
+                continue
+            ids.discard(song_id)
+            if not ids:
+                del self.postings[gram]
+        return True
+
+    def update(self, song):
+        """Index ulang satu lagu, posisi urutan hasil tetap."""
+        entry = self.entries.get(song.id)
+        if not entry:
+            self.add(song)
+            return
+
+        order, _, old_fields = entry
+        new_fields = self._fields(song)
+        old_grams = self._grams(old_fields)
+        new_grams = self._grams(new_fields)
+
+        for gram in old_grams - new_grams:
+            ids = self.postings.get(gram)
+            if ids is None:
+                continue
+            ids.discard(song.id)
+            if not ids:
+                del self.postings[gram]
+
+        for gram in new_grams - old_grams:
+            self.postings.setdefault(gram, set()).add(song.id)
+
+        self.entries[song.id] = (order, song, new_fields)
+
+    def clear(self):
+        self.postings = {}
+        self.entries = {}
+        self._counter = 0
+
+    # ----------------------------
+    # SEARCH
+    # ----------------------------
+    def search(self, keyword: str):
+        """Return lagu yang field-nya mengandung keyword, urut seperti katalog."""
+        keyword = keyword.lower().strip()
+        if not keyword:
+            return [entry[1] for entry in sorted(self.entries.values(), key=lambda e: e[0])]
+
+        if len(keyword) < self.GRAM:
+            candidates = self.entries.values()
+        else:
+            posting_lists = []
+            for gram in self._grams((keyword,)):
+                ids = self.postings.get(gram)
+                if not ids:
+                    return []
+                posting_lists.append(ids)
+
+            # iris dari posting list terkecil dulu
+            posting_lists.sort(key=len)
+            ids = set(posting_lists[0])
+            for other in posting_lists[1:]:
+                ids &= other
+                if not ids:
+                    return []
+            candidates = [self.entries[song_id] for song_id in ids]
+
+        hits = [
+            entry for entry in candidates
+            if any(keyword in text for text in entry[2])
+        ]
+        hits.sort(key=lambda e: e[0])
+        return [entry[1] for entry in hits]
@@ -1,6 +1,8 @@
 from structures.song import Song
 
 class SLLNode:
+    __slots__ = ("data", "next")
+
     def __init__(self, data: Song):
         self.data = data
         self.next = None
@@ -9,6 +11,7 @@ class SLLNode:
 class SingleLinkedList:
     def __init__(self):
         self.head = None
+        self.tail = None
         self.size = 0
 
     # -------------------------
@@ -17,12 +20,10 @@ class SingleLinkedList:
     def add_last(self, data: Song):
         new_node = SLLNode(data)
         if not self.head:
-            self.head = new_node
+            self.head = self.tail = new_node
         else:
-            cur = self.head
-            while cur.next:
-                cur = cur.next
-            cur.next = new_node
+            self.tail.next = new_node
+            self.tail = new_node
         self.size += 1
 
     # -------------------------
@@ -1,15 +1,87 @@
 # structures/song.py
-import uuid
+import secrets
+import sys
+import threading
+
+
+def new_id():
+    """Id pendek (12 karakter url-safe, 72 bit acak). Id uuid lama tetap valid."""
+    return secrets.token_urlsafe(9)
+
+
+class Vocabulary:
+    """
+    Daftar teks unik (genre / vibes) yang disimpan sebagai kode int kecil.
+    Ribuan lagu dengan genre "Pop" cukup menyimpan kode yang sama,
+    teksnya hanya ada satu kali di sini.
+    """
+    def __init__(self):
+        self.texts = []     # kode -> teks
+        self.codes = {}     # teks -> kode
+        self._lock = threading.Lock()
+
+    def code(self, text):
+        code = self.codes.get(text)
+        if code is None:
+            with self._lock:
+                code = self.codes.get(text)
+                if code is None:
+                    code = len(self.texts)
+                    self.texts.append(text)
+                    self.codes[text] = code
+        return code
+
+    def text(self, code):
+        return self.texts[code]
+
+    def __len__(self):
+        return len(self.texts)
+
+
+GENRES = Vocabulary()
+VIBES = Vocabulary()
+
 
 class Song:
-    def __init__(self, judul, artis, genre, vibes, file_path=None, cover_path=None):
-        self.id = str(uuid.uuid4())
+    __slots__ = ("id", "judul", "_artis", "_genre", "_vibes",
+                 "file_path", "cover_path", "duration")
+
+    def __init__(self, judul, artis, genre, vibes, file_path=None, cover_path=None, song_id=None):
+        self.id = song_id or new_id()
         self.judul = judul
         self.artis = artis
         self.genre = genre
         self.vibes = vibes
         self.file_path = file_path
         self.cover_path = cover_path
+        self.duration = None    # detik, diisi dari cache metadata audio
+
+    # artis di-intern: ribuan lagu artis yang sama berbagi satu string,
+    # termasuk saat diedit (update_song)
+    @property
+    def artis(self):
+        return self._artis
+
+    @artis.setter
+    def artis(self, value):
+        self._artis = sys.intern(value) if isinstance(value, str) else value
+
+    # genre dan vibes disimpan sebagai kode di GENRES / VIBES
+    @property
+    def genre(self):
+        return GENRES.texts[self._genre]
+
+    @genre.setter
+    def genre(self, value):
+        self._genre = GENRES.code(value)
+
+    @property
+    def vibes(self):
+        return VIBES.texts[self._vibes]
+
+    @vibes.setter
+    def vibes(self, value):
+        self._vibes = VIBES.code(value)
 
     def to_dict(self):
         return {
@@ -17,11 +89,11 @@ class Song:
             "artis": self.artis,
             "genre": self.genre,
             "vibes": self.vibes,
-            "file_path": self.file_path,   
+            "file_path": self.file_path,
         }
 
     def __str__(self):
         return f"{self.judul} - {self.artis} ({self.genre}, {self.vibes})"
-    
+
     def __eq__(self, other):
-        return isinstance(other, Song) and self.id == other.id
\ No newline at end of file
+        return isinstance(other, Song) and self.id == other.id
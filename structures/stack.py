@@ -1,6 +1,8 @@
 # structures/stack.py
 
 class StackNode:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -0,0 +1,136 @@
+# structures/trie.py
+import heapq
+
+class TrieNode:
+    __slots__ = ("children", "count", "display", "best")
+
+    def __init__(self):
+        self.children = {}
+        self.count = 0          # jumlah lagu yang memakai kata ini
+        self.display = None     # teks asli (bukan lowercase) untuk ditampilkan
+        self.best = 0           # count terbesar di subtree ini (untuk top-k)
+
+    def update_best(self):
+        best = self.count
+        for child in self.children.values():
+            if child.best > best:
+                best = child.best
+        self.best = best
+
+
+class Trie:
+    """
+    Prefix tree untuk saran pencarian (judul, artis, genre, vibes).
+    Key dinormalisasi (lowercase, spasi dirapikan), tapi hasil saran
+    memakai teks aslinya.
+
+    Setiap node menyimpan `best` (count terbesar di subtree-nya), jadi
+    complete() bisa mengambil k saran terpopuler dengan best-first search
+    tanpa menjelajah seluruh subtree prefix.
+    """
+    def __init__(self):
+        self.root = TrieNode()
+
+    @staticmethod
+    def normalize(text):
+        return " ".join((text or "").lower().split())
+
+    # ----------------------------
+    # INSERT / REMOVE
+    # ----------------------------
+    def insert(self, text, count=1):
+        key = self.normalize(text)
+        if not key:
+            return
+
+        path = [self.root]
+        node = self.root
+        for ch in key:
+            nxt = node.children.get(ch)
+            if nxt is None:
+                nxt = node.children[ch] = TrieNode()
+            node = nxt
+            path.append(node)
+
+        if node.count == 0:
+            node.display = " ".join(text.split())
+        node.count += count
+
+        # count hanya naik, cukup max di sepanjang jalur
+        for n in path:
+            if node.count > n.best:
+                n.best = node.count
+
+    def remove(self, text):
+        key = self.normalize(text)
+        if not key:
+            return False
+
+        path = [self.root]
+        node = self.root
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return False
+            path.append(node)
+
+        if node.count == 0:
+            return False
+
+        node.count -= 1
+        if node.count == 0:
+            node.display = None
+
+            # pangkas node yang sudah tidak dipakai
+            for i in range(len(key) - 1, -1, -1):
+                child = path[i + 1]
+                if child.count or child.children:
+                    break
+                del path[i].children[key[i]]
+                path.pop()
+
+        # hitung ulang best dari bawah ke atas
+        for n in reversed(path):
+            n.update_best()
+        return True
+
+    # ----------------------------
+    # COMPLETE
+    # ----------------------------
+    def complete(self, prefix, limit=8):
+        """
+        Return maksimal `limit` teks yang diawali prefix, urut dari yang
+        paling banyak dipakai (count), seri diurutkan alfabetis.
+        """
+        key = self.normalize(prefix)
+        if not key or limit <= 0:
+            return []
+
+        node = self.root
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+
+        # best-first: entri (-prioritas, key, jenis, node)
+        # jenis 0 = kata siap diambil, 1 = subtree yang belum dibuka
+        result = []
+        heap = [(-node.best, key, 1, node)]
+        while heap and len(result) < limit:
+            _, cur_key, kind, cur = heapq.heappop(heap)
+            if kind == 0:
+                result.append(cur.display)
+                continue
+            if cur.count:
+                heapq.heappush(heap, (-cur.count, cur_key, 0, cur))
+            for ch, child in cur.children.items():
+                heapq.heappush(heap, (-child.best, cur_key + ch, 1, child))
+        return result
+
+    def __contains__(self, text):
+        node = self.root
+        for ch in self.normalize(text):
+            node = node.children.get(ch)
+            if node is None:
+                return False
+        return node.count > 0
@@ -0,0 +1,191 @@
+# tests/test_audio_metadata.py
+import os
+import struct
+
+import controllers.audio_metadata as audio_metadata
+from controllers.audio_metadata import MetadataCache, format_duration, parse_mp3
+from structures.song import Song
+
+# MPEG-1 Layer III, 128 kbps, 44100 Hz, stereo: 417 byte per frame
+FRAME_HEADER = b"\xff\xfb\x90\x00"
+FRAME_LENGTH = 144 * 128000 // 44100
+
+
+def frames(count, xing=None):
+    first = bytearray(FRAME_HEADER + bytes(FRAME_LENGTH - 4))
+    if xing is not None:
+        # header Xing setelah side info (32 byte untuk MPEG-1 stereo)
+        first[36:48] = b"Xing" + struct.pack(">II", 1, xing)
+    return bytes(first) + (FRAME_HEADER + bytes(FRAME_LENGTH - 4)) * (count - 1)
+
+
+def syncsafe(n):
+    return bytes(((n >> 21) & 0x7F, (n >> 14) & 0x7F, (n >> 7) & 0x7F, n & 0x7F))
+
+
+def unsync(data):
+    return data.replace(b"\xff", b"\xff\x00")
+
+
+def text_frame(frame_id, text, major, flags=0, dli=False, unsynced=False):
+    body = b"\x00" + text.encode("latin-1")
+    if unsynced:
+        body = unsync(body)
+    if dli:
+        body = syncsafe(len(body)) + body
+    size = syncsafe(len(body)) if major == 4 else struct.pack(">I", len(body))
+    return frame_id.encode() + size + bytes((0, flags)) + body
+
+
+def id3(major, frames_bytes, flags=0, padding=20):
+    tag = frames_bytes + bytes(padding)
+    return b"ID3" + bytes((major, 0, flags)) + syncsafe(len(tag)) + tag
+
+
+def write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_cbr_duration_from_size(tmp_path):
+    path = write(tmp_path, "cbr.mp3", frames(100))
+    info = parse_mp3(path)
+    assert info.bitrate == 128 and info.sample_rate == 44100
+    assert abs(info.duration - 100 * FRAME_LENGTH * 8 / 128000) < 1e-9
+
+
+def test_xing_frame_count_and_id3v1_trailer(tmp_path):
+    data = frames(10, xing=1000) + b"TAG" + bytes(125)
+    info = parse_mp3(write(tmp_path, "vbr.mp3", data))
+    assert abs(info.duration - 1000 * 1152 / 44100) < 1e-9
+    # bitrate rata-rata dihitung dari data audio tanpa tag ID3v1
+    assert info.bitrate == round(10 * FRAME_LENGTH * 8 / info.duration / 1000)
+
+
+def test_id3v23_tags_and_audio_offset(tmp_path):
+    tag = id3(3, text_frame("TIT2", "Judul", 3) + text_frame("TPE1", "Artis", 3)
+              + text_frame("TCON", "Pop", 3))
+    info = parse_mp3(write(tmp_path, "v23.mp3", tag + frames(50)))
+    assert (info.title, info.artist, info.genre, info.album) == ("Judul", "Artis", "Pop", None)
+    assert abs(info.duration - 50 * FRAME_LENGTH * 8 / 128000) < 1e-9
+
+
+def test_id3v23_whole_tag_unsync(tmp_path):
+    # byte FF di judul dan di ukuran frame ikut di-unsync
+    body = text_frame("TIT2", "Caf\xff" * 80, 3) + text_frame("TPE1", "\xffrtis", 3)
+    tag = id3(3, unsync(body), flags=0x80)
+    info = parse_mp3(write(tmp_path, "v23u.mp3", tag + frames(5)))
+    assert info.title == "Caf\xff" * 80
+    assert info.artist == "\xffrtis"
+    assert info.sample_rate == 44100
+
+
+def test_id3v24_per_frame_unsync_and_dli(tmp_path):
+    body = (text_frame("TIT2", "Lagu\xff", 4, flags=0x02, unsynced=True)
+            + text_frame("TPE1", "Art\xffs", 4, flags=0x03, dli=True, unsynced=True)
+            + text_frame("TALB", "Album", 4, flags=0x01, dli=True)
+            + text_frame("TCON", "Terenkripsi", 4, flags=0x04))
+    info = parse_mp3(write(tmp_path, "v24.mp3", id3(4, body) + frames(5)))
+    assert (info.title, info.artist, info.album, info.genre) == \
+        ("Lagu\xff", "Art\xffs", "Album", None)
+
+
+def test_embedded_cover_saved_once(tmp_path):
+    image = b"\x89PNG" + bytes(30)
+    apic = b"\x00image/png\x00\x03desc\x00" + image
+    frame = b"APIC" + struct.pack(">I", len(apic)) + b"\x00\x00" + apic
+    path = write(tmp_path, "art.mp3", id3(3, frame) + frames(3))
+
+    art_dir = str(tmp_path / "art")
+    first = parse_mp3(path, art_dir)
+    assert first.art_path.endswith(".png")
+    with open(first.art_path, "rb") as f:
+        assert f.read() == image
+    assert parse_mp3(path, art_dir).art_path == first.art_path
+    assert len(os.listdir(art_dir)) == 1
+
+
+def test_not_mp3(tmp_path):
+    info = parse_mp3(write(tmp_path, "kosong.mp3", b"bukan audio" * 10))
+    assert info.duration is None and info.title is None
+
+
+def test_format_duration():
+    assert format_duration(None) == "--:--"
+    assert format_duration(187.4) == "3:07"
+    assert format_duration(3725) == "1:02:05"
+
+
+# ----------------------------
+# CACHE
+# ----------------------------
+def counting_parser(monkeypatch):
+    calls = []
+    parse = audio_metadata.parse_mp3
+
+    def counted(path, art_dir=None):
+        calls.append(path)
+        return parse(path, art_dir)
+    monkeypatch.setattr(audio_metadata, "parse_mp3", counted)
+    return calls
+
+
+def test_cache_reuses_until_file_changes(tmp_path, monkeypatch):
+    calls = counting_parser(monkeypatch)
+    path = write(tmp_path, "a.mp3", frames(10))
+    cache = MetadataCache(str(tmp_path / "meta" / "media.db"))
+
+    first = cache.lookup(path)
+    assert cache.lookup(path).duration == first.duration
+    assert calls == [path]
+
+    with open(path, "ab") as f:
+        f.write(frames(10))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert cache.get(path) is None
+    assert abs(cache.lookup(path).duration - 2 * first.duration) < 1e-9
+    assert len(calls) == 2
+    assert cache.lookup(str(tmp_path / "hilang.mp3")) is None
+    cache.close()
+
+    # cache tetap ada setelah dibuka ulang
+    reopened = MetadataCache(str(tmp_path / "meta" / "media.db"))
+    assert reopened.get(path).duration == 2 * first.duration
+    reopened.close()
+
+
+def test_scan_batches_cache_hits_and_misses(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_metadata, "SCAN_CHUNK", 4)
+    calls = counting_parser(monkeypatch)
+    songs = [Song(f"Lagu {i}", "A", "Pop", "Happy", write(tmp_path, f"{i}.mp3", frames(i + 1)),
+                  song_id=f"s{i}") for i in range(10)]
+    songs.append(Song("Hilang", "A", "Pop", "Happy", str(tmp_path / "hilang.mp3"), song_id="x"))
+    songs.append(Song("Tanpa file", "A", "Pop", "Happy", song_id="y"))
+    cache = MetadataCache(str(tmp_path / "media.db"), max_workers=2)
+    cache.lookup(songs[0].file_path)
+
+    writes = []
+    put_many = cache.put_many
+    monkeypatch.setattr(cache, "put_many", lambda items: (writes.append(len(items)), put_many(items)))
+
+    seen = {}
+    futures = cache.scan(songs, lambda song, info: seen.__setitem__(song.id, info))
+    for future in futures.result(5):
+        future.result(5)
+
+    # tiap lagu dengan file dikabari sekali; yang belum di-cache di-parse per potongan
+    assert set(seen) == {f"s{i}" for i in range(10)} | {"x"}
+    assert seen["x"] is None
+    assert sorted(writes) == [1, 4, 4]
+    assert len(calls) == 10
+    for i in range(10):
+        assert abs(songs[i].duration - (i + 1) * FRAME_LENGTH * 8 / 128000) < 1e-9
+
+    # scan kedua: semua dari cache, tanpa parse / tulis
+    seen.clear()
+    assert cache.scan(songs[:10], lambda song, info: seen.__setitem__(song.id, info)).result(5) == []
+    assert len(seen) == 10 and len(calls) == 10 and len(writes) == 3
+    assert cache.scan([songs[-1]]) is None
+    cache.close()
@@ -0,0 +1,100 @@
+# tests/test_bulk_import.py
+import os
+import struct
+
+import controllers.bulk_import as bulk_import
+from controllers.audio_metadata import MetadataCache
+from controllers.bulk_import import existing_paths, import_folder, parse_filename, prepare_import
+from controllers.lagu_controller import SongController
+from structures.song import Song
+
+# satu frame MPEG-1 Layer III 128 kbps 44100 Hz (417 byte)
+FRAME = b"\xff\xfb\x90\x00" + bytes(144 * 128000 // 44100 - 4)
+
+
+def mp3(path, frames=10, title=None):
+    tag = b""
+    if title:
+        body = b"\x00" + title.encode("latin-1")
+        frame = b"TIT2" + struct.pack(">I", len(body)) + b"\x00\x00" + body
+        tag = b"ID3\x03\x00\x00" + bytes((0, 0, 0, len(frame))) + frame
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(tag + FRAME * frames)
+    return path
+
+
+def test_parse_filename():
+    assert parse_filename("Judul - Artis - Pop - Happy") == ("Judul", "Artis", "Pop", "Happy")
+    assert parse_filename("God_s Plan - Drake - Rap - Hype") == ("God's Plan", "Drake", "Rap", "Hype")
+    assert parse_filename("A - B - C - D - E") == ("A B", "C", "D", "E")
+    assert parse_filename("cuma judul") is None
+    assert parse_filename("A -  - C - D") is None
+
+
+def test_prepare_import_walks_folder(tmp_path):
+    root = tmp_path / "musik"
+    a = mp3(str(root / "Satu - Artis - Pop - Happy.mp3"), frames=20)
+    b = mp3(str(root / "sub" / "tanpa format.mp3"), title="Dari Tag")
+    skip = mp3(str(root / "Lama - X - Y - Z.mp3"))
+    (root / "sub" / "TANPA FORMAT.png").write_bytes(b"png")
+    (root / "catatan.txt").write_text("bukan audio")
+
+    covers = tmp_path / "covers"
+    covers.mkdir()
+    (covers / "satu - artis - pop - happy.jpg").write_bytes(b"jpg")
+
+    metadata = MetadataCache(str(tmp_path / "media.db"))
+    existing = {os.path.normcase(os.path.abspath(skip))}
+    result = prepare_import(str(root), existing, metadata, cover_dirs=(str(covers),))
+
+    assert result.skipped == 1
+    by_path = {song.file_path: song for song in result.songs}
+    assert set(by_path) == {a, b}
+    first, second = by_path[a], by_path[b]
+    assert (first.judul, first.artis, first.genre, first.vibes) == ("Satu", "Artis", "Pop", "Happy")
+    assert first.cover_path == str(covers / "satu - artis - pop - happy.jpg")
+    assert abs(first.duration - 20 * len(FRAME) * 8 / 128000) < 1e-9
+    assert (second.judul, second.artis) == ("Dari Tag", "Unknown")
+    assert second.cover_path == str(root / "sub" / "TANPA FORMAT.png")
+    # hasil parse langsung masuk cache metadata
+    assert metadata.get(a).duration == first.duration
+    metadata.close()
+
+
+def test_process_pool_matches_inline(tmp_path, monkeypatch):
+    root = tmp_path / "musik"
+    for i in range(6):
+        mp3(str(root / f"Lagu {i} - Artis - Pop - Happy.mp3"), frames=i + 1)
+    paths, _ = bulk_import.scan_folder(str(root))
+
+    inline = bulk_import._parse_all(paths)
+    monkeypatch.setattr(bulk_import, "POOL_THRESHOLD", 2)
+    monkeypatch.setattr(bulk_import, "CHUNK_SIZE", 2)
+    pooled = bulk_import._parse_all(paths, max_workers=2)
+
+    assert [(p, fields, info.duration) for p, _, fields, info in pooled] == \
+        [(p, fields, info.duration) for p, _, fields, info in inline]
+
+
+def test_import_folder_adds_one_batch(tmp_path):
+    root = tmp_path / "musik"
+    for i in range(3):
+        mp3(str(root / f"Lagu {i} - Artis - Jazz - Chill.mp3"))
+
+    controller = SongController(songs=[Song("Ada", "A", "Pop", "Happy", song_id="ada")])
+    controller.wait_until_ready(5)
+    events = []
+    controller.subscribe(events.append)
+
+    result = import_folder(controller, str(root), cover_dirs=())
+    assert len(result.songs) == 3 and result.skipped == 0
+    assert len(events) == 1 and events[0].kind == "batch"
+    assert list(events[0].added.values()) == result.songs
+    assert [s.judul for s in controller.search("lagu")] == ["Lagu 0", "Lagu 1", "Lagu 2"]
+    assert len(controller.get_songs_by_vibe("chill")) == 3
+
+    # import kedua: semua file sudah ada di katalog
+    again = import_folder(controller, str(root), cover_dirs=())
+    assert again.songs == [] and again.skipped == 3
+    assert len(existing_paths(controller)) == 3
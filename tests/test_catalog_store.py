@@ -0,0 +1,65 @@
+# tests/test_catalog_store.py
+import os
+
+from controllers.catalog_store import CatalogStore
+from controllers.lagu_controller import SongController
+from controllers.paths import BASE_DIR
+from structures.song import Song
+
+
+def fields(song):
+    return (song.id, song.judul, song.artis, song.genre, song.vibes, song.file_path, song.cover_path)
+
+
+def test_crud_persists_across_reopen(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    store = CatalogStore(path)
+    assert store.is_empty()
+
+    songs = [Song(f"Lagu {i}", "Artis", "Pop", "Happy", song_id=f"s{i}") for i in range(4)]
+    store.add_many(songs[:3])
+    store.add(songs[3])
+    songs[1].judul = "Diedit"
+    store.update(songs[1])
+    store.delete("s2")
+    store.close()
+
+    reopened = CatalogStore(path)
+    assert not reopened.is_empty()
+    assert [fields(s) for s in reopened.load_all()] == \
+        [fields(s) for s in (songs[0], songs[1], songs[3])]
+    reopened.close()
+
+
+def test_paths_inside_project_are_stored_relative(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    inside = os.path.join(BASE_DIR, "assets", "lagu.mp3")
+    outside = str(tmp_path / "luar.mp3")
+
+    store = CatalogStore(path)
+    store.add(Song("A", "B", "Pop", "Happy", inside, outside, song_id="x"))
+    raw = store.conn.execute("SELECT file_path, cover_path FROM songs").fetchone()
+    assert raw == ("assets/lagu.mp3", outside)
+    assert fields(store.load_all()[0])[5:] == (inside, outside)
+    store.close()
+
+
+def test_controller_cold_start_from_store(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    store = CatalogStore(path)
+    controller = SongController(store=store)
+    controller.wait_until_ready(5)
+    first = [fields(s) for s in controller.get_all_songs()]
+    assert first     # lagu default tersimpan saat store masih kosong
+
+    song = Song("Baru", "Artis", "Jazz", "Chill", song_id="baru")
+    controller.add_song(song)
+    controller.delete_song_by_id(first[0][0])
+    store.close()
+
+    store = CatalogStore(path)
+    reloaded = SongController(store=store)
+    reloaded.wait_until_ready(5)
+    assert [fields(s) for s in reloaded.get_all_songs()] == first[1:] + [fields(song)]
+    assert reloaded.search("baru") == [reloaded.find_song_by_id("baru")]
+    store.close()
@@ -0,0 +1,105 @@
+# tests/test_double_linked_list.py
+import random
+
+from structures.double_linked_list import DoubleLinkedList
+from structures.song import Song
+
+
+def song(i):
+    return Song(f"Lagu {i}", "Artis", "Pop", "Happy", song_id=f"s{i}")
+
+
+def check(dll):
+    """Link dua arah, size, dan index id konsisten dengan isi list."""
+    forward = dll.to_list()
+    backward = []
+    cur = dll.tail
+    while cur:
+        backward.append(cur.data)
+        cur = cur.prev
+    assert backward[::-1] == forward
+    assert dll.size == len(forward)
+
+    expected = {}
+    cur = dll.head
+    while cur:
+        expected.setdefault(cur.data.id, []).append(cur)
+        cur = cur.next
+    assert dll._index == expected
+
+
+def test_index_tracks_random_operations():
+    rng = random.Random(3)
+    songs = [song(i) for i in range(8)]
+    dll = DoubleLinkedList(index_by_id=True)
+
+    for _ in range(500):
+        op = rng.random()
+        s = rng.choice(songs)
+        if op < 0.3:
+            dll.add_last(s)
+        elif op < 0.45:
+            dll.add_first(s)
+        elif op < 0.65:
+            dll.remove_by_id(s.id)
+        elif op < 0.75:
+            dll.remove_all_by_id(s.id)
+        elif op < 0.9 and dll.size:
+            dll.delete_at(rng.randrange(dll.size))
+        else:
+            node = dll.find_node_by_id(s.id)
+            assert (node is not None) == dll.contains_id(s.id)
+            if node:
+                # kemunculan pertama dari depan
+                assert node is next(n for n in _nodes(dll) if n.data.id == s.id)
+        check(dll)
+
+
+def _nodes(dll):
+    cur = dll.head
+    while cur:
+        yield cur
+        cur = cur.next
+
+
+def test_duplicates_removed_front_to_back():
+    a, b = song(1), song(2)
+    dll = DoubleLinkedList(index_by_id=True)
+    for s in (a, b, a, b, a):
+        dll.add_last(s)
+
+    first = dll.head
+    assert dll.find_node_by_id("s1") is first
+    assert dll.remove_by_id("s1")
+    assert dll.head.data is b
+    assert dll.remove_all_by_id("s1") == 2
+    assert dll.to_list() == [b, b]
+    assert dll.find_by_id("s1") is None
+    check(dll)
+
+
+def test_jump_and_clear_with_index():
+    songs = [song(i) for i in range(3)]
+    dll = DoubleLinkedList(index_by_id=True)
+    for s in songs:
+        dll.add_last(s)
+
+    assert dll.jump_to_song(songs[2]) is dll.tail
+    assert dll.next_song() is songs[0]
+    assert dll.prev_song() is songs[2]
+
+    dll.clear()
+    assert dll._index == {} and dll.size == 0
+    assert dll.jump_to_song(songs[0]) is None
+
+
+def test_without_index_behaves_the_same():
+    songs = [song(i) for i in range(4)]
+    plain, indexed = DoubleLinkedList(), DoubleLinkedList(index_by_id=True)
+    for dll in (plain, indexed):
+        for s in songs + songs[:2]:
+            dll.add_last(s)
+        dll.remove_by_id("s0")
+        dll.remove(songs[3])
+    assert plain.to_list() == indexed.to_list()
+    assert plain.find_by_id("s1") is indexed.find_by_id("s1")
@@ -0,0 +1,59 @@
+# tests/test_history.py
+import pytest
+
+from structures.history import History
+from structures.song import Song
+
+
+def make_songs(n):
+    return [Song(f"Lagu {i}", "Artis", "Pop", "Happy", song_id=f"s{i}") for i in range(n)]
+
+
+def test_ring_buffer_keeps_newest_entries():
+    songs = make_songs(5)
+    history = History(capacity=3)
+    for s in songs:
+        history.push(s)
+
+    assert len(history) == history.size() == 3
+    assert list(history) == [songs[4], songs[3], songs[2]]
+    # iterasi tidak mengubah isi
+    assert history.display() == list(history)
+    assert history.peek() is songs[4]
+
+
+def test_pop_then_push_wraps_around():
+    songs = make_songs(6)
+    history = History(capacity=3)
+    for s in songs[:4]:
+        history.push(s)
+
+    assert history.pop() is songs[3]
+    assert history.pop() is songs[2]
+    history.push(songs[4])
+    history.push(songs[5])
+    assert list(history) == [songs[5], songs[4], songs[1]]
+
+    for _ in range(3):
+        history.pop()
+    assert history.is_empty()
+    assert history.pop() is None and history.peek() is None
+
+
+def test_recent_unique_and_limit():
+    a, b, c = make_songs(3)
+    history = History()
+    for s in (a, b, a, c, a):
+        history.push(s)
+
+    assert history.recent() == [a, c, b]
+    assert history.recent(2) == [a, c]
+    assert history.recent(3, unique=False) == [a, c, a]
+
+    history.clear()
+    assert history.recent() == [] and len(history) == 0
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        History(capacity=0)
@@ -0,0 +1,154 @@
+# tests/test_history_store.py
+import os
+import struct
+import threading
+from array import array
+
+import controllers.history_store as history_store
+from controllers.history_store import LOG_NAME, SNAPSHOT_NAME, HistoryStore
+
+
+def ids(entries):
+    return [song_id for _, song_id in entries]
+
+
+def test_replay_after_crash_mid_append(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    for i in range(5):
+        store.append(f"s{i}", ts=float(i))
+    store.flush()
+    # crash di tengah menulis baris: baris terakhir terpotong tanpa "\n"
+    store._file.write("5.0\ts")
+    store._file.flush()
+    store._file.close()
+
+    reopened = HistoryStore(str(tmp_path))
+    assert len(reopened) == 5
+    assert ids(reopened.last(2)) == ["s4", "s3"]
+    reopened.append("s9", ts=9.0)
+    reopened.close()
+
+    # entri baru tidak tersambung ke sisa baris yang terpotong
+    again = HistoryStore(str(tmp_path))
+    assert again.last(2) == [(9.0, "s9"), (4.0, "s4")]
+    assert len(again) == 6
+    again.close()
+
+
+def test_rotation_and_compaction_keep_every_entry(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    for i in range(10):
+        store.append(f"s{i % 4}", ts=float(i))
+    store.compact()
+
+    assert not store._segments and not store._pending
+    assert not any(name.startswith(LOG_NAME + ".") for name in os.listdir(tmp_path))
+    assert store._snapshot_info() == (10, 1)
+
+    for i in range(10, 15):
+        store.append(f"s{i % 4}", ts=float(i))
+    store.compact()
+    assert store._snapshot_info() == (15, 2)
+    assert [ts for ts, _ in store.between(3, 12)] == [float(i) for i in range(3, 13)]
+    assert ids(store.last(3)) == ["s2", "s1", "s0"]
+    store.close()
+
+    reopened = HistoryStore(str(tmp_path))
+    assert len(reopened) == 15
+    assert ids(reopened.between(0, 100)) == [f"s{i % 4}" for i in range(15)]
+    reopened.close()
+
+
+def test_crash_between_rotation_and_snapshot(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    for i in range(4):
+        store.append(f"a{i}", ts=float(i))
+    store.compact()
+    for i in range(4, 7):
+        store.append(f"b{i}", ts=float(i))
+    store.flush()
+    store.close()
+
+    # segmen yang belum dipadatkan (crash sebelum snapshot generasi 2 ditulis)
+    os.replace(tmp_path / LOG_NAME, tmp_path / f"{LOG_NAME}.2")
+    # segmen lama yang sudah terlipat ke snapshot generasi 1 (crash sebelum dihapus)
+    with open(tmp_path / f"{LOG_NAME}.1", "w", encoding="utf-8") as f:
+        f.write("0.0\ta0\n")
+
+    reopened = HistoryStore(str(tmp_path))
+    reopened.close()   # menunggu compaction ulang selesai
+    assert not os.path.exists(tmp_path / f"{LOG_NAME}.1")
+    assert not os.path.exists(tmp_path / f"{LOG_NAME}.2")
+
+    final = HistoryStore(str(tmp_path))
+    assert ids(final.between(0, 100)) == ["a0", "a1", "a2", "a3", "b4", "b5", "b6"]
+    assert final._snapshot_info() == (7, 2)
+    final.close()
+
+
+def test_compaction_racing_with_appends(tmp_path, monkeypatch):
+    monkeypatch.setattr(history_store, "COMPACT_AFTER", 50)
+    store = HistoryStore(str(tmp_path))
+
+    # tahan compaction di tengah jalan supaya append & baca jalan bersamaan
+    gate = threading.Event()
+    write_snapshot = store._write_snapshot
+
+    def slow_write(*args):
+        gate.wait(5)
+        write_snapshot(*args)
+    monkeypatch.setattr(store, "_write_snapshot", slow_write)
+
+    for i in range(120):
+        store.append(f"s{i}", ts=float(i))
+        if i == 60:
+            assert store._compacting()
+            # selama compaction, semua entri tetap terbaca
+            assert ids(store.between(0, 1000)) == [f"s{j}" for j in range(61)]
+            assert len(store) == 61
+            gate.set()
+    store.compact()
+
+    assert ids(store.between(0, 1000)) == [f"s{i}" for i in range(120)]
+    assert ids(store.last(3)) == ["s119", "s118", "s117"]
+    assert len(store) == 120
+    store.close()
+
+    reopened = HistoryStore(str(tmp_path))
+    assert len(reopened) == 120
+    reopened.close()
+
+
+def test_timestamps_stay_sorted(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    store.append("a", ts=10.0)
+    store.append("b", ts=5.0)     # jam mundur: ditahan di timestamp terakhir
+    store.compact()
+    store.append("c", ts=1.0)
+    assert store.between(10.0, 10.0) == [(10.0, "a"), (10.0, "b"), (10.0, "c")]
+    assert store.between(0, 9.9) == []
+    store.compact()
+    store.close()
+
+    # setelah dibuka ulang, batas bawah diambil dari ujung snapshot
+    reopened = HistoryStore(str(tmp_path))
+    reopened.append("d", ts=2.0)
+    assert ids(reopened.between(10.0, 10.0)) == ["a", "b", "c", "d"]
+    reopened.close()
+
+
+def test_reads_old_snapshot_format(tmp_path):
+    vocab = "x\ny".encode("utf-8")
+    with open(tmp_path / SNAPSHOT_NAME, "wb") as f:
+        f.write(struct.pack("<4sII", b"GSH1", 3, len(vocab)))
+        f.write(vocab)
+        array("d", [1.0, 2.0, 3.0]).tofile(f)
+        array("I", [0, 1, 0]).tofile(f)
+
+    store = HistoryStore(str(tmp_path))
+    assert store.between(2.0, 3.0) == [(2.0, "y"), (3.0, "x")]
+    store.append("z", ts=4.0)
+    store.compact()
+    assert store._snapshot_info() == (4, 1)
+    assert ids(store.last(4)) == ["z", "x", "y", "x"]
+    store.close()
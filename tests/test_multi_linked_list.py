@@ -0,0 +1,177 @@
+# tests/test_multi_linked_list.py
+import random
+
+from controllers.playback_scheduler import PlaybackScheduler
+from structures.double_linked_list import DoubleLinkedList
+from structures.multi_linked_list import VIBE_COORDINATES, MultiLinkedList
+from structures.queue import Queue
+from structures.song import Song
+
+
+def song(i, vibe):
+    return Song(f"Lagu {i}", f"Artis {i}", "Pop", vibe, song_id=f"s{i}")
+
+
+def make_grid(coords):
+    """MLL dengan satu lagu per vibe; coords: vibe -> (mood, energy)."""
+    saved = dict(VIBE_COORDINATES)
+    VIBE_COORDINATES.clear()
+    VIBE_COORDINATES.update(coords)
+    try:
+        mll = MultiLinkedList()
+        songs = {v: song(i, v) for i, v in enumerate(coords)}
+        for s in songs.values():
+            mll.add_song(s)
+    finally:
+        VIBE_COORDINATES.clear()
+        VIBE_COORDINATES.update(saved)
+    return mll, songs
+
+
+def brute_neighbor(coords, vibe, axis, direction):
+    """Versi linear dari _nearest_cell, untuk pembanding."""
+    a, b = (0, 1) if axis == "mood" else (1, 0)
+    here = coords[vibe]
+    key = lambda v: (coords[v][a], coords[v][b], v)
+    same = sorted((v for v in coords if coords[v] == here), key=key)
+    pos = same.index(vibe)
+    if 0 <= pos + direction < len(same):
+        return same[pos + direction]
+    side = [v for v in coords
+            if (coords[v][a] - here[a]) * direction > 0]
+    if not side:
+        return None
+    target = min(coords[v][a] for v in side) if direction > 0 else \
+        max(coords[v][a] for v in side)
+    row = [v for v in side if coords[v][a] == target]
+    return min(row, key=lambda v: (abs(coords[v][b] - here[b]), coords[v][b], v))
+
+
+def test_mood_and_energy_are_independent_axes():
+    # start di (2,2); satu sel off-diagonal di tiap arah
+    mll, songs = make_grid({"start": (2, 2), "happy": (8, 2), "hype": (2, 8)})
+    start = songs["start"]
+
+    assert mll.get_neighbor(start, "mood", 1) is songs["happy"]
+    assert mll.get_neighbor(start, "energy", 1) is songs["hype"]
+    assert mll.get_neighbor(start, "mood", -1) is None
+    assert mll.get_neighbor(start, "energy", -1) is None
+    assert mll.get_neighbor(songs["happy"], "mood", -1) is start
+    assert mll.get_neighbor(songs["hype"], "energy", -1) is start
+
+
+def test_neighbor_prefers_closest_on_other_axis():
+    mll, songs = make_grid({
+        "start": (5, 5), "far": (6, 0), "near": (6, 6), "skip": (9, 5),
+    })
+    assert mll.get_neighbor(songs["start"], "mood", 1) is songs["near"]
+    assert mll.get_neighbor(songs["start"], "energy", 1) is songs["near"]
+    assert mll.get_neighbor(songs["start"], "energy", -1) is songs["far"]
+
+
+def test_neighbor_matches_brute_force():
+    rng = random.Random(5)
+    for _ in range(100):
+        coords = {f"v{i}": (rng.randint(0, 4), rng.randint(0, 4))
+                  for i in range(rng.randint(1, 12))}
+        mll, songs = make_grid(coords)
+        for vibe, s in songs.items():
+            for axis in ("mood", "energy"):
+                for direction in (1, -1):
+                    want = brute_neighbor(coords, vibe, axis, direction)
+                    got = mll.get_neighbor(s, axis, direction)
+                    assert got is (songs[want] if want else None), (coords, vibe, axis, direction)
+
+
+def test_incremental_updates_keep_axis_lists_sorted():
+    rng = random.Random(9)
+    vibes = list(VIBE_COORDINATES) + ["unknown"]
+    mll = MultiLinkedList()
+    live = {}
+    for step in range(400):
+        op = rng.random()
+        if live and op < 0.3:
+            s = live.pop(rng.choice(list(live)))
+            assert mll.remove_song(s)
+        elif live and op < 0.6:
+            s = live[rng.choice(list(live))]
+            s.vibes = rng.choice(vibes)
+            mll.update_song(s)
+        else:
+            s = song(step, rng.choice(vibes))
+            live[s.id] = s
+            mll.add_song(s)
+
+        used = {mll._vibe(s.vibes) for s in live.values()}
+        assert set(mll.cells) == used
+        assert mll.by_mood == sorted((c.mood, c.energy, v) for v, c in mll.cells.items())
+        assert mll.by_energy == sorted((c.energy, c.mood, v) for v, c in mll.cells.items())
+        for v, c in mll.cells.items():
+            assert c.size == len(mll.get_songs_by_vibe(v)) > 0
+
+
+def test_incremental_matches_rebuild():
+    rng = random.Random(4)
+    vibes = list(VIBE_COORDINATES)
+    songs = [song(i, rng.choice(vibes)) for i in range(60)]
+    mll = MultiLinkedList()
+    mll.rebuild(songs)
+
+    for step in range(100):
+        s = rng.choice(songs)
+        if step % 3 == 0:
+            s.judul = f"Judul baru {step}"
+        s.vibes = rng.choice(vibes)
+        mll.update_song(s)
+    gone = songs.pop(0)
+    mll.remove_song(gone)
+
+    fresh = MultiLinkedList()
+    fresh.rebuild(songs)
+    assert mll.by_mood == fresh.by_mood and mll.by_energy == fresh.by_energy
+    assert set(mll.nodes) == set(fresh.nodes)
+    for vibe in fresh.cells:
+        assert {s.id for s in mll.get_songs_by_vibe(vibe)} == \
+            {s.id for s in fresh.get_songs_by_vibe(vibe)}
+    # lagu yang dihapus tidak ditemukan lagi; key ikut judul yang baru
+    assert mll.get_next_vibe(gone) is None
+    for s in songs:
+        assert mll.nodes[mll._key(s)].song is s
+
+
+def test_next_vibe_visits_every_song():
+    mll = MultiLinkedList()
+    songs = [song(i, v) for i, v in enumerate(list(VIBE_COORDINATES) * 2)]
+    for s in songs:
+        mll.add_song(s)
+
+    seen = []
+    cur = songs[0]
+    for _ in range(len(songs)):
+        seen.append(cur)
+        cur = mll.get_next_vibe(cur)
+    assert cur is songs[0]
+    assert {s.id for s in seen} == {s.id for s in songs}
+
+    # prev menyusuri urutan yang sama secara terbalik
+    back = [seen[0]]
+    cur = seen[0]
+    for _ in range(len(songs) - 1):
+        cur = mll.get_prev_vibe(cur)
+        back.append(cur)
+    assert back[1:] == seen[:0:-1]
+
+
+def test_scheduler_shift_vibe():
+    mll, songs = make_grid({"start": (2, 2), "happy": (8, 2), "hype": (2, 8)})
+    playlist = DoubleLinkedList(index_by_id=True)
+    for s in songs.values():
+        playlist.add_last(s)
+    playlist.current = playlist.head
+    scheduler = PlaybackScheduler(Queue(), playlist, vibe_neighbor=mll.get_neighbor)
+
+    assert scheduler.shift_vibe("energy", 1) is songs["hype"]
+    assert scheduler.current() is songs["hype"]
+    assert scheduler.shift_vibe("energy", 1) is None
+    assert scheduler.current() is songs["hype"]
+    assert scheduler.shift_vibe("mood", 1) is songs["happy"]
@@ -0,0 +1,120 @@
+# tests/test_playback_scheduler.py
+from controllers.playback_scheduler import MODE_HOME, MODE_PLAYLIST, PlaybackScheduler
+from structures.double_linked_list import DoubleLinkedList
+from structures.queue import Queue
+from structures.song import Song
+
+
+def make_songs(n):
+    return [Song(f"Lagu {i}", f"Artis {i}", "Pop", "Happy", song_id=f"s{i}") for i in range(n)]
+
+
+def make_scheduler(songs, vibe_next=None, vibe_prev=None, mode=MODE_HOME):
+    playlist = DoubleLinkedList(index_by_id=True)
+    for s in songs:
+        playlist.add_last(s)
+    playlist.current = playlist.head
+    calls = []
+    scheduler = PlaybackScheduler(
+        Queue(), playlist, vibe_next=vibe_next, vibe_prev=vibe_prev,
+        on_queue_changed=lambda: calls.append("queue"),
+    )
+    scheduler.mode = mode
+    return scheduler, calls
+
+
+def test_queue_before_vibe_and_dll():
+    songs = make_songs(4)
+    scheduler, calls = make_scheduler(songs[:3], vibe_next=lambda song: songs[2])
+    queued = songs[3]
+    scheduler.queue.enqueue(queued)
+
+    assert scheduler.peek_next() is queued
+    assert scheduler.advance() is queued
+    assert scheduler.current() is queued
+    assert scheduler.queue.is_empty()
+    assert calls == ["queue"]
+
+
+def test_home_mode_uses_vibe_neighbour():
+    songs = make_songs(3)
+    scheduler, _ = make_scheduler(songs, vibe_next=lambda song: songs[2], mode=MODE_HOME)
+
+    assert scheduler.peek_next() is songs[2]
+    assert scheduler.advance() is songs[2]
+    assert scheduler.current() is songs[2]
+
+
+def test_home_mode_falls_back_to_dll_without_vibe_neighbour():
+    songs = make_songs(3)
+    scheduler, _ = make_scheduler(songs, vibe_next=lambda song: None, mode=MODE_HOME)
+
+    assert scheduler.advance() is songs[1]
+
+
+def test_playlist_mode_skips_vibe():
+    songs = make_songs(3)
+    scheduler, _ = make_scheduler(songs, vibe_next=lambda song: songs[2],
+                                  vibe_prev=lambda song: songs[2], mode=MODE_PLAYLIST)
+
+    assert scheduler.peek_next() is songs[1]
+    assert scheduler.advance() is songs[1]
+    assert scheduler.prev() is songs[0]
+
+
+def test_peek_next_has_no_side_effects():
+    songs = make_songs(3)
+    scheduler, calls = make_scheduler(songs, vibe_next=lambda song: songs[2])
+    scheduler.queue.enqueue(songs[1])
+
+    for _ in range(3):
+        assert scheduler.peek_next() is songs[1]
+    assert scheduler.queue.size() == 1
+    assert scheduler.current() is songs[0]
+    assert calls == []
+
+    scheduler.queue.dequeue()
+    assert scheduler.peek_next() is songs[2]
+    assert scheduler.current() is songs[0]
+
+
+def test_dll_wraps_around():
+    songs = make_songs(3)
+    scheduler, _ = make_scheduler(songs, mode=MODE_PLAYLIST)
+    scheduler.playlist.current = scheduler.playlist.tail
+
+    assert scheduler.peek_next() is songs[0]
+    assert scheduler.advance() is songs[0]
+    assert scheduler.prev() is songs[2]
+
+
+def test_upcoming_listener_gets_prediction_on_mode_change():
+    songs = make_songs(3)
+    scheduler, _ = make_scheduler(songs, vibe_next=lambda song: songs[2], mode=MODE_HOME)
+    seen = []
+    scheduler.subscribe_upcoming(seen.append)
+
+    scheduler.set_mode(MODE_PLAYLIST)
+    scheduler.set_mode(MODE_PLAYLIST)
+    scheduler.set_mode(MODE_HOME)
+
+    assert seen == [songs[1], songs[2]]
+
+
+def test_queue_listener_sees_new_current_song():
+    songs = make_songs(4)
+    playlist = DoubleLinkedList(index_by_id=True)
+    for s in songs[:3]:
+        playlist.add_last(s)
+    playlist.current = playlist.head
+    seen = []
+    scheduler = PlaybackScheduler(
+        Queue(), playlist, on_queue_changed=lambda: scheduler.refresh_upcoming(),
+    )
+    scheduler.mode = MODE_PLAYLIST
+    scheduler.subscribe_upcoming(lambda song: seen.append((scheduler.current(), song)))
+    scheduler.queue.enqueue(songs[1])
+
+    assert scheduler.advance() is songs[1]
+    # preload dihitung dari lagu hasil dequeue, bukan lagu sebelumnya
+    assert seen == [(songs[1], songs[2])]
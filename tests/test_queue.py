@@ -0,0 +1,53 @@
+# tests/test_queue.py
+from structures.queue import Queue
+from structures.song import Song
+
+
+def make_songs(n):
+    return [Song(f"Lagu {i}", "Artis", "Pop", "Happy", song_id=f"s{i}") for i in range(n)]
+
+
+def test_fifo_and_iteration_without_draining():
+    songs = make_songs(3)
+    queue = Queue()
+    queue.enqueue_many(songs)
+
+    assert list(queue) == songs
+    assert len(queue) == queue.size() == 3
+    assert queue.peek() is songs[0]
+    assert queue.dequeue() is songs[0]
+    assert queue.to_list() == songs[1:]
+    assert queue.dequeue() is songs[1]
+    assert queue.dequeue() is songs[2]
+    assert queue.dequeue() is None and queue.peek() is None
+    assert queue.is_empty()
+
+
+def test_remove_by_id_keeps_order():
+    a, b, c = make_songs(3)
+    queue = Queue()
+    for s in (a, b, a, c, a):
+        queue.enqueue(s)
+
+    assert queue.remove_by_id("s0")
+    assert list(queue) == [b, a, c, a]
+    assert queue.remove(c)
+    assert queue.remove_all_by_id("s0") == 2
+    assert list(queue) == [b]
+    assert not queue.contains_id("s0") and queue.contains_id("s1")
+    assert not queue.remove_by_id("tidak-ada")
+
+
+def test_reorder_replaces_contents():
+    songs = make_songs(4)
+    queue = Queue()
+    queue.enqueue_many(songs)
+
+    queue.reorder(songs[::-1])
+    assert list(queue) == songs[::-1]
+    assert queue.dequeue() is songs[3]
+    assert queue.remove_by_id("s0")
+    assert list(queue) == [songs[2], songs[1]]
+
+    queue.clear()
+    assert queue.is_empty() and len(queue) == 0
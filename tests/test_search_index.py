@@ -0,0 +1,87 @@
+# tests/test_search_index.py
+import random
+
+from structures.search_index import SearchIndex
+from structures.single_linked_list import SingleLinkedList
+from structures.song import Song
+
+WORDS = ["cinta", "hujan", "malam", "pop", "rock", "jazz", "Sad", "happy",
+         "Tulus", "Raisa", "lagu", "rindu", "aku", "kamu", "dia", "é"]
+
+
+def random_song(rng, i):
+    def text():
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))
+    return Song(text(), text(), rng.choice(WORDS), rng.choice(WORDS), song_id=f"s{i}")
+
+
+def linear_search(songs, keyword):
+    """Pencarian lama: salin ke SLL lalu scan linear."""
+    sll = SingleLinkedList()
+    for song in songs:
+        sll.add_last(song)
+    return sll.search(keyword)
+
+
+def keywords(rng, songs):
+    out = ["", " ", "a", "ku", "xyz", "CINTA", " malam ", "in", "u r"]
+    for song in rng.sample(songs, 10):
+        text = rng.choice((song.judul, song.artis, song.genre, song.vibes)).lower()
+        i = rng.randrange(len(text))
+        out.append(text[i:i + rng.randint(1, 6)])
+    return out
+
+
+def test_matches_linear_scan():
+    rng = random.Random(1)
+    songs = [random_song(rng, i) for i in range(300)]
+    index = SearchIndex()
+    index.add_many(songs)
+
+    for keyword in keywords(rng, songs):
+        assert index.search(keyword) == linear_search(songs, keyword), keyword
+
+
+def test_incremental_add_update_remove_match_linear_scan():
+    rng = random.Random(2)
+    songs = [random_song(rng, i) for i in range(100)]
+    index = SearchIndex()
+    for song in songs:
+        index.add(song)
+
+    for step in range(200):
+        op = rng.random()
+        if op < 0.3 and songs:
+            song = songs.pop(rng.randrange(len(songs)))
+            assert index.remove(song.id)
+        elif op < 0.7 and songs:
+            song = rng.choice(songs)
+            fresh = random_song(rng, 0)
+            song.judul, song.artis = fresh.judul, fresh.artis
+            index.update(song)
+        else:
+            song = random_song(rng, 1000 + step)
+            songs.append(song)
+            index.add(song)
+
+        if step % 20 == 0:
+            for keyword in keywords(rng, songs):
+                assert index.search(keyword) == linear_search(songs, keyword), keyword
+
+    # posting list tidak menyimpan id lagu yang sudah dihapus / gram kosong
+    live = {song.id for song in songs}
+    for ids in index.postings.values():
+        assert ids and ids <= live
+
+
+def test_update_keeps_catalog_order():
+    songs = [Song(f"Lagu {i}", "Artis", "Pop", "Happy", song_id=f"s{i}") for i in range(3)]
+    index = SearchIndex()
+    index.add_many(songs)
+
+    songs[0].judul = "Judul baru"
+    index.update(songs[0])
+    assert index.search("") == songs
+    assert index.search("artis") == songs
+    assert index.search("baru") == [songs[0]]
+    assert not index.remove("tidak-ada")
@@ -0,0 +1,68 @@
+# tests/test_song_events.py
+from controllers.lagu_controller import SongController
+from controllers.song_events import SongChanges
+from structures.song import Song
+
+
+def song(i):
+    return Song(f"Lagu {i}", "Artis", "Pop", "Happy", song_id=f"s{i}")
+
+
+def changes(**kinds):
+    result = SongChanges()
+    for kind, songs in kinds.items():
+        for s in songs:
+            getattr(result, kind)(s)
+    return result
+
+
+def test_merge_coalesces_per_song():
+    a, b, c, d = (song(i) for i in range(4))
+    merged = SongChanges()
+    merged.merge(changes(add=[a, b], update=[c, d]))
+    merged.merge(changes(update=[a], remove=[b, c]))
+
+    assert list(merged.added) == ["s0"]        # ditambah lalu diedit: tetap added
+    assert list(merged.updated) == ["s3"]
+    assert list(merged.removed) == ["s2"]      # diedit lalu dihapus: removed
+    assert "s1" not in merged.removed          # ditambah lalu dihapus: hilang
+    assert merged.kind == "batch"
+
+
+def test_removed_then_added_again_is_added():
+    a = song(0)
+    merged = changes(remove=[a]).merge(changes(add=[a]))
+    assert merged.kind == "added" and not merged.removed
+
+
+def test_kind_and_truthiness():
+    assert not SongChanges()
+    assert changes(update=[song(0)]).kind == "updated"
+    single = changes(add=[song(0)])
+    single.batch = True
+    assert single.kind == "batch"
+
+
+def test_controller_batch_emits_once():
+    songs = [song(i) for i in range(3)]
+    controller = SongController(songs=songs)
+    controller.wait_until_ready(5)
+    events = []
+    controller.subscribe(events.append)
+
+    with controller.batch():
+        controller.update_song("s0", "Baru", "Artis", "Pop", "Sad")
+        controller.delete_song_by_id("s1")
+        extra = song(9)
+        controller.add_song(extra)
+        controller.update_song("s9", "Diedit", "Artis", "Pop", "Happy")
+        assert events == []
+
+    assert len(events) == 1
+    event = events[0]
+    assert event.batch and list(event.updated) == ["s0"]
+    assert list(event.removed) == ["s1"] and list(event.added) == ["s9"]
+
+    controller.unsubscribe(events.append)
+    controller.delete_song_by_id("s0")
+    assert len(events) == 1
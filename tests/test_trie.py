@@ -0,0 +1,67 @@
+# tests/test_trie.py
+import random
+
+from structures.trie import Trie
+
+
+def brute_complete(counts, display, prefix, limit):
+    key = Trie.normalize(prefix)
+    if not key:
+        return []
+    words = sorted((k for k, c in counts.items() if c > 0 and k.startswith(key)),
+                   key=lambda k: (-counts[k], k))
+    return [display[k] for k in words[:limit]]
+
+
+def test_complete_orders_by_count_then_alphabet():
+    trie = Trie()
+    for text, count in (("Pop", 5), ("Pop Rock", 2), ("Power", 2), ("Jazz", 9)):
+        trie.insert(text, count)
+
+    assert trie.complete("po") == ["Pop", "Pop Rock", "Power"]
+    assert trie.complete("PO", limit=1) == ["Pop"]
+    assert trie.complete("j") == ["Jazz"]
+    assert trie.complete("x") == []
+    assert trie.complete("") == []
+    assert "pop  rock" in trie
+
+
+def test_top_k_matches_brute_force():
+    rng = random.Random(4)
+    letters = "abc "
+    trie = Trie()
+    counts, display = {}, {}
+
+    for step in range(2000):
+        text = "".join(rng.choice(letters) for _ in range(rng.randint(1, 5)))
+        key = Trie.normalize(text)
+        if not key:
+            continue
+        if counts.get(key) and rng.random() < 0.4:
+            assert trie.remove(text.upper())
+            counts[key] -= 1
+        else:
+            if not counts.get(key):
+                display[key] = " ".join(text.split())
+            trie.insert(text)
+            counts[key] = counts.get(key, 0) + 1
+
+        if step % 50 == 0:
+            for prefix in ("a", "b", "ab", "c a", "abc", "ba"):
+                for limit in (1, 3, 8):
+                    assert trie.complete(prefix, limit) == \
+                        brute_complete(counts, display, prefix, limit), (prefix, limit)
+
+
+def test_remove_prunes_nodes_and_best():
+    trie = Trie()
+    trie.insert("abc", 3)
+    trie.insert("abd", 1)
+    for _ in range(3):
+        assert trie.remove("abc")
+
+    assert not trie.remove("abc")
+    assert "abc" not in trie
+    assert "c" not in trie.root.children["a"].children["b"].children
+    assert trie.root.best == 1
+    assert trie.complete("ab") == ["abd"]
@@ -0,0 +1,108 @@
+# tests/test_user_state_store.py
+import random
+
+from controllers.user_state_store import UserStateStore
+
+
+def reopen(store, folder):
+    store.close()
+    fresh = UserStateStore(folder)
+    return fresh, fresh.load()
+
+
+def test_state_survives_reopen(tmp_path):
+    store = UserStateStore(str(tmp_path))
+    store.load()
+    store.save_playlist("Pagi", ["s1", "s2", "s1"], "cover.png")
+    store.save_playlist("Malam", [])
+    store.set_favorite("s3", True)
+    store.set_favorite("s1", True)
+    store.set_favorite("s3", False)
+    store.save_queue(["s2", "s4"])
+    store.save_queue(["s4"])
+
+    store, state = reopen(store, str(tmp_path))
+    assert state == {
+        "playlists": [("Pagi", "cover.png", ["s1", "s2", "s1"]), ("Malam", None, [])],
+        "favorites": ["s1"],
+        "queue": ["s4"],
+    }
+    store.close()
+
+
+def test_rename_keeps_position_flushed_or_not(tmp_path):
+    store = UserStateStore(str(tmp_path))
+    store.load()
+    for name in ("A", "B", "C"):
+        store.save_playlist(name, [name.lower()])
+    store.flush()
+
+    # sudah ditulis: UPDATE di tempat
+    store.rename_playlist("A", "A2")
+    store.flush()
+    # belum ditulis: rantai rename + edit sebelum flush
+    store.rename_playlist("B", "B2")
+    store.save_playlist("B2", ["x", "y"])
+    store.rename_playlist("B2", "B3")
+
+    store, state = reopen(store, str(tmp_path))
+    assert state["playlists"] == [("A2", None, ["a"]), ("B3", None, ["x", "y"]), ("C", None, ["c"])]
+    store.close()
+
+
+def test_delete_and_recreate_before_flush(tmp_path):
+    store = UserStateStore(str(tmp_path))
+    store.load()
+    store.save_playlist("A", ["a"])
+    store.save_playlist("B", ["b"])
+    store.flush()
+
+    store.delete_playlist("A")
+    store.rename_playlist("B", "A")     # nama bekas playlist yang dihapus
+    store.save_playlist("B", ["baru"])
+
+    store, state = reopen(store, str(tmp_path))
+    assert state["playlists"] == [("A", None, ["b"]), ("B", None, ["baru"])]
+    store.close()
+
+
+def test_random_operations_match_model(tmp_path):
+    rng = random.Random(7)
+    folder = str(tmp_path)
+    store = UserStateStore(folder)
+    store.load()
+    model = {}        # nama -> [posisi, cover, ids]
+    next_position = 0
+
+    for step in range(300):
+        op = rng.random()
+        names = list(model)
+        if op < 0.4 or not names:
+            name = rng.choice(names + [f"p{step}"])
+            ids = [f"s{rng.randint(0, 9)}" for _ in range(rng.randint(0, 4))]
+            cover = rng.choice((None, "c.png"))
+            if name not in model:
+                model[name] = [next_position, None, None]
+                next_position += 1
+            model[name][1:] = [cover, ids]
+            store.save_playlist(name, ids, cover)
+        elif op < 0.7:
+            old = rng.choice(names)
+            new = f"r{step}"
+            model[new] = model.pop(old)
+            store.rename_playlist(old, new)
+        elif op < 0.85:
+            name = rng.choice(names)
+            del model[name]
+            store.delete_playlist(name)
+        elif op < 0.95:
+            store.flush()
+        else:
+            store, _ = reopen(store, folder)
+            next_position = store._next_position
+
+    store, state = reopen(store, folder)
+    expected = [(name, cover, ids) for name, (_, cover, ids)
+                in sorted(model.items(), key=lambda item: item[1][0])]
+    assert state["playlists"] == expected
+    store.close()